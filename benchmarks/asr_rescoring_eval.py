@@ -0,0 +1,137 @@
+"""
+Offline n-best rescoring evaluation for LYRA
+Whisper isn't needed: every corpus utterance gets synthetic n-best lists
+with one-character ASR slips ("open calculater") in the entity or longest
+word, scored like Whisper's avg_logprob.
+
+    near miss - a slip is the top hypothesis, the real utterance second
+    clean     - the real utterance is on top, slips below it
+
+Reports how often the chosen transcript yields the labelled intent (and
+app name - free-text slots like note bodies can't be judged by a grammar)
+with Whisper's order alone (top-1) and with HypothesisRescorer, and how
+long rescoring takes per list.
+
+Usage:
+    python -m benchmarks.asr_rescoring_eval
+    python -m benchmarks.asr_rescoring_eval --acoustic-weight 0.7 --intent-weight 0.3 --errors
+"""
+
+import time
+import random
+import argparse
+
+from benchmarks.nlu_eval import DEFAULT_CORPUS, load_corpus, entities_match
+from core.command_processor import CommandProcessor
+from core.asr_rescorer import Hypothesis, HypothesisRescorer
+from config import APP_PATHS, ASR_ACOUSTIC_WEIGHT, ASR_INTENT_WEIGHT
+
+VOWELS = 'aeiou'
+
+# avg_logprob of the hypotheses, best first (typical of Whisper base on short commands)
+LOGPROBS = (-0.35, -0.55, -0.8)
+
+# Slots with a known vocabulary (the rescorer's slot_vocabulary)
+CLOSED_SLOTS = {'app_name': APP_PATHS}
+
+
+def slip(word, rng):
+    """One ASR-like character error: a swapped vowel, a dropped or a doubled letter"""
+    if len(word) < 3:
+        return word
+    positions = [i for i, ch in enumerate(word) if ch in VOWELS]
+    if positions and rng.random() < 0.6:
+        i = rng.choice(positions)
+        return word[:i] + rng.choice(VOWELS.replace(word[i], '')) + word[i + 1:]
+    i = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:i] + word[i + 1:]
+    return word[:i] + word[i] + word[i:]
+
+
+def near_misses(row, count, rng):
+    """Distinct slips of the utterance, in its entity word if it has one"""
+    text = row['utterance']
+    words = text.split()
+    entity_words = [value for value in (row.get('entities') or {}).values()
+                    if isinstance(value, str) and value in words]
+    target = words.index(entity_words[0]) if entity_words else max(range(len(words)), key=lambda i: len(words[i]))
+
+    variants = []
+    for _ in range(count * 10):
+        changed = words[:]
+        changed[target] = slip(words[target], rng)
+        variant = ' '.join(changed)
+        if variant != text and variant not in variants:
+            variants.append(variant)
+        if len(variants) == count:
+            break
+    return variants
+
+
+def command_right(processor, row, text):
+    """The transcript yields the labelled intent and app name"""
+    result = processor.process_command(text)
+    expected = {slot: value for slot, value in (row.get('entities') or {}).items() if slot in CLOSED_SLOTS}
+    return result['intent'] == row['intent'] and entities_match(expected, result['entities'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate n-best ASR rescoring')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--acoustic-weight', type=float, default=ASR_ACOUSTIC_WEIGHT)
+    parser.add_argument('--intent-weight', type=float, default=ASR_INTENT_WEIGHT)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--errors', action='store_true', help='list utterances rescoring got wrong')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    processor = CommandProcessor()
+    rescorer = HypothesisRescorer(processor, slot_vocabulary=CLOSED_SLOTS,
+                                  acoustic_weight=args.acoustic_weight, intent_weight=args.intent_weight)
+
+    cases = {'near miss': [], 'clean': []}
+    for row in load_corpus(args.corpus):
+        slips = near_misses(row, 2, rng)
+        if len(slips) < 2:
+            continue
+        reference = row['utterance']
+        cases['near miss'].append((row, [slips[0], reference, slips[1]]))
+        cases['clean'].append((row, [reference] + slips))
+
+    print(f"\n📚 Corpus: {args.corpus} (weights: acoustic {args.acoustic_weight}, intent {args.intent_weight})")
+    print(f"\n{'case':>10} {'lists':>6} {'top-1':>7} {'rescored':>9} {'skipped':>8} {'µs/list':>8}")
+    wrong = []
+    for name, lists in cases.items():
+        top1 = rescored = skipped = 0
+        elapsed = 0.0
+        for row, texts in lists:
+            hypotheses = [Hypothesis(text, logprob) for text, logprob in zip(texts, LOGPROBS)]
+            top1 += command_right(processor, row, texts[0])
+
+            start = time.perf_counter()
+            if not rescorer.needs_alternatives(texts[0]):
+                best = hypotheses[0]  # What VoiceAssistant does: no n-best decode at all
+                skipped += 1
+            else:
+                best = rescorer.pick(hypotheses)
+            elapsed += time.perf_counter() - start
+
+            if command_right(processor, row, best.text):
+                rescored += 1
+            else:
+                wrong.append((name, row, best))
+
+        total = len(lists)
+        print(f"{name:>10} {total:>6} {top1 / total:>7.1%} {rescored / total:>9.1%} "
+              f"{skipped / total:>8.1%} {elapsed / total * 1e6:>8.1f}")
+
+    print("\n'skipped' = top hypothesis was already a clean command, so no alternatives were decoded")
+    if args.errors and wrong:
+        print(f"\n❌ {len(wrong)} lists where the chosen transcript gives the wrong command")
+        for name, row, best in wrong:
+            print(f"   [{name}] '{row['utterance']}' ({row['intent']}) -> {best!r}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Custom command trigger benchmark for LYRA
+Matching utterances against thousands of custom trigger phrases: the old
+first-substring-hit loop versus the per-user Aho-Corasick TriggerIndex
+(longest trigger wins)
+
+Usage:
+    python -m benchmarks.bench_custom_triggers
+    python -m benchmarks.bench_custom_triggers --triggers 1000 5000 20000 --utterances 2000
+"""
+
+import time
+import random
+import argparse
+
+from core.trigger_index import TriggerIndex
+
+VERBS = ["turn on", "turn off", "open", "start", "play", "show", "run", "launch", "stop", "check"]
+NOUNS = ["lights", "fan", "music", "backup", "project", "server", "report", "playlist", "heater",
+         "camera", "dashboard", "printer", "vpn", "timer", "news", "garage door"]
+FILLERS = ["please", "now", "hey lyra", "the", "can you", "quickly", "for me", "in the bedroom"]
+
+
+def synthetic_triggers(count, rng):
+    """Trigger phrases like 'turn on lights 42' plus their bare nouns (so substrings overlap)"""
+    triggers = set(NOUNS)
+    while len(triggers) < count:
+        triggers.add(f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {rng.randint(1, count)}")
+    return {trigger: {'command_id': i, 'trigger_phrase': trigger} for i, trigger in enumerate(sorted(triggers))}
+
+
+def synthetic_utterances(triggers, count, rng):
+    """Half contain a trigger, half are ordinary commands that match nothing"""
+    phrases = list(triggers)
+    utterances = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            utterances.append(f"{rng.choice(FILLERS)} {rng.choice(phrases)} {rng.choice(FILLERS)}")
+        else:
+            utterances.append(f"{rng.choice(FILLERS)} what is the weather like today {rng.choice(FILLERS)}")
+    return utterances
+
+
+def legacy_match(user_map, text):
+    """The previous match_custom_command loop"""
+    text_lower = text.lower()
+    for trigger, command in user_map.items():
+        if trigger.strip() and (trigger == text_lower or trigger in text_lower):
+            return command
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark custom command trigger matching')
+    parser.add_argument('--triggers', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--utterances', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"\n{'triggers':>9} {'build ms':>9} {'loop µs':>9} {'index µs':>9} {'speedup':>8} {'longer':>7}")
+    for count in args.triggers:
+        rng = random.Random(args.seed)
+        user_map = synthetic_triggers(count, rng)
+        utterances = synthetic_utterances(user_map, args.utterances, rng)
+
+        start = time.perf_counter()
+        index = TriggerIndex(user_map)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        old = [legacy_match(user_map, text) for text in utterances]
+        old_time = (time.perf_counter() - start) / len(utterances)
+
+        start = time.perf_counter()
+        new = [index.match(text.lower()) for text in utterances]
+        new_time = (time.perf_counter() - start) / len(utterances)
+
+        # Utterances where the loop returned a shorter trigger than the longest present
+        longer = sum(1 for a, b in zip(old, new)
+                     if a and b and len(b['trigger_phrase']) > len(a['trigger_phrase']))
+        assert all((a is None) == (b is None) for a, b in zip(old, new))
+
+        print(f"{count:>9,} {build * 1000:>9.1f} {old_time * 1e6:>9.1f} {new_time * 1e6:>9.1f} "
+              f"{old_time / new_time:>7.1f}x {longer / len(utterances):>7.1%}")
+
+    print("\n'longer' = utterances where the old loop picked a shorter trigger (e.g. 'lights' in 'turn on lights 7')")
+
+
+if __name__ == '__main__':
+    main()
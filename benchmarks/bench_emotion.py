@@ -0,0 +1,110 @@
+"""
+Emotion detection benchmark for LYRA
+Compares the old nested-loop substring scan (every phrase, then every
+keyword, in every language) with the compiled Aho-Corasick lexicon, on the
+NLU corpus and with the lexicon padded to simulate growth
+
+Usage:
+    python -m benchmarks.bench_emotion
+    python -m benchmarks.bench_emotion --repeat 200 --grow 2000
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+
+from benchmarks.nlu_eval import DEFAULT_CORPUS, load_corpus
+from config import EMOTION_LEXICON_PATH
+from core.emotion_analyzer import EmotionalAnalyzer
+
+# Extra emotional utterances (the NLU corpus is mostly commands)
+SAMPLES = [
+    "I'm so happy today", "feeling down", "this is not good", "i am okay", "ok open the book",
+    "download the report", "मैं खुश हूं", "आज बहुत परेशान हूं", "ನಾನು ತುಂಬಾ ಸಂತೋಷವಾಗಿದ್ದೇನೆ",
+    "ನನಗೆ ಬೇಸರವಾಗಿದೆ", "all good, thanks", "i'm upset and worried about the exam",
+]
+
+
+def legacy_detect(text, keywords, phrases):
+    """The previous EmotionalAnalyzer.detect_emotion"""
+    text_lower = text.lower().strip()
+
+    for emotion, lang_phrases in phrases.items():
+        for lang, items in lang_phrases.items():
+            for phrase in items:
+                if phrase in text_lower:
+                    return emotion
+
+    emotion_scores = {emotion: 0 for emotion in keywords}
+    for emotion, lang_keywords in keywords.items():
+        for lang, items in lang_keywords.items():
+            for keyword in items:
+                if keyword in text_lower:
+                    emotion_scores[emotion] += 1
+
+    max_emotion = max(emotion_scores, key=emotion_scores.get)
+    return max_emotion if emotion_scores[max_emotion] > 0 else 'neutral'
+
+
+def grown_lexicon(lexicon, extra, seed):
+    """Copy of the lexicon with `extra` made-up keywords spread over the emotions"""
+    rng = random.Random(seed)
+    grown = json.loads(json.dumps(lexicon))
+    emotions = list(grown['emotions'])
+    for i in range(extra):
+        word = ''.join(rng.choice('bcdfghjklmnpqrstvwxz') for _ in range(rng.randint(5, 9)))
+        grown['emotions'][emotions[i % len(emotions)]]['keywords']['en'].append(word)
+    return grown
+
+
+def measure(func, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark emotion detection')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--grow', type=int, default=1000, help='Extra keywords for the growth run')
+    args = parser.parse_args()
+
+    texts = [row['utterance'] for row in load_corpus(args.corpus)] + SAMPLES
+    with open(EMOTION_LEXICON_PATH, 'r', encoding='utf-8') as f:
+        lexicon = json.load(f)
+
+    print(f"\n📚 {len(texts)} utterances\n")
+    print(f"{'lexicon':>10} {'terms':>7} {'nested µs':>10} {'automaton µs':>13} {'speedup':>8}")
+
+    for label, data in (('shipped', lexicon), (f'+{args.grow}', grown_lexicon(lexicon, args.grow, 0))):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+            json.dump(data, f, ensure_ascii=False)
+        analyzer = EmotionalAnalyzer(f.name)
+        os.unlink(f.name)
+        keywords = {e: kinds['keywords'] for e, kinds in data['emotions'].items()}
+        phrases = {e: kinds['phrases'] for e, kinds in data['emotions'].items()}
+
+        old_time = measure(lambda text: legacy_detect(text, keywords, phrases), texts, args.repeat)
+        new_time = measure(analyzer.detect_emotion, texts, args.repeat)
+        print(f"{label:>10} {analyzer.automaton.size:>7} {old_time * 1e6:>10.1f} {new_time * 1e6:>13.1f} "
+              f"{old_time / new_time:>7.1f}x")
+
+    # Where the two disagree (whole-word matching and weighted phrases)
+    analyzer = EmotionalAnalyzer()
+    keywords = {e: kinds['keywords'] for e, kinds in lexicon['emotions'].items()}
+    phrases = {e: kinds['phrases'] for e, kinds in lexicon['emotions'].items()}
+    changed = [(text, legacy_detect(text, keywords, phrases), analyzer.detect_emotion(text)) for text in texts]
+    changed = [row for row in changed if row[1] != row[2]]
+    print(f"\n🔀 {len(changed)}/{len(texts)} utterances classified differently:")
+    for text, old, new in changed:
+        print(f"   {text!r}: {old} -> {new}")
+
+
+if __name__ == '__main__':
+    main()
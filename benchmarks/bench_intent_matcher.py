@@ -0,0 +1,118 @@
+"""
+Intent matcher benchmark for LYRA
+Compares the old per-pattern re.search loop with the precompiled IntentMatcher
+as the number of intents grows, and checks both give identical results
+
+Usage:
+    python -m benchmarks.bench_intent_matcher
+    python -m benchmarks.bench_intent_matcher --sizes 13 50 100 200 400 --repeat 200
+"""
+
+import re
+import time
+import argparse
+
+from core.command_processor import CommandProcessor
+from core.intent_matcher import IntentMatcher
+
+UTTERANCES = [
+    "open chrome",
+    "what time is it",
+    "remind me to call mom at 5 pm",
+    "send hello whatsapp to rahul",
+    "whatsapp good morning to amma",
+    "ಸಮಯ ಏನು",
+    "ತೆರೆ calculator",
+    "समय क्या है",
+    "मुझे याद दिलाओ दवा लेना",
+    "tell me a joke",
+    "what's the weather in mysore",
+    "email priya about the meeting",
+    "this sentence matches nothing at all",
+    "samaya enu",
+]
+
+
+def synthetic_intents(count):
+    """Extra intents shaped like the real ones (a few verb + object patterns each)"""
+    intents = {}
+    for k in range(count):
+        intents[f"synthetic_{k}"] = {
+            "patterns": [
+                rf"do task{k} with (.+)",
+                rf"perform action{k} on (.+) at (.+)",
+                rf"action{k} (.+)",
+            ],
+            "keywords": [f"task{k}", f"action{k}"],
+        }
+    return intents
+
+
+def scale_intents(base, size):
+    """Real intents plus synthetic ones; synthetic intents go first so real matches are found late"""
+    extra = max(0, size - len(base))
+    intents = synthetic_intents(extra)
+    intents.update(base)
+    return intents
+
+
+def loop_match(intents, text):
+    """The original detect_intent pattern loop"""
+    for intent_name, intent_data in intents.items():
+        for pattern in intent_data["patterns"]:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                return intent_name, match.groups()
+    return None
+
+
+def matcher_match(matcher, text):
+    result = matcher.match(text)
+    return (result[0], result[1]) if result else None
+
+
+def time_per_utterance(func, utterances, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in utterances:
+            func(text)
+    return (time.perf_counter() - start) / (repeat * len(utterances))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark precompiled intent matching')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[13, 50, 100, 200, 400])
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    base = CommandProcessor().load_intents()
+    utterances = [text.lower() for text in UTTERANCES]
+
+    print(f"\n{'intents':>8} {'patterns':>9} {'loop µs':>10} {'matcher µs':>11} {'speedup':>8} {'searches':>9}")
+    for size in args.sizes:
+        intents = scale_intents(base, size)
+        patterns = sum(len(data["patterns"]) for data in intents.values())
+
+        start = time.perf_counter()
+        matcher = IntentMatcher(intents)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        for text in utterances:
+            expected = loop_match(intents, text)
+            actual = matcher_match(matcher, text)
+            assert expected == actual, f"Mismatch for '{text}': loop={expected} matcher={actual}"
+
+        loop_time = time_per_utterance(lambda t: loop_match(intents, t), utterances, args.repeat)
+        matcher.searches = 0
+        matcher_time = time_per_utterance(lambda t: matcher_match(matcher, t), utterances, args.repeat)
+        searches = matcher.searches / (args.repeat * len(utterances))
+
+        print(f"{len(intents):>8} {patterns:>9} {loop_time * 1e6:>10.1f} {matcher_time * 1e6:>11.1f} "
+              f"{loop_time / matcher_time:>7.1f}x {searches:>9.1f}   (compile {compile_ms:.1f} ms)")
+
+    print("\n'searches' = regex searches run per utterance by the matcher")
+    print("✅ Matcher agrees with the pattern loop on all utterances")
+
+
+if __name__ == '__main__':
+    main()
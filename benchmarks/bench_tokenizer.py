@@ -0,0 +1,84 @@
+"""
+Tokenizer benchmark for LYRA
+Startup: importing NLTK and loading its stop words (what CommandProcessor
+used to do in __init__) versus the built-in regex tokenizer, each measured
+in a fresh interpreter. Per utterance: the word_tokenize + stop-word pass
+detect_intent used to run (and never used) versus the regex tokenizer.
+
+Usage:
+    python -m benchmarks.bench_tokenizer
+    python -m benchmarks.bench_tokenizer --repeat 200 --startup-runs 5
+"""
+
+import sys
+import time
+import argparse
+import subprocess
+
+from benchmarks.nlu_eval import DEFAULT_CORPUS, load_corpus
+from core.tokenizer import Tokenizer
+
+IMPORTANT_WORDS = {'open', 'close', 'send', 'read', 'create', 'find'}
+
+STARTUP_SNIPPETS = {
+    'nltk': ("from nltk.tokenize import word_tokenize\n"
+             "from nltk.corpus import stopwords\n"
+             "set(stopwords.words('english'))\n"
+             "word_tokenize('warm up')"),
+    'regex': "from core.tokenizer import Tokenizer\nTokenizer('regex').tokenize('warm up')",
+}
+
+
+def startup_seconds(snippet, runs):
+    """Best-of-N wall time of the snippet in a fresh interpreter (None if it fails)"""
+    timer = f"import time\n_t = time.perf_counter()\n{snippet}\nprint(time.perf_counter() - _t)"
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', timer], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        seconds = float(result.stdout.strip().splitlines()[-1])
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def per_utterance_seconds(tokenizer, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            tokenizer.content_tokens(text.lower().strip(), keep=IMPORTANT_WORDS)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark NLU tokenisation')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--startup-runs', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = [row['utterance'] for row in load_corpus(args.corpus)]
+
+    print("\n🚀 Startup (fresh interpreter, best of "
+          f"{args.startup_runs})")
+    for name, snippet in STARTUP_SNIPPETS.items():
+        seconds = startup_seconds(snippet, args.startup_runs)
+        print(f"   {name:>6}: " + (f"{seconds * 1000:8.1f} ms" if seconds is not None
+                                   else "unavailable (NLTK or its data not installed)"))
+
+    print(f"\n⏱️ Per utterance ({len(texts)} utterances x {args.repeat})")
+    for name in ('nltk', 'regex'):
+        tokenizer = Tokenizer(name)
+        if name == 'nltk' and not tokenizer.nltk_available:
+            print(f"   {name:>6}: unavailable")
+            continue
+        seconds = per_utterance_seconds(tokenizer, texts, args.repeat)
+        print(f"   {name:>6}: {seconds * 1e6:8.1f} µs")
+
+    print("\ndetect_intent no longer tokenises at all, so the whole per-utterance figure")
+    print("of the old backend (NLTK when installed) is saved on every command;")
+    print("CommandProcessor() no longer pays the NLTK startup cost either.")
+
+
+if __name__ == '__main__':
+    main()
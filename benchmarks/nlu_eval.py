@@ -0,0 +1,161 @@
+"""
+Offline NLU evaluation for LYRA
+Runs a labelled corpus through CommandProcessor.process_commands and reports
+intent accuracy (overall and per language), entity accuracy, a confusion
+matrix and throughput, cold and with the NLU cache warm
+
+Corpus rows (JSONL):
+    {"utterance": "open chrome", "language": "en", "intent": "open_app", "entities": {"app_name": "chrome"}}
+
+Expected entities are checked as a subset: every listed key must be present
+with the same value (case-insensitive); extra entities are fine.
+
+With --lexicon, Hindi/Kannada rows the offline CommandLexicon covers are
+rewritten to English first, as VoiceAssistant's translation stage does, so
+the rewrite has to keep every entity in its slot. Native-script entity
+labels that the lexicon glosses (कैलकुलेटर -> calculator) show up as
+entity errors in this mode.
+
+Usage:
+    python -m benchmarks.nlu_eval
+    python -m benchmarks.nlu_eval --corpus data/nlu_corpus.jsonl --repeat 20 --errors
+    python -m benchmarks.nlu_eval --min-accuracy 0.9   # non-zero exit below this
+    python -m benchmarks.nlu_eval --lexicon --errors   # through the offline lexicon
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from collections import Counter, defaultdict
+
+from core.command_processor import CommandProcessor
+from core.command_lexicon import CommandLexicon
+from core.multilingual_processor import MultilingualTextProcessor
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'data', 'nlu_corpus.jsonl')
+
+
+def load_corpus(path):
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                rows.append(json.loads(line))
+    return rows
+
+
+def entities_match(expected, actual):
+    for key, value in expected.items():
+        got = actual.get(key)
+        if got is None or str(got).strip().casefold() != str(value).strip().casefold():
+            return False
+    return True
+
+
+def throughput(processor, texts, repeat, use_cache):
+    """Utterances per second over `repeat` passes of the corpus"""
+    if use_cache:
+        processor.process_commands(texts)  # fill the cache first
+    start = time.perf_counter()
+    for _ in range(repeat):
+        processor.process_commands(texts, use_cache=use_cache)
+    elapsed = time.perf_counter() - start
+    return repeat * len(texts) / elapsed if elapsed else float('inf')
+
+
+def print_confusion(pairs):
+    """Rows are expected intents, columns predicted; only intents that occur are shown"""
+    labels = sorted({label for pair in pairs for label in pair})
+    counts = Counter(pairs)
+    short = {label: label[:9] for label in labels}
+
+    width = max(len(label) for label in labels)
+    print("\n🔀 Confusion matrix (rows = expected, columns = predicted)\n")
+    print(' ' * width + ' ' + ' '.join(f"{short[label]:>9}" for label in labels))
+    for expected in labels:
+        cells = []
+        for predicted in labels:
+            count = counts.get((expected, predicted), 0)
+            cells.append(f"{count if count else '.':>9}")
+        print(f"{expected:<{width}} " + ' '.join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate CommandProcessor on a labelled corpus')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=10, help='passes for the throughput measurement')
+    parser.add_argument('--errors', action='store_true', help='list every misclassified utterance')
+    parser.add_argument('--min-accuracy', type=float, default=None,
+                        help='exit with status 1 if intent accuracy is below this (0-1)')
+    parser.add_argument('--lexicon', action='store_true',
+                        help='rewrite hi/kn rows through the offline CommandLexicon first')
+    args = parser.parse_args()
+
+    rows = load_corpus(args.corpus)
+    texts = [row['utterance'] for row in rows]
+    processor = CommandProcessor()
+
+    if args.lexicon:
+        lexicon = CommandLexicon(processor, MultilingualTextProcessor())
+        texts = [(lexicon.translate(text, row.get('language')) or text) if row.get('language') in ('hi', 'kn')
+                 else text for text, row in zip(texts, rows)]
+        print(f"📖 Lexicon rewrote {lexicon.hits} of {lexicon.hits + lexicon.misses} hi/kn rows")
+
+    results = processor.process_commands(texts, use_cache=False)
+
+    pairs = []
+    by_language = defaultdict(lambda: [0, 0])
+    entity_total = entity_correct = 0
+    errors = []
+    for row, result in zip(rows, results):
+        expected, predicted = row['intent'], result['intent']
+        pairs.append((expected, predicted))
+        correct = expected == predicted
+        stats = by_language[row.get('language', '?')]
+        stats[0] += correct
+        stats[1] += 1
+
+        expected_entities = row.get('entities') or {}
+        entities_ok = True
+        if expected_entities:
+            entity_total += 1
+            entities_ok = correct and entities_match(expected_entities, result['entities'])
+            entity_correct += entities_ok
+
+        if not correct or not entities_ok:
+            errors.append((row, result))
+
+    correct_total = sum(stats[0] for stats in by_language.values())
+    accuracy = correct_total / len(rows) if rows else 0.0
+
+    print(f"\n📚 Corpus: {args.corpus} ({len(rows)} utterances)")
+    print(f"🎯 Intent accuracy: {accuracy:.1%} ({correct_total}/{len(rows)})")
+    for language, (correct, total) in sorted(by_language.items()):
+        print(f"   {language:8s} {correct / total:6.1%} ({correct}/{total})")
+    if entity_total:
+        print(f"🏷️ Entity accuracy: {entity_correct / entity_total:.1%} ({entity_correct}/{entity_total} rows with entities)")
+
+    print_confusion(pairs)
+
+    if args.errors and errors:
+        print(f"\n❌ {len(errors)} errors")
+        for row, result in errors:
+            print(f"   [{row.get('language', '?')}] '{row['utterance']}': expected {row['intent']} "
+                  f"{row.get('entities') or ''}, got {result['intent']} {result['entities']}")
+
+    cold = throughput(processor, texts, args.repeat, use_cache=False)
+    warm = throughput(processor, texts, args.repeat, use_cache=True)
+    classifier = 'on' if processor.classifier.is_ready() else 'off'
+    print(f"\n⚡ Throughput (classifier {classifier}): {cold:,.0f} utt/s cold, {warm:,.0f} utt/s with NLU cache")
+
+    if args.min_accuracy is not None and accuracy < args.min_accuracy:
+        print(f"❌ Accuracy {accuracy:.1%} is below the required {args.min_accuracy:.1%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Translation load test for LYRA
+Drives TranslationEngine against the local stand-in server so caching,
+retries, batching and the circuit breaker can be measured offline
+
+Usage:
+    python -m benchmarks.translation_load_test
+    python -m benchmarks.translation_load_test --latency 0.2 --error-rate 0.2 --utterances 500
+"""
+
+import time
+import random
+import argparse
+import statistics
+
+from benchmarks.translation_server import start_server, server_url
+from core.translation_backends import HTTPTranslationBackend
+from core.translation_cache import TranslationCache
+from core.translation_engine import TranslationEngine
+
+COMMANDS = [
+    ('kn', 'ಸಮಯ ಏನು'), ('kn', 'ಇಂದಿನ ದಿನಾಂಕ'), ('kn', 'ಸುದ್ದಿ ಏನು'),
+    ('kn', 'ಜೋಕ್ ಹೇಳು'), ('kn', 'ಕ್ಯಾಲ್ಕುಲೇಟರ್ ತೆರೆ'),
+    ('hi', 'समय क्या है'), ('hi', 'आज की तारीख'), ('hi', 'समाचार सुनाओ'),
+    ('hi', 'जोक सुनाओ'), ('hi', 'कैलकुलेटर खोलो'),
+]
+
+HEADLINES = [f"Headline number {i} about something that happened today" for i in range(1, 6)]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_engine(url, timeout, retry_delay):
+    engine = TranslationEngine(cache=TranslationCache(db_path=None), backend=HTTPTranslationBackend(url))
+    engine.timeout = timeout
+    engine.retry_delay = retry_delay
+    return engine
+
+
+def server_stats(server):
+    return dict(server.state.stats())
+
+
+def run_repeated_commands(server, args):
+    """Zipf-like stream of short commands: most repeats should be cache hits"""
+    server.state.reset()
+    engine = make_engine(server_url(server), args.timeout, args.retry_delay)
+    rng = random.Random(args.seed)
+    weights = [1 / (rank + 1) for rank in range(len(COMMANDS))]
+
+    latencies = []
+    for _ in range(args.utterances):
+        language, text = rng.choices(COMMANDS, weights=weights)[0]
+        start = time.perf_counter()
+        engine.translate(text, language, 'en')
+        latencies.append(time.perf_counter() - start)
+
+    stats = server_stats(server)
+    cache = engine.get_cache_stats()
+    print("\n📊 Repeated commands")
+    print(f"   utterances:      {args.utterances}")
+    print(f"   server requests: {stats['requests']} ({stats['errors']} injected errors)")
+    print(f"   cache hit rate:  {cache['hit_rate']:.1%}")
+    print(f"   latency p50:     {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"   latency p95:     {percentile(latencies, 95) * 1000:.2f} ms")
+    print(f"   latency max:     {max(latencies) * 1000:.2f} ms")
+    print(f"   backend health:  {engine.get_backend_health()['state']}")
+
+
+def run_batching(server, args):
+    """Five headlines: one call per string vs translate_many"""
+    print("\n📊 Batching (5 headlines, en -> hi)")
+    for label, batched in (('individual', False), ('translate_many', True)):
+        server.state.reset()
+        engine = make_engine(server_url(server), args.timeout, args.retry_delay)
+        start = time.perf_counter()
+        if batched:
+            engine.translate_many(HEADLINES, 'en', 'hi')
+        else:
+            for headline in HEADLINES:
+                engine.translate(headline, 'en', 'hi')
+        elapsed = time.perf_counter() - start
+        stats = server_stats(server)
+        print(f"   {label:15s} {elapsed * 1000:8.1f} ms, {stats['requests']} server requests")
+
+
+def run_deadlines(server, args):
+    """Unique free-form sentences: how often the latency budget is met"""
+    server.state.reset()
+    engine = make_engine(server_url(server), args.timeout, args.retry_delay)
+    latencies = []
+    fallbacks = 0
+    for i in range(args.sentences):
+        text = f"ಇದು ಪರೀಕ್ಷಾ ವಾಕ್ಯ ಸಂಖ್ಯೆ {i}"
+        start = time.perf_counter()
+        result = engine.translate(text, 'kn', 'en')
+        latencies.append(time.perf_counter() - start)
+        if result == text:
+            fallbacks += 1
+
+    print(f"\n📊 Deadlines (unique sentences, budget {engine.timeout:g}s)")
+    print(f"   sentences:       {args.sentences}")
+    print(f"   fell back:       {fallbacks}")
+    print(f"   latency mean:    {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"   latency max:     {max(latencies) * 1000:.1f} ms")
+    print(f"   server requests: {server_stats(server)['requests']}")
+    print(f"   backend health:  {engine.get_backend_health()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test TranslationEngine against the stand-in server')
+    parser.add_argument('--latency', type=float, default=0.05, help='server delay per request (s)')
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--utterances', type=int, default=200)
+    parser.add_argument('--sentences', type=int, default=20)
+    parser.add_argument('--timeout', type=float, default=1.5, help='engine latency budget (s)')
+    parser.add_argument('--retry-delay', type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = start_server(latency=args.latency, jitter=args.jitter,
+                          error_rate=args.error_rate, seed=args.seed)
+    print(f"🌐 Stand-in server on {server_url(server)} "
+          f"(latency {args.latency}s + 0..{args.jitter}s, error rate {args.error_rate:.0%})")
+    try:
+        run_repeated_commands(server, args)
+        run_batching(server, args)
+        run_deadlines(server, args)
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
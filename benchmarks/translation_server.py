@@ -0,0 +1,212 @@
+"""
+Local stand-in translation server for LYRA benchmarks
+Speaks the LibreTranslate API (POST /translate) used by HTTPTranslationBackend,
+answers from a dictionary, and can inject latency and errors deterministically
+
+Usage:
+    python -m benchmarks.translation_server --port 5005 --latency 0.3 --error-rate 0.1
+    then set TRANSLATION_BACKEND_URL = "http://127.0.0.1:5005/translate" in config.py
+
+GET /stats returns request counters; POST /reset clears them
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+# Small built-in dictionary: common commands in both directions
+DEFAULT_DICTIONARY = {
+    ('kn', 'en'): {
+        'ಸಮಯ ಏನು': 'what time is it',
+        'ಇಂದಿನ ದಿನಾಂಕ': "today's date",
+        'ಸುದ್ದಿ ಏನು': "what's the news",
+        'ಜೋಕ್ ಹೇಳು': 'tell me a joke',
+        'ಕ್ಯಾಲ್ಕುಲೇಟರ್ ತೆರೆ': 'open calculator',
+    },
+    ('hi', 'en'): {
+        'समय क्या है': 'what time is it',
+        'आज की तारीख': "today's date",
+        'समाचार सुनाओ': "what's the news",
+        'जोक सुनाओ': 'tell me a joke',
+        'कैलकुलेटर खोलो': 'open calculator',
+    },
+    ('en', 'kn'): {
+        "i'm listening. how can i help you?": 'ನಾನು ಕೇಳುತ್ತಿದ್ದೇನೆ. ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?',
+        'opening calculator': 'ಕ್ಯಾಲ್ಕುಲೇಟರ್ ತೆರೆಯಲಾಗುತ್ತಿದೆ',
+    },
+    ('en', 'hi'): {
+        "i'm listening. how can i help you?": 'मैं सुन रहा हूं। मैं आपकी कैसे मदद कर सकता हूं?',
+        'opening calculator': 'कैलकुलेटर खोल रहे हैं',
+    },
+}
+
+
+class TranslationServerState:
+    """Dictionary, fault injection settings and counters shared by all handler threads"""
+
+    def __init__(self, dictionary: Optional[Dict] = None, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            dictionary: {(source, target): {lowercase text: translation}}
+            latency: Fixed delay added to every request (seconds)
+            jitter: Extra uniformly distributed delay, 0..jitter (seconds)
+            error_rate: Fraction of requests answered with HTTP 503
+            seed: RNG seed, so runs are reproducible
+        """
+        self.dictionary = dictionary if dictionary is not None else DEFAULT_DICTIONARY
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.errors = 0
+            self.lines = 0
+            self.characters = 0
+
+    def next_fault(self):
+        """Decide delay and failure for one request (serialised so the seed is honoured)"""
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            return delay, fail
+
+    def translate(self, text: str, source: str, target: str) -> str:
+        """Translate line by line (so batched requests work); unknown lines are tagged"""
+        table = self.dictionary.get((source, target), {})
+        lines = text.split('\n')
+        with self.lock:
+            self.lines += len(lines)
+            self.characters += len(text)
+        return '\n'.join(table.get(line.strip().lower(), f"[{target}] {line}") for line in lines)
+
+    def stats(self) -> Dict:
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'errors': self.errors,
+                'lines': self.lines,
+                'characters': self.characters,
+            }
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """LibreTranslate-style /translate endpoint plus /stats and /reset"""
+
+    server_version = 'LYRATranslationStandIn/1.0'
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.server.state.stats())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        state = self.server.state
+
+        if self.path == '/reset':
+            state.reset()
+            self._send_json(200, {'ok': True})
+            return
+
+        if self.path != '/translate':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+            text, source, target = payload['q'], payload['source'], payload['target']
+        except (ValueError, KeyError) as e:
+            self._send_json(400, {'error': f'bad request: {e}'})
+            return
+
+        delay, fail = state.next_fault()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._send_json(503, {'error': 'injected failure'})
+            return
+
+        self._send_json(200, {'translatedText': state.translate(text, source, target)})
+
+
+def start_server(host: str = '127.0.0.1', port: int = 0, **state_options) -> ThreadingHTTPServer:
+    """
+    Start the stand-in server on a background thread
+
+    Args:
+        host: Interface to bind
+        port: Port (0 = pick a free one; see server.server_address)
+        **state_options: Passed to TranslationServerState
+
+    Returns:
+        Running server; call shutdown() when done
+    """
+    server = ThreadingHTTPServer((host, port), TranslationRequestHandler)
+    server.daemon_threads = True
+    server.state = TranslationServerState(**state_options)
+    threading.Thread(target=server.serve_forever, name='translation-stand-in', daemon=True).start()
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    """Base /translate URL of a running server"""
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/translate"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in translation server (LibreTranslate API)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5005)
+    parser.add_argument('--latency', type=float, default=0.0, help='fixed delay per request (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random delay 0..jitter (s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests failing with 503')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dictionary', help='JSON file: {"kn>en": {"text": "translation"}, ...}')
+    args = parser.parse_args()
+
+    dictionary = None
+    if args.dictionary:
+        with open(args.dictionary, encoding='utf-8') as f:
+            raw = json.load(f)
+        dictionary = {tuple(pair.split('>')): {k.lower(): v for k, v in table.items()}
+                      for pair, table in raw.items()}
+
+    server = start_server(args.host, args.port, dictionary=dictionary, latency=args.latency,
+                          jitter=args.jitter, error_rate=args.error_rate, seed=args.seed)
+    print(f"🌐 Translation stand-in listening on {server_url(server)}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,10 +7,19 @@ PLATFORM = platform.system()
 # Whisper settings - Support multiple languages
 WHISPER_MODEL = 'base'  # Options: tiny, base, small, medium, large
 WHISPER_LANGUAGE = None  # Set to None to auto-detect language, or specify 'en', 'hi', 'kn'
+ASR_N_BEST = 4  # Hypotheses rescored against the intent grammar when the top one isn't a clear command (1 = off)
+ASR_N_BEST_TEMPERATURE = 0.6  # Sampling temperature for the alternative hypotheses
+ASR_N_BEST_MAX_SECONDS = 8.0  # Only short utterances (commands) get alternatives decoded
+ASR_ACOUSTIC_WEIGHT = 0.6  # Combined score = acoustic * this + intent match * ASR_INTENT_WEIGHT
+ASR_INTENT_WEIGHT = 0.4
+ASR_N_BEST_MIN_SIMILARITY = 0.7  # Alternatives less similar than this to the top transcript are ignored (fix slips, not rewrite)
 
 # TTS settings
 TTS_RATE = 150  # Speech rate (words per minute)
 TTS_VOLUME = 0.9  # Volume (0.0 to 1.0)
+TTS_CACHE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'tts_cache')  # Pre-synthesised replies
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024  # Disk budget for pre-synthesised replies
+TTS_OFFLINE_MODE = False  # True = air-gapped: use local espeak-ng only, never network voices
 
 # Windows Application paths
 APP_PATHS = {
@@ -43,6 +52,29 @@ SUPPORTED_LANGUAGES = {
 
 # Database settings
 DATABASE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'voiceos.db')
+CUSTOM_COMMANDS_SYNC_INTERVAL = 1.0  # Seconds between checks for custom command edits made by other processes
+
+# Custom command actions (scripts, system commands) run in the background
+CUSTOM_ACTION_WORKERS = 4  # Actions running at the same time
+CUSTOM_ACTION_TIMEOUT = 30.0  # Seconds before a script/command is killed (per-command 'timeout' param overrides)
+CUSTOM_ACTION_REPLY_WAIT = 1.0  # Answer inline if the action finishes this fast; otherwise announce the result later
+CUSTOM_ACTION_MAX_OUTPUT = 4000  # Characters of captured output kept per action
+CUSTOM_MACRO_WORKERS = 6  # Macro steps running at the same time
+
+# Translation cache settings
+TRANSLATION_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'translation_cache.db')
+TRANSLATION_CACHE_TTL = 30 * 24 * 3600  # Successful translations (seconds)
+TRANSLATION_NEGATIVE_CACHE_TTL = 300  # Failed translations are retried after this (seconds)
+TRANSLATION_TIMEOUT = 1.5  # Latency budget per translation; slower calls finish in the background
+TRANSLATION_BACKEND_URL = None  # LibreTranslate-style endpoint (e.g. http://127.0.0.1:5005/translate); None = googletrans
+
+# Intent classifier settings
+INTENT_MODEL_PATH = os.path.join(os.path.dirname(__file__), 'data', 'intent_classifier.pkl')  # python -m core.intent_classifier train
+INTENT_CLASSIFIER_MIN_CONFIDENCE = 0.7  # Below this, fall back to pattern + fuzzy matching
+NLU_TOKENIZER = 'regex'  # 'regex' (built in) or 'nltk' (word_tokenize + NLTK stop words, imported on first use)
+
+# Emotion detection settings
+EMOTION_LEXICON_PATH = os.path.join(os.path.dirname(__file__), 'data', 'emotion_lexicon.json')  # Keywords/phrases per emotion and language
 
 # Ensure data directory exists
 os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
@@ -0,0 +1,96 @@
+"""
+Aho-Corasick multi-pattern matcher for LYRA Voice Assistant
+Finds every occurrence of every pattern in one left-to-right pass over the
+text, so lookup cost depends on the text length, not on how many patterns
+the lexicon holds
+"""
+
+from collections import deque
+from typing import Any, Iterable, List, Tuple
+
+# (start, end, value) - text[start:end] is the matched pattern
+Match = Tuple[int, int, Any]
+
+
+class AhoCorasick:
+    """
+    Character trie with failure links
+
+    State 0 is the root. Each state has a goto table (char -> state), a
+    failure link (longest proper suffix that is also a trie path) and the
+    patterns ending there, including those inherited through failure links.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = ()):
+        """
+        Args:
+            patterns: (pattern, value) pairs; value is returned with each match
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        self.size = 0
+
+        for pattern, value in patterns:
+            self._add(pattern, value)
+        self._link()
+
+    def _add(self, pattern: str, value: Any):
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((len(pattern), value))
+        self.size += 1
+
+    def _link(self):
+        """Breadth-first pass setting failure links and merging outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Match]:
+        """Every (possibly overlapping) occurrence, ordered by end position"""
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                end = index + 1
+                for length, value in out[state]:
+                    matches.append((end - length, end, value))
+        return matches
+
+
+def longest_non_overlapping(matches: Iterable[Match]) -> List[Match]:
+    """
+    Leftmost-longest selection: at each start keep the longest match, and
+    drop matches overlapping one already kept (so a phrase hides the
+    keywords inside it)
+    """
+    selected = []
+    end = 0
+    for match in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+        if match[0] >= end:
+            selected.append(match)
+            end = match[1]
+    return selected
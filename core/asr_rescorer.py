@@ -0,0 +1,163 @@
+"""
+N-best ASR rescoring for LYRA
+Whisper's top transcript is not always the one the user meant: "open
+calculater" still matches the open_app pattern but names no app. When the
+top hypothesis isn't a clear command, SpeechRecognizer.n_best() supplies
+alternatives and this picks the one with the best combined acoustic and
+intent-match score, instead of falling through to fuzzy matching or to
+"I didn't quite catch that".
+"""
+
+import math
+import logging
+import threading
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional
+
+from config import ASR_ACOUSTIC_WEIGHT, ASR_INTENT_WEIGHT, ASR_N_BEST_MIN_SIMILARITY
+
+logger = logging.getLogger(__name__)
+
+# Intent-match credit by how the hypothesis matched the grammar
+PATTERN_CREDIT = 1.0  # Pattern hit, every checked slot is a known value
+UNKNOWN_SLOT_CREDIT = 0.6  # Pattern hit, but e.g. the app name isn't one we know
+FUZZY_CREDIT = 0.5  # Keyword fuzzy fallback only (scaled by its ratio)
+
+
+class Hypothesis:
+    """One ASR candidate transcript"""
+
+    def __init__(self, text: str, avg_logprob: float, source: str = 'greedy'):
+        self.text = text
+        self.avg_logprob = avg_logprob  # Whisper's mean token log-probability
+        self.source = source  # 'greedy' (the transcribe() result) or 'sample'
+        self.intent = None
+        self.intent_score = 0.0
+        self.score = 0.0
+
+    @property
+    def acoustic_score(self) -> float:
+        """Geometric-mean token probability, 0-1"""
+        return min(1.0, math.exp(min(0.0, self.avg_logprob)))
+
+    def __repr__(self):
+        return (f"Hypothesis({self.text!r}, acoustic={self.acoustic_score:.2f}, "
+                f"intent={self.intent}:{self.intent_score:.2f}, score={self.score:.2f})")
+
+
+class HypothesisRescorer:
+    """
+    Scores ASR hypotheses against CommandProcessor's intent grammar
+
+    score = acoustic * acoustic_weight + intent match * intent_weight, where
+    the intent match is PATTERN_CREDIT for a pattern hit whose checked slots
+    (e.g. app_name; Latin-script values only) hold known values,
+    UNKNOWN_SLOT_CREDIT if they don't,
+    FUZZY_CREDIT * ratio for a keyword-only match and 0 for no intent (a
+    custom command trigger counts as a full match). With no intent in any
+    hypothesis the acoustic score alone decides, so ordinary conversation
+    keeps Whisper's own choice; alternatives that differ from the top
+    transcript by more than a slip (min_similarity) are never picked.
+    """
+
+    def __init__(self, command_processor, slot_vocabulary: Optional[Dict[str, Iterable[str]]] = None,
+                 trigger_matcher: Optional[Callable[[str], bool]] = None,
+                 acoustic_weight: float = ASR_ACOUSTIC_WEIGHT, intent_weight: float = ASR_INTENT_WEIGHT,
+                 min_similarity: float = ASR_N_BEST_MIN_SIMILARITY):
+        """
+        Args:
+            command_processor: CommandProcessor whose detect_intent() is the grammar
+            slot_vocabulary: Known values per entity, e.g. {'app_name': app names}
+            trigger_matcher: callable(text) -> True if a custom command trigger matches
+            acoustic_weight: Weight of the acoustic score
+            intent_weight: Weight of the intent-match score
+            min_similarity: Character similarity (0-1) an alternative needs to the top transcript
+        """
+        self.command_processor = command_processor
+        self.slot_vocabulary = {slot: {value.lower() for value in values}
+                                for slot, values in (slot_vocabulary or {}).items()}
+        self.trigger_matcher = trigger_matcher
+        self.acoustic_weight = acoustic_weight
+        self.intent_weight = intent_weight
+        self.min_similarity = min_similarity
+
+        self._lock = threading.Lock()
+        self.stats = {'rescored': 0, 'switched': 0, 'skipped': 0}
+
+    def intent_match(self, text: str):
+        """
+        How well a transcript fits the intent grammar
+
+        Returns:
+            (intent name or None, score 0-1)
+        """
+        if self.trigger_matcher is not None and self.trigger_matcher(text):
+            return 'custom_command', PATTERN_CREDIT
+
+        match = self.command_processor.detect_intent(text)
+        intent, confidence = match.get('intent'), match.get('confidence', 0)
+        if not intent:
+            return None, 0.0
+        if confidence < 0.95:
+            # Keyword fuzzy fallback: some evidence, but no pattern and no entities
+            return intent, FUZZY_CREDIT * confidence
+
+        for slot, value in match.get('entities', {}).items():
+            known = self.slot_vocabulary.get(slot)
+            # Vocabularies hold English names; a native-script value
+            # ("कैलकुलेटर") has too many spellings to judge, so it passes
+            if known is None or not value.isascii():
+                continue
+            if value.lower().strip(' .,!?') not in known:
+                return intent, UNKNOWN_SLOT_CREDIT
+        return intent, PATTERN_CREDIT
+
+    def needs_alternatives(self, text: str) -> bool:
+        """False when the top transcript is already a clean command (skip the extra decode)"""
+        needed = self.intent_match(text)[1] < PATTERN_CREDIT
+        if not needed:
+            with self._lock:
+                self.stats['skipped'] += 1
+        return needed
+
+    def rescore(self, hypotheses: List[Hypothesis]) -> List[Hypothesis]:
+        """Score every hypothesis; returns them best first"""
+        for hypothesis in hypotheses:
+            hypothesis.intent, hypothesis.intent_score = self.intent_match(hypothesis.text)
+            hypothesis.score = (self.acoustic_weight * hypothesis.acoustic_score +
+                                self.intent_weight * hypothesis.intent_score)
+        # sorted() is stable: on a tie the recogniser's own order (greedy first) wins
+        return sorted(hypotheses, key=lambda hypothesis: hypothesis.score, reverse=True)
+
+    def pick(self, hypotheses: List[Hypothesis]) -> Optional[Hypothesis]:
+        """
+        Best hypothesis of an n-best list
+
+        Args:
+            hypotheses: Candidates, the recogniser's top transcript first
+                (alternatives too unlike it are dropped before scoring)
+
+        Returns:
+            The chosen Hypothesis (None for an empty list)
+        """
+        if not hypotheses:
+            return None
+        if len(hypotheses) == 1:
+            return hypotheses[0]
+
+        top = hypotheses[0]
+        candidates = [top] + [hypothesis for hypothesis in hypotheses[1:]
+                              if SequenceMatcher(None, top.text.lower(), hypothesis.text.lower()).ratio()
+                              >= self.min_similarity]
+        best = self.rescore(candidates)[0]
+        with self._lock:
+            self.stats['rescored'] += 1
+            if best is not top:
+                self.stats['switched'] += 1
+        if best is not top:
+            logger.info(f"Rescored n-best: {top!r} -> {best!r}")
+        return best
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
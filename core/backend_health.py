@@ -0,0 +1,139 @@
+"""
+Backend health tracking for LYRA's network services
+Per-backend failure counters, circuit breaker (closed/open/half-open)
+and latency EWMA, so callers can skip backends that are known to be down
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackendHealth:
+    """
+    Circuit breaker for a single backend
+
+    - CLOSED: requests flow normally; consecutive failures are counted
+    - OPEN: requests are skipped until the cooldown expires
+    - HALF_OPEN: one trial request is let through; success closes the
+      circuit, failure re-opens it with a longer cooldown
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 2, cooldown: float = 30.0,
+                 max_cooldown: float = 300.0, ewma_alpha: float = 0.3):
+        """
+        Args:
+            name: Backend name (for logging)
+            failure_threshold: Consecutive failures before the circuit opens
+            cooldown: Initial seconds to wait before a half-open trial
+            max_cooldown: Upper bound for the exponential cooldown backoff
+            ewma_alpha: Smoothing factor for the latency EWMA
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.ewma_alpha = ewma_alpha
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.latency_ewma: Optional[float] = None
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent to this backend
+        Moves OPEN -> HALF_OPEN once the cooldown has expired
+
+        Returns:
+            True if the caller should try the backend
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                self.trial_in_flight = False
+                logger.info(f"{self.name}: circuit half-open, allowing trial request")
+
+            # HALF_OPEN: only one trial at a time
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+            return True
+
+    def record_success(self, latency: Optional[float] = None):
+        """Record a successful request and its latency (seconds)"""
+        with self._lock:
+            if latency is not None:
+                if self.latency_ewma is None:
+                    self.latency_ewma = latency
+                else:
+                    self.latency_ewma = self.ewma_alpha * latency + (1 - self.ewma_alpha) * self.latency_ewma
+
+            self.total_successes += 1
+            self.consecutive_failures = 0
+            self.trial_in_flight = False
+
+            if self.state != self.CLOSED:
+                logger.info(f"{self.name}: circuit closed (backend recovered)")
+            self.state = self.CLOSED
+            self.cooldown = self.base_cooldown
+
+    def record_failure(self):
+        """Record a failed request; may open the circuit"""
+        with self._lock:
+            self.total_failures += 1
+            self.consecutive_failures += 1
+            self.trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                # Trial failed - back off harder
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._open()
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        logger.warning(f"{self.name}: circuit open for {self.cooldown:.0f}s "
+                       f"after {self.consecutive_failures} consecutive failures")
+
+    def needs_probe(self) -> bool:
+        """True if the circuit is open and its cooldown has expired"""
+        with self._lock:
+            return self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown
+
+    def is_available(self) -> bool:
+        """True unless the circuit is open"""
+        return self.state != self.OPEN
+
+    def snapshot(self) -> Dict:
+        """Current health as a plain dict (for logging / GUI)"""
+        with self._lock:
+            return {
+                'name': self.name,
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'total_failures': self.total_failures,
+                'total_successes': self.total_successes,
+                'latency_ewma': self.latency_ewma,
+                'cooldown': self.cooldown,
+            }
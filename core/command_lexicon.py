@@ -0,0 +1,258 @@
+"""
+Offline command lexicon for LYRA Voice Assistant
+Translates short Hindi/Kannada commands to English without a network round trip
+
+Seeded from:
+- CommandProcessor intent patterns (native pattern -> English pattern of the same intent)
+- CommandProcessor romanisation maps + MultilingualTextProcessor phonetic_map (word glossary)
+
+Free-form content the lexicon cannot gloss is left to the network translator.
+"""
+
+import re
+import logging
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from core.script_profile import profile_text
+
+logger = logging.getLogger(__name__)
+
+# Capture groups the English templates may contain: (.+), (.+?) and the
+# named slots load_intents uses, e.g. (?P<app_name>[^\s.,]+) or (?P<recipient>\S+)
+_GROUP = re.compile(r'\((?:\?P<(\w+)>)?(?:\.\+\??|\[\^\\s\.,\]\+|\\S\+)\)')
+
+# {name} / {} placeholders of a template
+_PLACEHOLDER = re.compile(r'\{(\w*)\}')
+
+
+def _drop_optional(pattern: str) -> str:
+    """
+    The pattern without its optional (?:...)? parts, e.g. the " in <city>"
+    tail of the weather rules (those nest groups, so this counts brackets)
+    """
+    out, i = [], 0
+    while i < len(pattern):
+        if pattern.startswith('(?:', i):
+            depth, j = 0, i
+            while j < len(pattern):
+                if pattern[j] == '\\':
+                    j += 2
+                    continue
+                if pattern[j] == '(':
+                    depth += 1
+                elif pattern[j] == ')':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                j += 1
+            if pattern[j + 1:j + 2] == '?':
+                i = j + 2
+                continue
+        step = 2 if pattern[i] == '\\' else 1
+        out.append(pattern[i:i + step])
+        i += step
+    return ''.join(out)
+
+
+def _script_of(text: str) -> Optional[str]:
+    """Native script of a pattern / word ('kn' or 'hi'), None for Latin-only text"""
+    languages = profile_text(text).languages
+    for language in ('kn', 'hi'):
+        if language in languages:
+            return language
+    return None
+
+
+class CommandLexicon:
+    """
+    Phrase table + word glossary
+
+    Each native intent pattern becomes a rule: if the utterance matches the
+    whole pattern, it is rewritten with the first plain English pattern of
+    the same intent that has the same capture groups - the same group names
+    (filled by name, so "व्हाट्सअप <contact> को <message>" lands in
+    "whatsapp {message} to {contact}" the right way round), or the same
+    number of unnamed groups (filled in order). Patterns mixing named and
+    unnamed groups get no rule. Captured text is kept if it is already
+    Latin, glossed word by word otherwise.
+    """
+
+    # Intents whose patterns are different commands rather than paraphrases
+    # (e.g. shutdown vs restart), so one English template can't stand for all
+    EXCLUDED_INTENTS = {'system_command'}
+
+    # Native patterns that need a specific English phrase of their intent:
+    # boredom is a tell_joke pattern, but the router only answers it with
+    # entertain_me if the text still says "bored"
+    TEMPLATE_OVERRIDES = {
+        "मुझे बोर हो रहा है": "i'm bored",
+        "मजा नहीं आ रहा": "i'm bored",
+        "ನನಗೆ ಬೇಸರವಾಗಿದೆ": "i'm bored",
+        "ನನಗೆ ಬೋರ್ ಆಗಿದೆ": "i'm bored",
+    }
+
+    def __init__(self, command_processor, multilingual_processor=None):
+        """
+        Args:
+            command_processor: CommandProcessor (intents and romanisation maps)
+            multilingual_processor: MultilingualTextProcessor (phonetic_map), optional
+        """
+        phonetic_map = getattr(multilingual_processor, 'phonetic_map', {}) if multilingual_processor else {}
+
+        self.rules: List[Tuple[str, str, re.Pattern, str]] = []
+        english_vocabulary = set()
+
+        for intent_name, intent_data in command_processor.intents.items():
+            if intent_name in self.EXCLUDED_INTENTS:
+                continue
+
+            templates: Dict[tuple, str] = {}
+            for pattern in intent_data["patterns"]:
+                if not pattern.isascii():
+                    continue
+                template = self._pattern_to_template(pattern)
+                if template is None:
+                    continue
+                slots = self._template_slots(template)
+                if slots is not None and slots not in templates:
+                    templates[slots] = template
+                    english_vocabulary.update(_PLACEHOLDER.sub(' ', template).split())
+
+            for pattern in intent_data["patterns"]:
+                language = _script_of(pattern)
+                if language is None:
+                    continue
+                compiled = re.compile(pattern, re.IGNORECASE)
+                template = self.TEMPLATE_OVERRIDES.get(pattern) or templates.get(self._pattern_slots(compiled))
+                if template is not None:
+                    self.rules.append((intent_name, language, compiled, template))
+
+        self.glossary = self._build_glossary(
+            [command_processor.kannada_romanization, command_processor.hindi_romanization],
+            phonetic_map,
+            english_vocabulary
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+        logger.info(f"Command lexicon: {len(self.rules)} phrase rules, {len(self.glossary)} glossary words")
+
+    @staticmethod
+    def _pattern_to_template(pattern: str) -> Optional[str]:
+        """
+        Turn a simple English regex into a format template
+        e.g. r"open\\s+(.+)" -> "open {}"; optional parts are dropped and
+        patterns with other regex syntax are skipped
+        """
+        template = _drop_optional(pattern)
+        template = template.replace(r'\s+', ' ').replace(r'\s*', ' ')
+        template = _GROUP.sub(lambda group: '{%s}' % (group.group(1) or ''), template)
+        if not re.fullmatch(r"[a-z' ]*(?:\{\w*\}[a-z' ]*)*", template):
+            return None
+        return ' '.join(template.split())
+
+    @staticmethod
+    def _template_slots(template: str) -> Optional[tuple]:
+        """('named', names) or ('positional', count); None if named and {} are mixed"""
+        names = _PLACEHOLDER.findall(template)
+        if all(names):
+            return ('named', frozenset(names)) if names else ('positional', 0)
+        if not any(names):
+            return ('positional', len(names))
+        return None
+
+    @staticmethod
+    def _pattern_slots(compiled: re.Pattern) -> Optional[tuple]:
+        """The same key for a native pattern's capture groups"""
+        names = set(compiled.groupindex)
+        if names and len(names) == compiled.groups:
+            return ('named', frozenset(names))
+        if not names:
+            return ('positional', compiled.groups)
+        return None
+
+    @staticmethod
+    def _build_glossary(romanization_maps, phonetic_map: Dict[str, str],
+                        english_vocabulary) -> Dict[str, str]:
+        """
+        Native word -> English word
+
+        The romanisation maps give romanised -> native; a romanised form is
+        turned into English through phonetic_map, or used directly if it is
+        a word of one of the English templates (romanised keys such as
+        "samaya" appear in the ASCII patterns too, so those don't count).
+        """
+        glossary = {}
+        for romanization in romanization_maps:
+            for roman, native in romanization.items():
+                if native in glossary:
+                    continue
+                if roman in phonetic_map:
+                    glossary[native] = phonetic_map[roman]
+                elif roman in english_vocabulary:
+                    glossary[native] = roman
+        return glossary
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """NFC, single spaces, no trailing sentence punctuation"""
+        text = unicodedata.normalize('NFC', text)
+        text = ' '.join(text.split())
+        return text.rstrip('.!?।॥').strip()
+
+    def _gloss(self, fragment: str) -> Optional[str]:
+        """Translate captured text word by word, or None if any word is unknown"""
+        words = []
+        for word in fragment.split():
+            if word.isascii():
+                words.append(word)
+            elif word in self.glossary:
+                words.append(self.glossary[word])
+            else:
+                return None
+        return ' '.join(words)
+
+    def translate(self, text: str, language: Optional[str] = None) -> Optional[str]:
+        """
+        Translate a command-like utterance to English offline
+
+        Args:
+            text: Hindi or Kannada utterance
+            language: Language code to restrict the rules to (None = any)
+
+        Returns:
+            English command text, or None if the utterance is not covered
+        """
+        text = self.normalize(text)
+        if not text:
+            return None
+
+        for intent_name, rule_language, pattern, template in self.rules:
+            if language and rule_language != language:
+                continue
+            match = pattern.fullmatch(text)
+            if not match:
+                continue
+
+            named = pattern.groupindex
+            captured = match.groupdict() if named else dict(enumerate(match.groups()))
+            arguments = {}
+            for slot, group in captured.items():
+                glossed = self._gloss(group or '')
+                if glossed is None:
+                    break
+                arguments[slot] = glossed
+            else:
+                if named:
+                    english = template.format(**arguments)
+                else:
+                    english = template.format(*(arguments[i] for i in range(len(arguments))))
+                english = ' '.join(english.split())  # An empty optional slot leaves a double space
+                self.hits += 1
+                logger.info(f"Lexicon ({intent_name}): '{text}' -> '{english}'")
+                return english
+
+        self.misses += 1
+        return None
@@ -1,217 +1,198 @@
 # command_processor.py
 import re
-from thefuzz import fuzz, process
-import json
+
+from core.intent_matcher import IntentMatcher
+from core.keyword_index import KeywordIndex
+from core.intent_classifier import IntentClassifier, UNKNOWN_INTENT
+from core.nlu_cache import NLUCache
+from core.tokenizer import Tokenizer
+from core.transliteration import TRANSLITERATOR, to_native
+
+# A city is the words after "weather in ...", up to a trailing time word
+# ("what's the weather in new york today" -> "new york")
+_CITY_WORD = r"(?!(?:today|tomorrow|tonight|now|this|like)\b)[A-Za-z]+"
+CITY = rf"(?P<city>{_CITY_WORD}(?:\s+{_CITY_WORD})*)"
 
 class CommandProcessor:
     def __init__(self):
-        self.intents = self.load_intents()
+        # Memoised process_command results, per normalised utterance
+        self.nlu_cache = NLUCache()
+        self.set_intents(self.load_intents())
         
-        # Try to load NLTK, but handle gracefully if not available
-        try:
-            from nltk.tokenize import word_tokenize
-            from nltk.corpus import stopwords
-            self.word_tokenize = word_tokenize
-            self.stop_words = set(stopwords.words('english'))
-            self.nltk_available = True
-        except (ImportError, LookupError) as e:
-            print(f"⚠️ NLTK not fully available: {e}")
-            self.word_tokenize = lambda x: x.lower().split()
-            self.stop_words = {'the', 'a', 'an', 'to', 'in', 'on', 'at', 'for'}
-            self.nltk_available = False
-        
-        # ✅ NEW: Romanization mappings for Kannada commands
-        self.kannada_romanization = {
-            # Time queries
-            "samaya": "ಸಮಯ",
-            "samay": "ಸಮಯ",
-            "time": "ಸಮಯ",
-            "enu": "ಏನು",
-            "yenu": "ಏನು",
-            "eenu": "ಏನು",
-            
-            # App commands
-            "tere": "ತೆರೆ",
-            "there": "ತೆರೆ",
-            "open": "ತೆರೆ",
-            "muchu": "ಮುಚ್ಚು",
-            "close": "ಮುಚ್ಚು",
-            
-            # Calculator
-            "calculator": "ಕ್ಯಾಲ್ಕುಲೇಟರ್",
-            "calc": "ಕ್ಯಾಲ್ಕುಲೇಟರ್",
-            "kalkulater": "ಕ್ಯಾಲ್ಕುಲೇಟರ್",
-            
-            # Reminders
-            "nenapisu": "ನೆನಪಿಸು",
-            "remind": "ನೆನಪಿಸು",
-            "reminder": "ರಿಮೈಂಡರ್",
-        }
+        # Tokens are only needed on demand (preprocess_text); NLTK, if
+        # configured, is imported on first use rather than at startup
+        self.tokenizer = Tokenizer()
         
-        # ✅ NEW: Hindi romanization mappings
-        self.hindi_romanization = {
-            "samay": "समय",
-            "time": "समय",
-            "kya": "क्या",
-            "hai": "है",
-            "kholo": "खोलो",
-            "open": "खोलो",
-            "band": "बंद",
-            "close": "बंद",
-            "calculator": "कैलकुलेटर",
-            "yaad": "याद",
-            "remind": "याद",
-        }
+        # Romanised word -> native word views of the shared transliteration
+        # rules (the command lexicon and classifier read these)
+        self.kannada_romanization = TRANSLITERATOR.word_map('kn')
+        self.hindi_romanization = TRANSLITERATOR.word_map('hi')
         
+    def set_intents(self, intents):
+        """
+        Install intent definitions and rebuild everything derived from them
+
+        Args:
+            intents: {intent_name: {"patterns": [...], "keywords": [...], "slots": [...]}} in priority order
+        """
+        self.intents = intents
+        # Intent patterns compiled once, searched in load_intents priority order
+        self.matcher = IntentMatcher(self.intents)
+        # Slot-only patterns, per intent ("weather ... in <city>")
+        self.slot_patterns = {name: [re.compile(pattern, self.matcher.flags) for pattern in data.get("slots", ())]
+                              for name, data in self.intents.items() if data.get("slots")}
+        # Inverted index so fuzzy scoring only runs on plausible keywords
+        self.keyword_index = KeywordIndex(self.intents)
+        # Trained classifier (optional); regexes are then only run for entities
+        self.classifier = IntentClassifier()
+        self.classifier.load(self.intents)
+        self.invalidate_nlu_cache("intents changed")
+
+    def invalidate_nlu_cache(self, reason=""):
+        """Forget memoised results (intents or custom commands changed)"""
+        self.nlu_cache.clear(reason)
+
+    def get_metrics(self):
+        """NLU cache counters"""
+        return {"nlu_cache": self.nlu_cache.get_stats()}
+    
     def normalize_romanized_text(self, text, language='en'):
         """
-        ✅ NEW: Convert romanized Kannada/Hindi to native script
+        Convert romanized Kannada/Hindi to native script
         Example: "samaya enu" → "ಸಮಯ ಏನು"
         """
-        if language == 'kn':
-            # Normalize Kannada romanization
-            words = text.lower().split()
-            normalized_words = []
-            for word in words:
-                # Check if word is romanized
-                if word in self.kannada_romanization:
-                    normalized_words.append(self.kannada_romanization[word])
-                else:
-                    normalized_words.append(word)
-            return ' '.join(normalized_words)
-        
-        elif language == 'hi':
-            # Normalize Hindi romanization
-            words = text.lower().split()
-            normalized_words = []
-            for word in words:
-                if word in self.hindi_romanization:
-                    normalized_words.append(self.hindi_romanization[word])
-                else:
-                    normalized_words.append(word)
-            return ' '.join(normalized_words)
-        
-        return text
+        return to_native(text, language)
     
     def load_intents(self):
-        """Define command intents and patterns with multilingual support"""
+        """
+        Define command intents and patterns with multilingual support
+
+        Each pattern is a complete rule: a match gives the intent and its
+        entities, one per named group (app_name, contact, message, task,
+        time, city, ...). Optional "slots" patterns never decide the intent;
+        they only fill entities a detection left empty.
+        """
         return {
             "open_app": {
                 "patterns": [
-                    r"open\s+(.+)",
-                    r"launch\s+(.+)",
-                    r"start\s+(.+)",
-                    r"run\s+(.+)",
-                    r"खोलो\s+(.+)",
-                    r"शुरू करो\s+(.+)",
-                    r"चलाओ\s+(.+)",
-                    r"ತೆರೆ\s+(.+)",
-                    r"ಪ್ರಾರಂಭಿಸು\s+(.+)",
+                    r"open\s+(?P<app_name>[^\s.,]+)",
+                    r"launch\s+(?P<app_name>[^\s.,]+)",
+                    r"start\s+(?P<app_name>[^\s.,]+)",
+                    r"run\s+(?P<app_name>[^\s.,]+)",
+                    r"खोलो\s+(?P<app_name>[^\s.,]+)",
+                    r"शुरू करो\s+(?P<app_name>[^\s.,]+)",
+                    r"चलाओ\s+(?P<app_name>[^\s.,]+)",
+                    r"ತೆರೆ\s+(?P<app_name>[^\s.,]+)",
+                    r"ಪ್ರಾರಂಭಿಸು\s+(?P<app_name>[^\s.,]+)",
                     # ✅ NEW: Romanized patterns
-                    r"tere\s+(.+)",
-                    r"there\s+(.+)",
+                    r"tere\s+(?P<app_name>[^\s.,]+)",
+                    r"there\s+(?P<app_name>[^\s.,]+)",
                 ],
                 "keywords": ["open", "launch", "start", "run", "खोलो", "शुरू", "चलाओ", "ತೆರೆ", "ಪ್ರಾರಂಭಿಸು", "tere", "there"]
             },
             "close_app": {
                 "patterns": [
-                    r"close\s+(.+)",
-                    r"quit\s+(.+)",
-                    r"exit\s+(.+)",
-                    r"stop\s+(.+)",
-                    r"बंद करो\s+(.+)",
-                    r"रोको\s+(.+)",
-                    r"ಮುಚ್ಚು\s+(.+)",
-                    r"ನಿಲ್ಲಿಸು\s+(.+)",
+                    r"close\s+(?P<app_name>[^\s.,]+)",
+                    r"quit\s+(?P<app_name>[^\s.,]+)",
+                    r"exit\s+(?P<app_name>[^\s.,]+)",
+                    r"stop\s+(?P<app_name>[^\s.,]+)",
+                    r"बंद करो\s+(?P<app_name>[^\s.,]+)",
+                    r"रोको\s+(?P<app_name>[^\s.,]+)",
+                    r"ಮುಚ್ಚು\s+(?P<app_name>[^\s.,]+)",
+                    r"ನಿಲ್ಲಿಸು\s+(?P<app_name>[^\s.,]+)",
                     # ✅ NEW: Romanized patterns
-                    r"muchu\s+(.+)",
-                    r"band\s+(.+)",
+                    r"muchu\s+(?P<app_name>[^\s.,]+)",
+                    r"band\s+(?P<app_name>[^\s.,]+)",
                 ],
                 "keywords": ["close", "quit", "exit", "stop", "बंद", "रोको", "ಮುಚ್ಚು", "ನಿಲ್ಲಿಸು", "muchu", "band"]
             },
             "create_reminder": {
                 "patterns": [
-                    r"remind me to (.+) at (.+)",
-                    r"set reminder for (.+)",
-                    r"add reminder (.+)",
-                    r"मुझे याद दिलाओ (.+)",
-                    r"रिमाइंडर सेट करो (.+)",
-                    r"ನನಗೆ ನೆನಪಿಸು (.+)",
-                    r"ರಿಮೈಂಡರ್ ಸೆಟ್ ಮಾಡ (.+)",
+                    r"remind me to (?P<task>.+) at (?P<time>.+)",
+                    r"remind me to (?P<task>.+)",
+                    r"set (?:a )?reminder to (?P<task>.+)",
+                    r"set reminder for (?P<task>.+)",
+                    r"add reminder (?P<task>.+)",
+                    r"मुझे याद दिलाओ (?P<task>.+)",
+                    r"रिमाइंडर सेट करो (?P<task>.+)",
+                    r"ನನಗೆ ನೆನಪಿಸು (?P<task>.+)",
+                    r"ರಿಮೈಂಡರ್ ಸೆಟ್ ಮಾಡ (?P<task>.+)",
                     # ✅ NEW: Romanized patterns
-                    r"nenapisu (.+)",
-                    r"yaad dilao (.+)",
+                    r"nenapisu (?P<task>.+)",
+                    r"yaad dilao (?P<task>.+)",
                 ],
+                "slots": [r"\bto\s+(?P<task>.+?)(?:\s+at\s+(?P<time>.+))?$"],
                 "keywords": ["remind", "reminder", "remember", "याद", "रिमाइंडर", "ನೆನಪಿಸು", "ರಿಮೈಂಡರ್", "nenapisu", "yaad"]
             },
             "create_event": {
                 "patterns": [
-                    r"schedule (.+) at (.+)",
-                    r"add event (.+)",
-                    r"create meeting (.+)",
-                    r"मीटिंग बनाओ (.+)",
-                    r"इवेंट जोड़ो (.+)",
-                    r"ಸಭೆ ರಚಿಸು (.+)",
-                    r"ಈವೆಂಟ್ ಸೇರಿಸು (.+)",
+                    r"schedule (?P<title>.+) at (?P<time>.+)",
+                    r"add event (?P<title>.+)",
+                    r"create meeting (?P<title>.+)",
+                    r"मीटिंग बनाओ (?P<title>.+)",
+                    r"इवेंट जोड़ो (?P<title>.+)",
+                    r"ಸಭೆ ರಚಿಸು (?P<title>.+)",
+                    r"ಈವೆಂಟ್ ಸೇರಿಸು (?P<title>.+)",
                 ],
                 "keywords": ["schedule", "event", "meeting", "appointment", "calendar"]
             },
             "create_note": {
                 "patterns": [
-                    r"take note (.+)",
-                    r"create note (.+)",
-                    r"write note (.+)",
-                    r"note (.+)",
-                    r"नोट बनाओ (.+)",
-                    r"लिखो (.+)",
-                    r"ನೋಟ್ ಮಾಡ (.+)",
-                    r"ಬರೆ (.+)",
+                    r"take note (?P<content>.+)",
+                    r"create note (?P<content>.+)",
+                    r"write note (?P<content>.+)",
+                    r"note (?P<content>.+)",
+                    r"नोट बनाओ (?P<content>.+)",
+                    r"लिखो (?P<content>.+)",
+                    r"ನೋಟ್ ಮಾಡ (?P<content>.+)",
+                    r"ಬರೆ (?P<content>.+)",
                 ],
                 "keywords": ["note", "write", "save"]
             },
             "search_note": {
                 "patterns": [
-                    r"find note (.+)",
-                    r"search note (.+)",
-                    r"show notes about (.+)",
-                    r"नोट खोजो (.+)",
-                    r"नोट दिखाओ (.+)",
-                    r"ನೋಟ್ ಹುಡುಕು (.+)",
-                    r"ನೋಟ್ ತೋರಿಸು (.+)",
+                    r"find note (?P<query>.+)",
+                    r"search note (?P<query>.+)",
+                    r"show notes about (?P<query>.+)",
+                    r"नोट खोजो (?P<query>.+)",
+                    r"नोट दिखाओ (?P<query>.+)",
+                    r"ನೋಟ್ ಹುಡುಕು (?P<query>.+)",
+                    r"ನೋಟ್ ತೋರಿಸು (?P<query>.+)",
                 ],
                 "keywords": ["find", "search", "show notes"]
             },
             "send_email": {
                 "patterns": [
-                    r"send email to (.+?) (?:subject|about|saying)?\s*(.+)?",
-                    r"email (.+?) (?:about|saying)?\s*(.+)?",
-                    r"ईमेल भेजो (.+)",
-                    r"मेल करो (.+)",
-                    r"ಇಮೇಲ್ ಕಳುಹಿಸು (.+)",
+                    r"send email to (?P<recipient>\S+)(?:\s+(?:subject|about|saying))?(?:\s+(?P<content>.+))?",
+                    r"email (?P<recipient>\S+)(?:\s+(?:about|saying))?(?:\s+(?P<content>.+))?",
+                    r"ईमेल भेजो (?P<recipient>.+)",
+                    r"मेल करो (?P<recipient>.+)",
+                    r"ಇಮೇಲ್ ಕಳುಹಿಸು (?P<recipient>.+)",
                 ],
                 "keywords": ["send email", "email", "compose"]
             },
             "send_whatsapp": {
                 "patterns": [
                     # ✅ FIXED: Better patterns for WhatsApp
-                    r"send\s+(.+?)\s+(?:whatsapp|via whatsapp|on whatsapp)\s+to\s+(.+)",
-                    r"whatsapp\s+(.+?)\s+to\s+(.+)",
-                    r"message\s+(.+?)\s+to\s+(.+?)\s+(?:on|via)?\s*whatsapp",
-                    r"send\s+whatsapp\s+(?:message\s+)?to\s+(.+?)\s+saying\s+(.+)",
-                    r"व्हाट्सअप (.+?) को (.+)",
-                    r"मैसेज करो (.+)",
-                    r"ವಾಟ್ಸಾಪ್ ಕಳುಹಿಸು (.+)",
+                    r"send\s+(?P<message>.+?)\s+(?:whatsapp|via whatsapp|on whatsapp)\s+to\s+(?P<contact>.+)",
+                    r"whatsapp\s+(?P<message>.+?)\s+to\s+(?P<contact>.+)",
+                    r"message\s+(?P<message>.+?)\s+to\s+(?P<contact>.+?)\s+(?:on|via)?\s*whatsapp",
+                    r"message\s+(?P<contact>.+?)\s+on\s+whatsapp\s+(?P<message>.+)",
+                    r"send\s+whatsapp\s+(?:message\s+)?to\s+(?P<contact>.+?)\s+saying\s+(?P<message>.+)",
+                    r"व्हाट्सअप (?P<contact>.+?) को (?P<message>.+)",
+                    r"मैसेज करो (?P<contact>.+)",
+                    r"ವಾಟ್ಸಾಪ್ ಕಳುಹಿಸು (?P<contact>.+)",
                 ],
                 "keywords": ["whatsapp", "message"]
             },
             "read_pdf": {
                 "patterns": [
-                    r"read pdf (.+)",
-                    r"open pdf (.+)",
-                    r"read document (.+)",
-                    r"पीडीएफ पढ़ो (.+)",
-                    r"डॉक्युमेंट पढ़ो (.+)",
-                    r"ಪಿಡಿಎಫ್ ಓದು (.+)",
+                    r"read pdf (?P<file>.+)",
+                    r"open pdf (?P<file>.+)",
+                    r"read document (?P<file>.+)",
+                    r"पीडीएफ पढ़ो (?P<file>.+)",
+                    r"डॉक्युमेंट पढ़ो (?P<file>.+)",
+                    r"ಪಿಡಿಎಫ್ ಓದು (?P<file>.+)",
                 ],
                 "keywords": ["read pdf", "read document", "pdf"]
             },
@@ -251,14 +232,16 @@ class CommandProcessor:
             },
             "get_weather": {
                 "patterns": [
-                    r"what's the weather",
-                    r"weather forecast",
-                    r"how's the weather",
-                    r"temperature today",
+                    rf"weather\s+(?:in|at|for)\s+{CITY}",
+                    rf"what's the weather(?:\s+(?:in|at|for)\b)?(?:\s+{CITY})?",
+                    rf"weather forecast(?:\s+(?:in|at|for)\b)?(?:\s+{CITY})?",
+                    rf"how's the weather(?:\s+(?:in|at|for)\b)?(?:\s+{CITY})?",
+                    rf"temperature today(?:\s+(?:in|at|for)\b)?(?:\s+{CITY})?",
                     r"मौसम कैसा है",
                     r"आज का मौसम",
                     r"ತಾಪಮಾನ ಎಷ್ಟು",
                 ],
+                "slots": [rf"\b(?:in|at|for)\s+{CITY}"],
                 "keywords": ["weather", "temperature", "forecast"]
             },
             # Add these patterns to the load_intents() method in CommandProcessor class
@@ -317,19 +300,19 @@ class CommandProcessor:
         }
     
     def preprocess_text(self, text):
-        """Clean and normalize text"""
+        """Clean and normalize text, plus its content tokens (tokenised on demand)"""
         text = text.lower().strip()
-        tokens = self.word_tokenize(text)
         
         # Remove stop words but keep important ones for commands
         important_words = {'open', 'close', 'send', 'read', 'create', 'find'}
-        tokens = [w for w in tokens if w not in self.stop_words or w in important_words]
+        tokens = self.tokenizer.content_tokens(text, keep=important_words)
         
         return text, tokens
     
     def detect_intent(self, text):
         """Detect command intent using pattern matching and fuzzy matching"""
-        original_text, tokens = self.preprocess_text(text)
+        # Patterns and keyword scoring work on the raw string: no tokens needed
+        original_text = text.lower().strip()
         
         best_match = {
             "intent": None,
@@ -337,101 +320,134 @@ class CommandProcessor:
             "entities": {}
         }
         
-        # Pattern matching (highest priority)
-        for intent_name, intent_data in self.intents.items():
-            for pattern in intent_data["patterns"]:
-                match = re.search(pattern, original_text, re.IGNORECASE)
-                if match:
-                    best_match["intent"] = intent_name
-                    best_match["confidence"] = 0.95
-                    best_match["entities"] = {f"entity_{i}": (g.strip() if g else "") for i, g in enumerate(match.groups())}
-                    return best_match
+        # Pattern matching (highest priority) - one scan over all patterns.
+        # Patterns are case-insensitive; matching the unlowered text keeps
+        # entities (messages, names) as the user said them
+        match = self.matcher.match(text.strip())
+        if match:
+            intent_name, groups, named = match
+            best_match["intent"] = intent_name
+            best_match["confidence"] = 0.95
+            best_match["entities"] = self.match_entities(named)
+            return best_match
         
-        # Keyword fuzzy matching fallback
-        for intent_name, intent_data in self.intents.items():
-            for keyword in intent_data["keywords"]:
-                ratio = fuzz.partial_ratio(keyword, original_text)
-                if ratio > 80 and ratio > best_match["confidence"] * 100:
-                    best_match["intent"] = intent_name
-                    best_match["confidence"] = ratio / 100
+        # Keyword fuzzy matching fallback (shortlisted keywords only)
+        intent_name, ratio = self.keyword_index.best_match(original_text)
+        if intent_name:
+            best_match["intent"] = intent_name
+            best_match["confidence"] = ratio / 100
         
         return best_match
     
-    def extract_entities(self, text, intent):
-        """Extract relevant entities based on intent - FIXED VERSION"""
-        entities = {}
-        
-        if intent in ("open_app", "close_app"):
-            # ✅ FIXED: Better app name extraction
-            words = text.lower().split()
-            action_words = ['open', 'close', 'launch', 'quit', 'start', 'stop', 'exit', 
-                           'tere', 'there', 'muchu', 'band', 'खोलो', 'बंद', 'ತೆರೆ', 'ಮುಚ್ಚು']
-            
-            for i, word in enumerate(words):
-                if word in action_words and i + 1 < len(words):
-                    # Get the next word as app name
-                    app_name = words[i + 1]
-                    # Remove common suffixes
-                    app_name = app_name.replace('.', '').replace(',', '')
-                    entities["app_name"] = app_name
-                    print(f"🔍 Extracted app_name: '{app_name}' from text: '{text}'")
-                    break
-        
-        elif intent == "create_reminder":
-            patterns = [
-                r"remind me to (.+?)(?: at| on| in)?\s*(.+)?",
-                r"मुझे याद दिलाओ (.+?)(?: को| में)?\s*(.+)?",
-                r"ನನಗೆ ನೆನಪಿಸು (.+?)(?: ನಲ್ಲಿ)?\s*(.+)?",
-                r"nenapisu (.+)",
-                r"yaad dilao (.+)",
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    entities["task"] = match.group(1).strip()
-                    entities["time"] = match.group(2).strip() if len(match.groups()) > 1 and match.group(2) else "later"
-                    break
+    @staticmethod
+    def match_entities(named):
+        """
+        Typed entities (app_name, contact, message, task, time, city, ...)
+        from the named groups of one pattern match; empty groups are left out
+        """
+        return {name: value.strip() for name, value in named.items() if value and value.strip()}
 
-        elif intent == "send_email":
-            match = re.search(r"to\s+(.+?)(?: saying| about| subject)?\s*(.+)?", text, re.IGNORECASE)
-            if match:
-                entities["recipient"] = match.group(1).strip()
-                entities["content"] = match.group(2).strip() if match.group(2) else ""
-        
-        elif intent == "send_whatsapp":
-            # ✅ FIXED: Better WhatsApp parsing
-            # Pattern 1: "send <message> whatsapp to <contact>"
-            match = re.search(r"send\s+(.+?)\s+(?:whatsapp|via whatsapp)\s+to\s+(.+)", text, re.IGNORECASE)
-            if match:
-                entities["message"] = match.group(1).strip()
-                entities["contact"] = match.group(2).strip()
-                print(f"🔍 WhatsApp - contact: '{entities['contact']}', message: '{entities['message']}'")
-            else:
-                # Pattern 2: "whatsapp <message> to <contact>"
-                match = re.search(r"whatsapp\s+(.+?)\s+to\s+(.+)", text, re.IGNORECASE)
-                if match:
-                    entities["message"] = match.group(1).strip()
-                    entities["contact"] = match.group(2).strip()
-                    print(f"🔍 WhatsApp - contact: '{entities['contact']}', message: '{entities['message']}'")
-                else:
-                    # Pattern 3: "message <name> on whatsapp <message>"
-                    match = re.search(r"message\s+(.+?)\s+on\s+whatsapp\s+(.+)", text, re.IGNORECASE)
-                    if match:
-                        entities["contact"] = match.group(1).strip()
-                        entities["message"] = match.group(2).strip()
-                        print(f"🔍 WhatsApp - contact: '{entities['contact']}', message: '{entities['message']}'")
-        
-        elif intent == "get_weather":
-            match = re.search(r"weather (?:in|at|for)?\s*([A-Za-z\s]+)", text, re.IGNORECASE)
-            if match:
-                entities["city"] = match.group(1).strip()
-        
+    def fill_slots(self, text, intent_name, entities):
+        """
+        Add the entities a detection left empty from the intent's "slots"
+        patterns, e.g. the city of "what's the weather like in Paris" or the
+        task of a keyword-matched "set up a reminder to buy milk"
+
+        Args:
+            text: Utterance
+            intent_name: Detected intent
+            entities: Entities already found (not modified)
+
+        Returns:
+            Entities dict
+        """
+        entities = dict(entities)
+        for compiled in self.slot_patterns.get(intent_name, ()):
+            m = compiled.search(text)
+            if m:
+                for name, value in self.match_entities(m.groupdict()).items():
+                    entities.setdefault(name, value)
         return entities
     
+    def classify_intent(self, text, prediction=None):
+        """
+        Detect intent with the trained classifier
+
+        Only that intent's patterns are searched, for their entities.
+        Returns None when there is no model or it isn't confident, so the
+        caller falls back to detect_intent.
+
+        Args:
+            text: Utterance
+            prediction: (intent, probability) already computed in a batch
+        """
+        if prediction is None:
+            if not self.classifier.is_ready():
+                return None
+            prediction = self.classifier.predict(text)
+
+        intent_name, probability = prediction
+        if intent_name in (None, UNKNOWN_INTENT) or probability < self.classifier.min_confidence:
+            return None
+
+        entities = {}
+        match = self.matcher.match_intent(text.strip(), intent_name)
+        if match:
+            entities = self.match_entities(match[2])
+
+        return {
+            "intent": intent_name,
+            "confidence": probability,
+            "entities": entities
+        }
+    
     def process_command(self, text):
-        """Main command processing pipeline"""
+        """Main command processing pipeline (memoised per normalised utterance)"""
+        cached = self.nlu_cache.get(text)
+        if cached is not None:
+            return cached
+
+        result = self._process_command_uncached(text)
+        self.nlu_cache.put(text, result)
+        return result
+    
+    def process_commands(self, texts, use_cache=True):
+        """
+        Batch version of process_command
+
+        The classifier vectorises all uncached utterances in one call.
+
+        Args:
+            texts: Utterances
+            use_cache: Read and fill the NLU cache (off for cold-path benchmarks)
+
+        Returns:
+            One result dict per utterance, in order
+        """
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            cached = self.nlu_cache.get(text) if use_cache else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        if pending and self.classifier.is_ready():
+            predictions = self.classifier.predict_many([texts[i] for i in pending])
+        else:
+            predictions = [None] * len(pending)
+
+        for i, prediction in zip(pending, predictions):
+            results[i] = self._process_command_uncached(texts[i], prediction)
+            if use_cache:
+                self.nlu_cache.put(texts[i], results[i])
+
+        return results
+    
+    def _process_command_uncached(self, text, prediction=None):
         original_text = text.strip()
-        detection = self.detect_intent(original_text)
+        detection = self.classify_intent(original_text, prediction) or self.detect_intent(original_text)
         
         result = {
             "intent": detection.get("intent"),
@@ -441,9 +457,7 @@ class CommandProcessor:
         }
         
         if result["intent"] and result["confidence"] > 0.6:
-            extracted = self.extract_entities(original_text, result["intent"])
-            extracted.update(result["entities"])
-            result["entities"] = extracted
+            result["entities"] = self.fill_slots(original_text, result["intent"], result["entities"])
             return result
         
         return {
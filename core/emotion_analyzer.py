@@ -0,0 +1,148 @@
+"""
+Emotion analyzer for LYRA Voice Assistant
+Detects the emotional tone of an utterance in English, Hindi and Kannada.
+The lexicon (data/emotion_lexicon.json) is compiled once into an
+Aho-Corasick automaton, so one pass over the text finds every keyword and
+phrase however large the lexicon grows.
+
+Lexicon format:
+    {"weights": {"keywords": 1.0, "phrases": 3.0},
+     "emotions": {"happy": {"keywords": {"en": ["glad", ["thrilled", 2.0]], ...},
+                            "phrases": {...}}, ...}}
+A term is a string (weight of its kind) or a [term, weight] pair.
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from config import EMOTION_LEXICON_PATH
+from core.aho_corasick import AhoCorasick, longest_non_overlapping
+from core.response import localize
+
+logger = logging.getLogger(__name__)
+
+NEUTRAL = 'neutral'
+DEFAULT_WEIGHTS = {'keywords': 1.0, 'phrases': 3.0}
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == '_')
+
+
+class EmotionalAnalyzer:
+    """Analyze emotional tone from text input in English, Hindi, and Kannada"""
+
+    # Empathetic replies per emotion (static, pre-synthesised at startup)
+    RESPONSES = {
+        'happy': {
+            'en': "That's wonderful! I'm so glad to hear that! 😊 How can I assist you today?",
+            'hi': "यह बहुत अच्छा है! मुझे यह सुनकर बहुत खुशी हुई! 😊 मैं आज आपकी कैसे मदद कर सकता हूं?",
+            'kn': "ಅದು ಅದ್ಭುತವಾಗಿದೆ! ಅದನ್ನು ಕೇಳಲು ನನಗೆ ತುಂಬಾ ಸಂತೋಷವಾಗಿದೆ! 😊 ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
+        },
+        'sad': {
+            'en': "I'm sorry to hear that. 😔 I'm here for you. Is there anything I can do to help or cheer you up?",
+            'hi': "मुझे यह सुनकर दुख हुआ। 😔 मैं आपके लिए यहां हूं। क्या मैं कुछ मदद कर सकता हूं या आपको खुश कर सकता हूं?",
+            'kn': "ಅದನ್ನು ಕೇಳಲು ನನಗೆ ವಿಷಾದವಾಗಿದೆ। 😔 ನಾನು ನಿಮಗಾಗಿ ಇಲ್ಲಿದ್ದೇನೆ। ನಾನು ಏನಾದರೂ ಸಹಾಯ ಮಾಡಬಹುದೇ ಅಥವಾ ನಿಮ್ಮನ್ನು ಸಂತೋಷಪಡಿಸಬಹುದೇ?"
+        },
+        'okay': {
+            'en': "Okay, got it. 👍 What would you like me to do for you?",
+            'hi': "ठीक है, समझ गया। 👍 आप चाहते हैं कि मैं आपके लिए क्या करूं?",
+            'kn': "ಸರಿ, ಅರ್ಥವಾಯಿತು। 👍 ನಾನು ನಿಮಗಾಗಿ ಏನು ಮಾಡಬೇಕೆಂದು ಬಯಸುತ್ತೀರಿ?"
+        },
+        'neutral': {
+            'en': "I'm listening. How can I help you?",
+            'hi': "मैं सुन रहा हूं। मैं आपकी कैसे मदद कर सकता हूं?",
+            'kn': "ನಾನು ಕೇಳುತ್ತಿದ್ದೇನೆ। ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
+        }
+    }
+
+    def __init__(self, lexicon_path: str = EMOTION_LEXICON_PATH):
+        """
+        Args:
+            lexicon_path: JSON lexicon (see module docstring)
+        """
+        self.lexicon_path = lexicon_path
+        self.emotions: List[str] = []
+        self.automaton = AhoCorasick()
+        self.load_lexicon(lexicon_path)
+
+    def load_lexicon(self, path: str):
+        """
+        (Re)compile the lexicon; on error the previous automaton stays in use
+
+        A term is stored once with every (emotion, weight) it carries, e.g.
+        'अच्छा' counts for both happy and okay. Latin-script terms only match
+        whole words ('ok' doesn't fire inside 'book'); Hindi and Kannada
+        terms also match inside inflected words.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lexicon = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load emotion lexicon {path}: {e}")
+            return
+
+        weights = dict(DEFAULT_WEIGHTS, **lexicon.get('weights', {}))
+        terms: Dict[str, Dict[str, float]] = {}
+        for emotion, kinds in lexicon.get('emotions', {}).items():
+            for kind, languages in kinds.items():
+                for entries in languages.values():
+                    for entry in entries:
+                        term, weight = (entry, weights.get(kind, 1.0)) if isinstance(entry, str) else entry
+                        term = term.lower().strip()
+                        scores = terms.setdefault(term, {})
+                        scores[emotion] = max(scores.get(emotion, 0.0), float(weight))
+
+        self.emotions = list(lexicon.get('emotions', {}))
+        self.automaton = AhoCorasick(
+            (term, (term, tuple(scores.items()), term.isascii())) for term, scores in terms.items()
+        )
+        self.lexicon_path = path
+        logger.info(f"Emotion lexicon compiled: {self.automaton.size} terms, {len(self.emotions)} emotions")
+
+    def analyze(self, text: str) -> Dict:
+        """
+        Score every emotion in one pass
+
+        Args:
+            text: Utterance (any of the three languages, or mixed)
+
+        Returns:
+            {'emotion': best emotion or 'neutral',
+             'scores': {emotion: summed weight},
+             'hits': [(term, emotion, weight), ...]}
+        """
+        text = (text or '').lower().strip()
+        scores = {emotion: 0.0 for emotion in self.emotions}
+        hits: List[Tuple[str, str, float]] = []
+
+        matches = []
+        for start, end, value in self.automaton.find_all(text):
+            # Latin terms must sit on word boundaries
+            if value[2] and ((start and _is_word_char(text[start - 1]))
+                             or (end < len(text) and _is_word_char(text[end]))):
+                continue
+            matches.append((start, end, value))
+
+        # A phrase hides the keywords inside it ("not good" isn't also "good")
+        for _, _, (term, term_scores, _) in longest_non_overlapping(matches):
+            for emotion, weight in term_scores:
+                scores[emotion] += weight
+                hits.append((term, emotion, weight))
+
+        best: Optional[str] = max(scores, key=scores.get) if scores else None
+        return {
+            'emotion': best if best and scores[best] > 0 else NEUTRAL,
+            'scores': scores,
+            'hits': hits,
+        }
+
+    def detect_emotion(self, text):
+        """Detect emotion from text - returns: happy, sad, okay, or neutral"""
+        return self.analyze(text)['emotion']
+
+    def get_emotional_response(self, emotion, language='en'):
+        """Get appropriate empathetic response based on emotion"""
+        responses = self.RESPONSES
+        return localize(responses.get(emotion, responses['neutral']), language)
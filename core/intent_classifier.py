@@ -0,0 +1,470 @@
+"""
+Trained intent classifier for LYRA Voice Assistant
+Character n-gram TF-IDF + logistic regression over English, Hindi, Kannada
+and romanised commands. Training data is generated from the intent patterns
+in CommandProcessor.load_intents, plus any logged or hand-labelled utterances.
+
+Usage:
+    python -m core.intent_classifier train
+    python -m core.intent_classifier train --extra data/nlu_labelled.jsonl --history
+    python -m core.intent_classifier evaluate
+    python -m core.intent_classifier evaluate --corpus data/nlu_labelled.jsonl
+"""
+
+import os
+import re
+import json
+import time
+import pickle
+import random
+import sqlite3
+import hashlib
+import logging
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import DATABASE_PATH, INTENT_MODEL_PATH, INTENT_CLASSIFIER_MIN_CONFIDENCE
+
+try:
+    import re._parser as _sre_parse  # Python 3.11+
+    import re._constants as _sre_constants
+except ImportError:
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Label for utterances that are not commands (chat, feelings, greetings)
+UNKNOWN_INTENT = "unknown"
+
+# Bumped whenever the training-data generator changes shape
+MODEL_FORMAT = 1
+
+# Stand-ins for the (.+) slots in patterns; varied so the model learns the
+# command words around a slot rather than the slot contents
+SLOT_FILLERS = [
+    "chrome", "calculator", "notepad", "spotify", "rahul", "amma", "priya",
+    "the meeting", "buy milk", "5 pm", "tomorrow morning", "mysore",
+    "project report", "hello", "good morning", "report.pdf", "my notes",
+    "ಔಷಧಿ", "ಹಾಲು", "ಅಮ್ಮ", "ಬೆಂಗಳೂರು", "दवा", "दूध", "मम्मी", "दिल्ली",
+]
+
+# Non-command utterances, so the model has somewhere to put chat
+UNKNOWN_SAMPLES = [
+    "how are you", "thank you", "thanks a lot", "i am feeling happy today",
+    "i am so tired", "i feel sad", "what is your name", "who are you",
+    "hello there", "good night", "that is great", "you are awesome",
+    "i love this song", "nothing", "never mind", "okay",
+    "आप कैसे हैं", "धन्यवाद", "मैं बहुत खुश हूँ", "मुझे दुख है", "तुम्हारा नाम क्या है",
+    "नमस्ते", "शुभ रात्रि", "ठीक है",
+    "ನೀವು ಹೇಗಿದ್ದೀರಿ", "ಧನ್ಯವಾದಗಳು", "ನನಗೆ ತುಂಬಾ ಖುಷಿಯಾಗಿದೆ", "ನನಗೆ ಸುಸ್ತಾಗಿದೆ",
+    "ನಿಮ್ಮ ಹೆಸರು ಏನು", "ನಮಸ್ಕಾರ", "ಶುಭ ರಾತ್ರಿ", "ಸರಿ",
+    "aap kaise hain", "dhanyavaad", "neevu hegiddira", "namaskara",
+]
+
+_REPEATS = (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) + tuple(
+    getattr(_sre_constants, name) for name in ("POSSESSIVE_REPEAT",) if hasattr(_sre_constants, name))
+
+
+def intents_signature(intents: Dict) -> str:
+    """Hash of the intent patterns and keywords a model was trained against"""
+    payload = json.dumps({name: {"patterns": data.get("patterns", []), "keywords": data.get("keywords", [])}
+                          for name, data in intents.items()},
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(f"{MODEL_FORMAT}:{payload}".encode("utf-8")).hexdigest()
+
+
+def _class_char(items) -> str:
+    """A character matched by a [...] class (or \\s, \\d)"""
+    for op, value in items:
+        if op == _sre_constants.CATEGORY:
+            if value == _sre_constants.CATEGORY_SPACE:
+                return " "
+            if value == _sre_constants.CATEGORY_DIGIT:
+                return "5"
+            return "a"
+        if op == _sre_constants.LITERAL:
+            return chr(value)
+        if op == _sre_constants.RANGE:
+            return chr(value[0])
+    return "x"
+
+
+def _is_wildcard(parsed) -> bool:
+    """True for the bodies of .+ / [^...]+ / [A-Za-z\\s]+ style slots"""
+    items = list(parsed)
+    if len(items) != 1:
+        return False
+    op, value = items[0]
+    if op in (_sre_constants.ANY, _sre_constants.NOT_LITERAL):
+        return True
+    if op == _sre_constants.IN:
+        return not (len(value) == 1 and value[0] == (_sre_constants.CATEGORY, _sre_constants.CATEGORY_SPACE))
+    return False
+
+
+def _render(parsed, rng: random.Random) -> str:
+    out = []
+    for op, value in parsed:
+        if op == _sre_constants.LITERAL:
+            out.append(chr(value))
+        elif op == _sre_constants.NOT_LITERAL:
+            out.append("x")
+        elif op == _sre_constants.ANY:
+            out.append(rng.choice(SLOT_FILLERS))
+        elif op == _sre_constants.IN:
+            out.append(_class_char(value))
+        elif op in _REPEATS:
+            low, high, body = value
+            if _is_wildcard(body):
+                out.append(" " + rng.choice(SLOT_FILLERS) + " ")
+                continue
+            count = low if low == high else rng.choice([low, low + 1])
+            out.extend(_render(body, rng) for _ in range(count))
+        elif op == _sre_constants.SUBPATTERN:
+            out.append(_render(value[-1], rng))
+        elif op == _sre_constants.BRANCH:
+            out.append(_render(rng.choice(value[1]), rng))
+        # Anchors, lookarounds and backreferences add no text
+
+    return "".join(out)
+
+
+def sample_pattern(pattern: str, rng: random.Random) -> Optional[str]:
+    """
+    A plausible utterance matched by an intent pattern
+
+    Slots are filled from SLOT_FILLERS, alternations and optional parts are
+    chosen at random. Returns None for patterns that can't be parsed.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    text = re.sub(r"\s+", " ", _render(parsed, rng)).strip()
+    return text or None
+
+
+def romanise(text: str, reverse_maps: List[Dict[str, str]]) -> Optional[str]:
+    """Native-script words swapped for their romanised spelling, or None if nothing changed"""
+    words = text.split()
+    changed = False
+    for i, word in enumerate(words):
+        for mapping in reverse_maps:
+            if word in mapping:
+                words[i] = mapping[word]
+                changed = True
+                break
+    return " ".join(words) if changed else None
+
+
+def reverse_romanisation(romanisation: Dict[str, str]) -> Dict[str, str]:
+    """native -> first romanised spelling listed for it"""
+    reverse = {}
+    for roman, native in romanisation.items():
+        reverse.setdefault(native, roman)
+    return reverse
+
+
+def generate_pattern_samples(command_processor, per_pattern: int = 4, seed: int = 0) -> List[Tuple[str, str, str]]:
+    """
+    Training utterances generated from the intent patterns and keywords
+
+    Returns:
+        [(text, intent, group)] where group is the pattern a sample came
+        from, so evaluation can hold whole patterns out
+    """
+    rng = random.Random(seed)
+    reverse_maps = [reverse_romanisation(command_processor.kannada_romanization),
+                    reverse_romanisation(command_processor.hindi_romanization)]
+    samples = []
+
+    for intent_name, intent_data in command_processor.intents.items():
+        for pattern in intent_data.get("patterns", []):
+            seen = set()
+            for _ in range(per_pattern):
+                text = sample_pattern(pattern, rng)
+                if not text or text in seen:
+                    continue
+                seen.add(text)
+                samples.append((text, intent_name, pattern))
+                romanised = romanise(text, reverse_maps)
+                if romanised:
+                    samples.append((romanised, intent_name, pattern))
+
+        for keyword in intent_data.get("keywords", []):
+            samples.append((keyword, intent_name, f"keyword:{keyword}"))
+
+    for text in UNKNOWN_SAMPLES:
+        samples.append((text, UNKNOWN_INTENT, f"unknown:{text}"))
+
+    return samples
+
+
+def load_labelled_samples(path: str) -> List[Tuple[str, str, str]]:
+    """
+    Hand-labelled utterances from a JSONL file
+
+    Each line needs the utterance ("text" or "utterance") and its intent
+    ("intent" or "expected_intent").
+    """
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            row = json.loads(line)
+            text = row.get("text") or row.get("utterance")
+            intent = row.get("intent") or row.get("expected_intent")
+            if text and intent:
+                samples.append((text.strip().lower(), intent, f"{path}:{line_no}"))
+    return samples
+
+
+def load_history_samples(command_processor, db_path: str = DATABASE_PATH) -> List[Tuple[str, str, str]]:
+    """
+    Logged commands from command_history, labelled by the intent patterns
+
+    Only commands a pattern matches are kept (fuzzy guesses are too noisy
+    to train on); they teach the model real phrasing around the slots.
+    """
+    if not os.path.exists(db_path):
+        return []
+
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute("SELECT DISTINCT command FROM command_history WHERE command IS NOT NULL").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not read command history: {e}")
+        return []
+
+    samples = []
+    for (command,) in rows:
+        text = command.strip().lower()
+        match = command_processor.matcher.match(text)
+        if match:
+            samples.append((text, match[0], f"history:{text}"))
+    return samples
+
+
+class IntentClassifier:
+    """
+    Vectorised first stage for intent detection
+
+    predict() returns the most likely intent and its probability. The model
+    remembers which intent patterns it was trained on and refuses to load
+    against a different set, so editing load_intents never silently pairs
+    new patterns with an old model.
+    """
+
+    def __init__(self, model_path: str = INTENT_MODEL_PATH,
+                 min_confidence: float = INTENT_CLASSIFIER_MIN_CONFIDENCE):
+        """
+        Args:
+            model_path: Pickled model file
+            min_confidence: Probability below which callers should fall back
+        """
+        self.model_path = model_path
+        self.min_confidence = min_confidence
+        self.model = None
+        self.metadata = {}
+
+    def is_ready(self) -> bool:
+        return self.model is not None
+
+    def load(self, intents: Dict) -> bool:
+        """
+        Load the persisted model if it matches the current intents
+
+        Returns:
+            True if a usable model was loaded
+        """
+        if not SKLEARN_AVAILABLE:
+            logger.info("scikit-learn not installed; intent classifier disabled")
+            return False
+        if not self.model_path or not os.path.exists(self.model_path):
+            logger.info("No trained intent model; run: python -m core.intent_classifier train")
+            return False
+
+        try:
+            with open(self.model_path, "rb") as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load intent model {self.model_path}: {e}")
+            return False
+
+        if payload.get("signature") != intents_signature(intents):
+            print("⚠️ Intent model is out of date with the intent patterns; "
+                  "retrain with: python -m core.intent_classifier train")
+            return False
+
+        self.model = payload["model"]
+        self.metadata = {key: value for key, value in payload.items() if key != "model"}
+        logger.info(f"Intent classifier loaded ({self.metadata.get('samples', '?')} training samples)")
+        return True
+
+    def train(self, samples: Iterable[Tuple[str, str, str]], intents: Dict):
+        """
+        Fit a fresh model
+
+        Args:
+            samples: (text, intent, group) tuples
+            intents: Intent definitions the samples were generated from
+        """
+        if not SKLEARN_AVAILABLE:
+            raise RuntimeError("scikit-learn is required to train the intent classifier")
+
+        samples = list(samples)
+        texts = [text for text, _, _ in samples]
+        labels = [intent for _, intent, _ in samples]
+
+        self.model = build_pipeline()
+        self.model.fit(texts, labels)
+        self.metadata = {
+            "signature": intents_signature(intents),
+            "format": MODEL_FORMAT,
+            "samples": len(samples),
+            "intents": sorted(set(labels)),
+            "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def save(self, path: Optional[str] = None):
+        """Pickle the model alongside its metadata"""
+        path = path or self.model_path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(dict(self.metadata, model=self.model), f)
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """
+        Most likely intent for one utterance
+
+        Returns:
+            (intent name or None if no model, probability 0-1)
+        """
+        return self.predict_many([text])[0]
+
+    def predict_many(self, texts: List[str]) -> List[Tuple[Optional[str], float]]:
+        """Vectorise and classify a batch of utterances in one call"""
+        if self.model is None:
+            return [(None, 0.0) for _ in texts]
+        if not texts:
+            return []
+
+        probabilities = self.model.predict_proba([text.lower() for text in texts])
+        classes = self.model.classes_
+        best = probabilities.argmax(axis=1)
+        return [(str(classes[index]), float(row[index])) for row, index in zip(probabilities, best)]
+
+
+def build_pipeline():
+    """char_wb n-grams cope with mixed scripts, romanisation and ASR misspellings alike"""
+    return Pipeline([
+        ("tfidf", TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True, min_df=1)),
+        ("clf", LogisticRegression(C=10.0, max_iter=2000)),
+    ])
+
+
+def collect_samples(command_processor, args) -> List[Tuple[str, str, str]]:
+    samples = generate_pattern_samples(command_processor, per_pattern=args.per_pattern, seed=args.seed)
+    for path in args.extra or []:
+        extra = load_labelled_samples(path)
+        print(f"📄 {len(extra)} labelled utterances from {path}")
+        samples.extend(extra)
+    if args.history:
+        history = load_history_samples(command_processor)
+        print(f"🗂️ {len(history)} utterances from command history")
+        samples.extend(history)
+    return samples
+
+
+def report(labels: List[str], predicted: List[str]):
+    from sklearn.metrics import accuracy_score, classification_report
+    print(f"\n🎯 Accuracy: {accuracy_score(labels, predicted):.1%} on {len(labels)} utterances\n")
+    print(classification_report(labels, predicted, zero_division=0))
+
+
+def run_train(command_processor, args):
+    samples = collect_samples(command_processor, args)
+    classifier = IntentClassifier(model_path=args.output)
+    start = time.perf_counter()
+    classifier.train(samples, command_processor.intents)
+    elapsed = time.perf_counter() - start
+    classifier.save()
+    print(f"✅ Trained on {len(samples)} utterances ({len(classifier.metadata['intents'])} intents) "
+          f"in {elapsed:.2f}s -> {args.output}")
+
+
+def run_evaluate(command_processor, args):
+    if args.corpus:
+        # Score the saved model on labelled utterances
+        classifier = IntentClassifier(model_path=args.output)
+        if not classifier.load(command_processor.intents):
+            print("❌ No usable model; train one first")
+            return
+        rows = load_labelled_samples(args.corpus)
+        texts = [text for text, _, _ in rows]
+        labels = [intent for _, intent, _ in rows]
+        start = time.perf_counter()
+        predicted = [intent for intent, _ in classifier.predict_many(texts)]
+        elapsed = time.perf_counter() - start
+        report(labels, predicted)
+        print(f"⚡ {len(texts) / elapsed:.0f} utterances/s (batched)")
+        return
+
+    # Hold out whole patterns, so the score reflects unseen phrasings
+    from sklearn.model_selection import GroupShuffleSplit
+    samples = collect_samples(command_processor, args)
+    texts = [text for text, _, _ in samples]
+    labels = [intent for _, intent, _ in samples]
+    groups = [group for _, _, group in samples]
+    splitter = GroupShuffleSplit(n_splits=1, test_size=args.test_size, random_state=args.seed)
+    train_index, test_index = next(splitter.split(texts, labels, groups))
+
+    classifier = IntentClassifier()
+    classifier.train([samples[i] for i in train_index], command_processor.intents)
+    predicted = [intent for intent, _ in classifier.predict_many([texts[i] for i in test_index])]
+    report([labels[i] for i in test_index], predicted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train or evaluate LYRA's intent classifier")
+    parser.add_argument("command", choices=["train", "evaluate"])
+    parser.add_argument("--extra", action="append", metavar="JSONL",
+                        help="labelled utterances to add to the training data (repeatable)")
+    parser.add_argument("--history", action="store_true",
+                        help="also train on pattern-matched commands from command_history")
+    parser.add_argument("--corpus", metavar="JSONL", help="evaluate the saved model on this labelled file")
+    parser.add_argument("--output", default=INTENT_MODEL_PATH, help="model file")
+    parser.add_argument("--per-pattern", type=int, default=4, help="utterances generated per pattern")
+    parser.add_argument("--test-size", type=float, default=0.2, help="share of patterns held out")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not SKLEARN_AVAILABLE:
+        print("❌ scikit-learn is not installed (pip install -r requirements.txt)")
+        return
+
+    from core.command_processor import CommandProcessor
+    command_processor = CommandProcessor()
+
+    if args.command == "train":
+        run_train(command_processor, args)
+    else:
+        run_evaluate(command_processor, args)
+
+
+if __name__ == "__main__":
+    main()
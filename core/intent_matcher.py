@@ -0,0 +1,134 @@
+"""
+Precompiled intent matcher for LYRA Voice Assistant
+Compiles every intent pattern once at load time and dispatches on a
+required literal, so only patterns that can possibly match are searched
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import re._parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+logger = logging.getLogger(__name__)
+
+# Shortest literal worth dispatching on; shorter ones filter almost nothing
+MIN_LITERAL_LENGTH = 2
+
+
+def required_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """
+    Longest run of literal characters every match of the pattern must contain
+
+    Only top-level literals are considered (nothing inside groups, branches
+    or repeats), so the result is never a false requirement.
+
+    Returns:
+        Case-folded literal, or None if the pattern has no usable literal
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+
+    best, run = '', []
+    for op, value in list(parsed) + [(None, None)]:
+        if op == _sre_parse.LITERAL:
+            run.append(chr(value))
+            continue
+        candidate = ''.join(run)
+        if len(candidate) > len(best):
+            best = candidate
+        run = []
+
+    best = best.casefold()
+    return best if len(best.strip()) >= MIN_LITERAL_LENGTH else None
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-fold text the way IGNORECASE compares it
+
+    casefold() already maps 'ſ' -> 's' and 'K' (Kelvin) -> 'k'; dotless 'ı'
+    also matches 'i' under re.IGNORECASE, so map it explicitly.
+    """
+    return text.casefold().replace('ı', 'i')
+
+
+class IntentMatcher:
+    """
+    Drop-in replacement for:
+
+        for intent in intents:
+            for pattern in intent["patterns"]:
+                if re.search(pattern, text, flags): return intent, match.groups()
+
+    Patterns are compiled once (no reliance on re's internal cache, which
+    thrashes once there are more than a few hundred patterns) and each
+    carries the literal it cannot match without. Per utterance, a pattern
+    is only searched if its literal occurs in the text. Priority order and
+    match results are exactly those of the loop above.
+    """
+
+    def __init__(self, intents: Dict, flags: int = re.IGNORECASE):
+        """
+        Args:
+            intents: {intent_name: {"patterns": [...], ...}} in priority order
+            flags: Regex flags applied to every pattern
+        """
+        self.flags = flags
+        # (intent name, compiled pattern, required literal or None)
+        self.entries: List[Tuple[str, re.Pattern, Optional[str]]] = []
+        # intent name -> its entries, for match_intent
+        self.by_intent: Dict[str, List[Tuple[str, re.Pattern, Optional[str]]]] = {}
+
+        for intent_name, intent_data in intents.items():
+            for pattern in intent_data["patterns"]:
+                compiled = re.compile(pattern, flags)
+                entry = (intent_name, compiled, required_literal(pattern, flags))
+                self.entries.append(entry)
+                self.by_intent.setdefault(intent_name, []).append(entry)
+
+        self.fold = bool(flags & re.IGNORECASE)
+        self.searches = 0  # regex searches actually run (for benchmarks)
+
+        with_literal = sum(1 for _, _, literal in self.entries if literal)
+        logger.info(f"Intent matcher compiled: {len(self.entries)} patterns "
+                    f"({with_literal} with a dispatch literal)")
+
+    def match(self, text: str) -> Optional[Tuple[str, Tuple[Optional[str], ...], Dict[str, Optional[str]]]]:
+        """
+        Find the highest-priority pattern that occurs in the text
+
+        Args:
+            text: Utterance
+
+        Returns:
+            (intent name, positional groups, named groups) or None
+        """
+        return self._search(self.entries, text)
+
+    def match_intent(self, text: str, intent_name: str) -> Optional[Tuple[str, Tuple[Optional[str], ...], Dict[str, Optional[str]]]]:
+        """
+        Like match(), but only tries one intent's patterns
+
+        Used once the intent is already known (e.g. from the classifier)
+        and the patterns are only needed for their groups.
+        """
+        return self._search(self.by_intent.get(intent_name, ()), text)
+
+    def _search(self, entries, text: str):
+        key = fold_text(text) if self.fold else text
+
+        for intent_name, compiled, literal in entries:
+            if literal is not None and literal not in key:
+                continue
+            self.searches += 1
+            m = compiled.search(text)
+            if m:
+                return intent_name, m.groups(), m.groupdict()
+
+        return None
@@ -0,0 +1,111 @@
+"""
+Keyword index for LYRA's fuzzy intent fallback
+Inverted character index over intent keywords, so fuzz.partial_ratio only
+runs on keywords that could possibly score above the threshold
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from thefuzz import fuzz
+
+logger = logging.getLogger(__name__)
+
+# rapidfuzz ships with thefuzz >= 0.20 and can score a whole shortlist in one call
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+class KeywordIndex:
+    """
+    Same result as:
+
+        for intent in intents:
+            for keyword in intent["keywords"]:
+                ratio = fuzz.partial_ratio(keyword, text)
+                if ratio > threshold and ratio > best: best, winner = ratio, intent
+
+    partial_ratio compares the shorter string (length m) with windows of the
+    longer one and scores 2*LCS / (m + window). The LCS can't exceed the
+    number of characters the two strings share (multiset overlap), which
+    caps the score at 2*overlap / (m + overlap). Anything scoring over 80
+    (thefuzz rounds, so >= 80.5) therefore needs overlap >= 2/3 * m.
+    Keywords below that are skipped without being scored.
+    """
+
+    def __init__(self, intents: Dict, threshold: int = 80):
+        """
+        Args:
+            intents: {intent_name: {"keywords": [...], ...}} in priority order
+            threshold: Score a keyword must exceed (same as detect_intent)
+        """
+        self.threshold = threshold
+        # Keyword slots in original iteration order
+        self.keywords: List[Tuple[str, str]] = []
+        self.lengths: List[int] = []
+        # char -> [(keyword slot, count of char in keyword)]
+        self.index: Dict[str, List[Tuple[int, int]]] = {}
+
+        for intent_name, intent_data in intents.items():
+            for keyword in intent_data.get("keywords", []):
+                slot = len(self.keywords)
+                self.keywords.append((intent_name, keyword))
+                self.lengths.append(len(keyword))
+                for char, count in Counter(keyword).items():
+                    self.index.setdefault(char, []).append((slot, count))
+
+        self.scored = 0  # partial_ratio evaluations actually run (for benchmarks)
+
+    def shortlist(self, text: str) -> List[int]:
+        """
+        Keyword slots that can still score above the threshold
+
+        Returns:
+            Slots in original order
+        """
+        if not text:
+            return []
+
+        overlap = [0] * len(self.keywords)
+        for char, text_count in Counter(text).items():
+            for slot, keyword_count in self.index.get(char, ()):
+                overlap[slot] += keyword_count if keyword_count < text_count else text_count
+
+        text_length = len(text)
+        return [slot for slot, shared in enumerate(overlap)
+                if shared and 3 * shared >= 2 * min(self.lengths[slot], text_length)]
+
+    def best_match(self, text: str) -> Tuple[Optional[str], int]:
+        """
+        Highest-scoring intent by keyword fuzzy match
+
+        Args:
+            text: Utterance (already pre-processed by the caller)
+
+        Returns:
+            (intent name or None, score 0-100)
+        """
+        slots = self.shortlist(text)
+        if not slots:
+            return None, 0
+
+        self.scored += len(slots)
+        candidates = [self.keywords[slot][1] for slot in slots]
+
+        if RAPIDFUZZ_AVAILABLE:
+            # One vectorised call; rounded like thefuzz does
+            scores = [int(round(row[0])) for row in
+                      rf_process.cdist(candidates, [text], scorer=rf_fuzz.partial_ratio)]
+        else:
+            scores = [fuzz.partial_ratio(keyword, text) for keyword in candidates]
+
+        best_intent, best_score = None, 0
+        for slot, score in zip(slots, scores):
+            if score > self.threshold and score > best_score:
+                best_intent, best_score = self.keywords[slot][0], score
+
+        return best_intent, best_score
@@ -10,6 +10,9 @@ import logging
 import unicodedata
 from typing import Optional, List, Dict, Tuple
 
+from core.script_profile import ScriptProfile, profile_text
+from core.transliteration import TRANSLITERATOR, to_english
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,13 +26,6 @@ class MultilingualTextProcessor:
     """
     
     def __init__(self):
-        # Language detection patterns (Unicode ranges)
-        self.lang_patterns = {
-            'kn': re.compile(r'[\u0C80-\u0CFF]'),  # Kannada Unicode range
-            'hi': re.compile(r'[\u0900-\u097F]'),  # Devanagari (Hindi) Unicode range
-            'en': re.compile(r'[a-zA-Z]')          # English (Latin alphabet)
-        }
-        
         # Language names for logging
         self.lang_names = {
             'en': 'English',
@@ -38,50 +34,16 @@ class MultilingualTextProcessor:
         }
         
         # Phonetic keyword mapping for romanized ASR output
-        # Maps common romanized words to English equivalents
-        self.phonetic_map = {
-            # App names
-            'calculator': 'calculator',
-            'calc': 'calculator',
-            'kalkulater': 'calculator',
-            'kalkulator': 'calculator',
-            
-            'notepad': 'notepad',
-            'nota': 'notepad',
-            'notpad': 'notepad',
-            'note': 'notepad',
-            'pad': 'notepad',
-            
-            'browser': 'browser',
-            'brove': 'browser',
-            'brave': 'brave',
-            'brav': 'brave',
-            'chrome': 'chrome',
-            'krom': 'chrome',
-            
-            # Actions
-            'open': 'open',
-            'therey': 'open',
-            'tere': 'open',
-            'kholo': 'open',
-            'kolo': 'open',
-            
-            'close': 'close',
-            'band': 'close',
-            'bund': 'close',
-            
-            # Common words
-            'please': 'please',
-            'dayavittu': 'please',
-            'kripya': 'please',
-        }
+        # Single-word view of the shared transliteration rules (romanised -> English)
+        self.phonetic_map = TRANSLITERATOR.word_map('en')
     
-    def detect_language(self, text: str) -> str:
+    def detect_language(self, text: str, profile: Optional[ScriptProfile] = None) -> str:
         """
         Robust language detection from text using character analysis
         
         Args:
             text: Input text
+            profile: ScriptProfile of the text, if the caller already has one
             
         Returns:
             Language code: 'en', 'hi', or 'kn'
@@ -89,45 +51,19 @@ class MultilingualTextProcessor:
         if not text or not text.strip():
             return 'en'
         
-        text = text.strip()
-        
-        # Count characters for each language
-        counts = {'kn': 0, 'hi': 0, 'en': 0}
-        total_chars = 0
-        
-        for char in text:
-            # Skip whitespace and punctuation
-            if char.isspace() or not char.isalnum():
-                continue
-                
-            total_chars += 1
-            
-            # Check which language this character belongs to
-            for lang, pattern in self.lang_patterns.items():
-                if pattern.match(char):
-                    counts[lang] += 1
-                    break
+        profile = profile or profile_text(text)
         
         # If very short or no alphanumeric characters, default to English
-        if total_chars < 2:
+        if profile.total < 2:
             logger.debug(f"Text too short for language detection: '{text}'")
             return 'en'
         
-        # Calculate percentages
-        percentages = {lang: (count / total_chars * 100) if total_chars > 0 else 0 
-                      for lang, count in counts.items()}
-        
-        # Get language with highest percentage
-        detected_lang = max(percentages, key=percentages.get)
-        detected_percentage = percentages[detected_lang]
-        
         # Require at least 30% of characters to be from detected language
         # This prevents misdetection on mixed or ambiguous text
-        if detected_percentage < 30:
-            logger.debug(f"No clear language winner (max: {detected_percentage:.1f}%), defaulting to English")
-            return 'en'
+        detected_lang = profile.dominant(min_chars=2, min_ratio=0.3)
+        percentages = {lang: ratio * 100 for lang, ratio in profile.ratios.items()}
         
-        logger.info(f"Detected language: {self.lang_names[detected_lang]} ({detected_percentage:.1f}% confidence)")
+        logger.info(f"Detected language: {self.lang_names[detected_lang]} ({percentages[detected_lang]:.1f}% confidence)")
         logger.debug(f"Language distribution: {percentages}")
         
         return detected_lang
@@ -229,12 +165,13 @@ class MultilingualTextProcessor:
         
         return keywords
     
-    def detect_mixed_language(self, text: str) -> Dict[str, float]:
+    def detect_mixed_language(self, text: str, profile: Optional[ScriptProfile] = None) -> Dict[str, float]:
         """
         Detect if text contains mixed languages and their proportions
         
         Args:
             text: Input text
+            profile: ScriptProfile of the text, if the caller already has one
             
         Returns:
             Dictionary with language percentages
@@ -242,34 +179,12 @@ class MultilingualTextProcessor:
         if not text or not text.strip():
             return {'en': 100.0}
         
-        text = text.strip()
-        
-        # Count characters for each language
-        counts = {'kn': 0, 'hi': 0, 'en': 0}
-        total_chars = 0
-        
-        for char in text:
-            if char.isspace() or not char.isalnum():
-                continue
-                
-            total_chars += 1
-            
-            for lang, pattern in self.lang_patterns.items():
-                if pattern.match(char):
-                    counts[lang] += 1
-                    break
-        
-        if total_chars == 0:
+        profile = profile or profile_text(text)
+        if profile.total == 0:
             return {'en': 100.0}
         
-        # Calculate percentages
-        percentages = {lang: (count / total_chars * 100) 
-                      for lang, count in counts.items()}
-        
         # Filter out languages with 0%
-        percentages = {lang: pct for lang, pct in percentages.items() if pct > 0}
-        
-        return percentages
+        return {lang: ratio * 100 for lang, ratio in profile.ratios.items() if ratio > 0}
     
     def normalize_phonetic(self, text: str) -> str:
         """
@@ -286,18 +201,8 @@ class MultilingualTextProcessor:
             return ""
         
         text = text.lower().strip()
-        words = text.split()
-        normalized_words = []
-        
-        for word in words:
-            # Check if word is in phonetic map
-            if word in self.phonetic_map:
-                normalized_words.append(self.phonetic_map[word])
-            else:
-                # Keep original word
-                normalized_words.append(word)
-        
-        result = ' '.join(normalized_words)
+        # Longest match, so phrases like "samaya enu" win over single words
+        result = to_english(text)
         logger.info(f"Phonetic normalization: '{text}' -> '{result}'")
         return result
     
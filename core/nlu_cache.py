@@ -0,0 +1,104 @@
+"""
+NLU result cache for LYRA Voice Assistant
+Memoises CommandProcessor.process_command per normalised utterance, so
+repeated commands skip tokenisation, matching, fuzzy scoring and entity
+extraction. Cleared whenever intents or custom commands change.
+"""
+
+import re
+import copy
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NLUCache:
+    """
+    LRU of process_command results keyed by normalised text
+
+    Results are copied in and out, so callers may modify what they get
+    back without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Args:
+            max_entries: Utterances kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Cache key for an utterance
+
+        NFC with whitespace collapsed: "open  chrome" and "open chrome"
+        share a key. Case and punctuation are kept, because entities keep
+        them ("message Rahul on whatsapp Hi." must not get the cached
+        result of "message rahul on whatsapp hi").
+        """
+        text = unicodedata.normalize('NFC', text)
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def get(self, text: str) -> Optional[Dict]:
+        """
+        Cached result for an utterance
+
+        Returns:
+            Copy of the stored result with original_text set to this
+            utterance, or None on a miss
+        """
+        key = self.normalize(text)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        result = copy.deepcopy(result)
+        result["original_text"] = text.strip()
+        return result
+
+    def put(self, text: str, result: Dict):
+        """Store a process_command result"""
+        key = self.normalize(text)
+        if not key:
+            return
+        with self._lock:
+            self._entries[key] = copy.deepcopy(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self, reason: str = ""):
+        """Drop every entry (intents or custom commands changed)"""
+        with self._lock:
+            dropped = len(self._entries)
+            self._entries.clear()
+            if dropped:
+                self.invalidations += 1
+        if dropped:
+            logger.info(f"NLU cache cleared ({dropped} entries){': ' + reason if reason else ''}")
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._entries),
+            'invalidations': self.invalidations,
+        }
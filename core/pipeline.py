@@ -0,0 +1,107 @@
+"""
+Staged text pipeline for LYRA Voice Assistant
+process_text is a fixed sequence of stages sharing one UtteranceContext:
+each stage runs at most once per utterance and is timed
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same bar process_command and the router use for "this is a command"
+COMMAND_CONFIDENCE = 0.6
+
+
+class UtteranceContext:
+    """Everything known about one utterance as it moves through the stages"""
+
+    def __init__(self, text: str, user_id=None, language: Optional[str] = None):
+        """
+        Args:
+            text: Recognised or typed text
+            user_id: Current profile (custom commands are per user)
+            language: UI language, used if detection has nothing to go on
+        """
+        self.original_text = text.strip()
+        self.user_id = user_id
+        self.language = language
+        self.detected_language = 'en'
+        self.script_profile = None  # ScriptProfile of original_text (per-script ratios, token tags)
+
+        self.processing_text = self.original_text  # English text for NLU
+        self.translation = None  # Future while a translation is in flight
+        self.emotion = 'neutral'
+        self.nlu = None  # process_command result, computed once
+        self.response = None  # Set by the stage that answers
+
+        self.timings = OrderedDict()  # stage name -> seconds
+
+    @property
+    def is_command(self) -> bool:
+        """NLU found a confident intent"""
+        return bool(self.nlu and self.nlu.get('intent') not in (None, 'unknown')
+                    and self.nlu.get('confidence', 0) > COMMAND_CONFIDENCE)
+
+    def timing_summary(self) -> str:
+        return ' · '.join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in self.timings.items())
+
+
+class Pipeline:
+    """
+    Runs stages in order until one sets context.response, then the
+    finalisers (which always run). A stage is a callable taking the context.
+    Cumulative per-stage timings are kept for metrics.
+    """
+
+    def __init__(self, stages: List[Tuple[str, Callable]], finalizers: List[Tuple[str, Callable]] = ()):
+        """
+        Args:
+            stages: (name, callable) in execution order
+            finalizers: (name, callable) run after the stages, even on early exit
+        """
+        self.stages = list(stages)
+        self.finalizers = list(finalizers)
+        self._lock = threading.Lock()
+        self._totals: Dict[str, List[float]] = {name: [0, 0.0] for name, _ in self.stages + self.finalizers}
+        self.utterances = 0
+
+    def run(self, context: UtteranceContext) -> UtteranceContext:
+        for name, stage in self.stages:
+            if context.response is not None:
+                break
+            self._timed(name, stage, context)
+
+        for name, finalizer in self.finalizers:
+            self._timed(name, finalizer, context)
+
+        with self._lock:
+            self.utterances += 1
+        return context
+
+    def _timed(self, name: str, stage: Callable, context: UtteranceContext):
+        if name in context.timings:
+            raise RuntimeError(f"Pipeline stage '{name}' ran twice for one utterance")
+
+        start = time.perf_counter()
+        try:
+            stage(context)
+        finally:
+            elapsed = time.perf_counter() - start
+            context.timings[name] = elapsed
+            with self._lock:
+                total = self._totals[name]
+                total[0] += 1
+                total[1] += elapsed
+
+    def get_stats(self) -> Dict:
+        """Per-stage run counts and mean latency (ms)"""
+        with self._lock:
+            return {
+                'utterances': self.utterances,
+                'stages': {name: {'runs': runs, 'mean_ms': (seconds / runs * 1000) if runs else 0.0}
+                           for name, (runs, seconds) in self._totals.items()},
+            }
@@ -0,0 +1,50 @@
+"""
+Language-aware responses for LYRA Voice Assistant
+A Response is a plain str that also remembers which language it is in,
+so the assistant only translates replies that are genuinely English-only
+"""
+
+from typing import Dict
+
+
+class Response(str):
+    """
+    str subclass carrying the language of the reply
+
+    Plain str values returned by feature modules are treated as English.
+    """
+
+    def __new__(cls, text: str, language: str = 'en'):
+        obj = super().__new__(cls, text)
+        obj.language = language
+        return obj
+
+    def __repr__(self):
+        return f"Response({str.__repr__(self)}, language={self.language!r})"
+
+
+def localize(messages: Dict[str, str], language: str) -> Response:
+    """
+    Pick a reply from a {language: text} dict
+
+    Args:
+        messages: Hand-written replies keyed by language code (must contain 'en')
+        language: Requested language code
+
+    Returns:
+        Response in the requested language, or the English reply
+        (marked as English, so it gets translated) if none exists
+    """
+    if language in messages:
+        return Response(messages[language], language)
+    return Response(messages['en'], 'en')
+
+
+def response_language(response: str) -> str:
+    """Language of a reply (plain str is assumed to be English)"""
+    return getattr(response, 'language', 'en')
+
+
+def needs_translation(response: str, language: str) -> bool:
+    """True if the reply is not already in the requested language"""
+    return bool(response) and response_language(response) != language
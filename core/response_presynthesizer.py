@@ -0,0 +1,144 @@
+"""
+Background pre-synthesis of LYRA's static replies
+Renders the fixed en/hi/kn response catalogue into the TTS audio cache
+at low priority (e.g. while Whisper is loading) so common replies play instantly
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import TTS_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+def collect_static_responses(*catalogues: Dict, languages: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+    """
+    Flatten response catalogues into unique (text, language) pairs
+
+    Each catalogue maps a response key to a {language: text} dict, e.g.
+    {'ask_app_open': {'en': "Which app...", 'hi': "...", 'kn': "..."}}.
+    Entries that still contain format placeholders are skipped.
+
+    Args:
+        catalogues: Response catalogues to collect from
+        languages: Languages to keep, in priority order (default: en, hi, kn)
+
+    Returns:
+        List of (text, language) pairs, highest-priority language first
+    """
+    languages = languages or ['en', 'hi', 'kn']
+    seen = set()
+    by_language = {lang: [] for lang in languages}
+
+    for catalogue in catalogues:
+        for translations in catalogue.values():
+            for lang, text in translations.items():
+                if lang not in by_language or not text or '{' in text:
+                    continue
+                if (text, lang) in seen:
+                    continue
+                seen.add((text, lang))
+                by_language[lang].append((text, lang))
+
+    entries = []
+    for lang in languages:
+        entries.extend(by_language[lang])
+    return entries
+
+
+class ResponsePreSynthesizer:
+    """
+    Low-priority background job that fills the TTS cache
+
+    - Skips replies that are already cached
+    - Backs off while the assistant is speaking
+    - Stops when the cache reaches its disk budget
+    - Can be interrupted at any time with stop()
+    """
+
+    def __init__(self, tts_engine, entries: Iterable[Tuple[str, str]],
+                 max_bytes: int = TTS_CACHE_MAX_BYTES, item_delay: float = 0.05):
+        """
+        Args:
+            tts_engine: TTSEngine whose cache should be filled
+            entries: (text, language) pairs to synthesise, in priority order
+            max_bytes: Disk budget for the audio cache
+            item_delay: Pause between items (seconds) to stay out of the way
+        """
+        self.tts = tts_engine
+        self.entries = list(entries)
+        self.max_bytes = max_bytes
+        self.item_delay = item_delay
+
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.synthesized = 0
+        self.skipped = 0
+
+    def start(self):
+        """Start the background job (no-op if already running)"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="tts-presynthesis", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Interrupt the job; the current item finishes, nothing new starts"""
+        self.stop_event.set()
+        if self.thread and timeout is not None:
+            self.thread.join(timeout=timeout)
+
+    def is_running(self) -> bool:
+        """Check if the job is still working"""
+        return bool(self.thread and self.thread.is_alive())
+
+    def _lower_thread_priority(self):
+        """Best-effort niceness for this thread (per-thread on Linux)"""
+        try:
+            if hasattr(os, 'setpriority') and hasattr(threading, 'get_native_id'):
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+        except (OSError, AttributeError):
+            pass
+
+    def _run(self):
+        self._lower_thread_priority()
+
+        cache_size = self.tts.get_cache_size()
+        logger.info(f"Pre-synthesising {len(self.entries)} static replies "
+                    f"(cache {cache_size // 1024} KB / {self.max_bytes // 1024} KB)")
+
+        for text, lang in self.entries:
+            if self.stop_event.is_set():
+                logger.info("Pre-synthesis interrupted")
+                break
+
+            if self.tts.get_cached_audio(text, lang):
+                self.skipped += 1
+                continue
+
+            if cache_size >= self.max_bytes:
+                logger.info("TTS cache disk budget reached, stopping pre-synthesis")
+                break
+
+            # Never compete with live speech
+            while self.tts.speaking.is_set() and not self.stop_event.is_set():
+                self.stop_event.wait(0.2)
+            if self.stop_event.is_set():
+                break
+
+            path = self.tts.synthesize_to_cache(text, lang)
+            if path:
+                self.synthesized += 1
+                try:
+                    cache_size += os.path.getsize(path)
+                except OSError:
+                    pass
+
+            self.stop_event.wait(self.item_delay)
+
+        logger.info(f"Pre-synthesis finished: {self.synthesized} new, {self.skipped} already cached")
+        print(f"[LYRA] 🔊 Pre-synthesised {self.synthesized} replies ({self.skipped} cached)")
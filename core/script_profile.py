@@ -0,0 +1,128 @@
+"""
+Script profiler for LYRA Voice Assistant
+Classifies every character of an utterance by Unicode block in one
+str.translate pass (a codepoint -> class lookup table applied in C), then
+counts classes with str.count. Gives per-script ratios for language
+detection and per-token language tags for code-mixed input.
+"""
+
+import string
+from typing import Dict, List, Optional, Tuple
+
+# Class characters written by the lookup table
+_KANNADA, _DEVANAGARI, _LATIN, _DIGIT = 'k', 'h', 'l', 'd'
+
+# Language code per script class, in tie-break order
+_LANGUAGES = (('kn', _KANNADA), ('hi', _DEVANAGARI), ('en', _LATIN))
+
+
+def _build_table() -> str:
+    """
+    Codepoint -> class lookup table for str.translate, indexed up to the
+    end of the Kannada block; unmapped codepoints map to themselves and
+    anything past the table passes through unchanged
+    """
+    table = [chr(code) for code in range(0x0D00)]
+    for code in range(0x0C80, 0x0D00):  # Kannada block
+        table[code] = _KANNADA
+    for code in range(0x0900, 0x0980):  # Devanagari block
+        table[code] = _DEVANAGARI
+    for char in string.ascii_letters:
+        table[ord(char)] = _LATIN
+    for char in string.digits:
+        table[ord(char)] = _DIGIT
+    return ''.join(table)
+
+
+# Every mapped character becomes a one-character class code, so the
+# translated string lines up with the original (same length, same spaces).
+# Unmapped characters (spaces, punctuation, other scripts) pass through;
+# Latin letters are mapped too, so a 'k' or 'h' in the output is always a class code.
+# A str table (indexed lookup) translates about twice as fast as a dict.
+_TABLE = _build_table()
+
+
+class ScriptProfile:
+    """
+    Per-script character counts of one utterance
+
+    Letters of Kannada, Devanagari and Latin script plus ASCII digits are
+    counted; everything else (spaces, punctuation, other scripts) is ignored.
+    """
+
+    __slots__ = ('text', 'counts', 'total', '_classes', '_token_tags')
+
+    def __init__(self, text: str):
+        """
+        Args:
+            text: Utterance
+        """
+        self.text = text or ''
+        self._classes = self.text.translate(_TABLE)
+        self.counts = {language: self._classes.count(code) for language, code in _LANGUAGES}
+        self.counts['digit'] = self._classes.count(_DIGIT)
+        self.total = sum(self.counts.values())
+        self._token_tags = None
+
+    @property
+    def ratios(self) -> Dict[str, float]:
+        """Share (0-1) of counted characters per language; digits count towards the total only"""
+        if not self.total:
+            return {language: 0.0 for language, _ in _LANGUAGES}
+        return {language: self.counts[language] / self.total for language, _ in _LANGUAGES}
+
+    def dominant(self, min_chars: int = 1, min_ratio: float = 0.0, default: str = 'en') -> str:
+        """
+        Language with the most characters (ties: Kannada, then Hindi, then English)
+
+        Args:
+            min_chars: Fewer counted characters than this -> default
+            min_ratio: Winner must have at least this share -> otherwise default
+            default: Returned when there is no clear winner
+        """
+        if self.total < min_chars:
+            return default
+
+        best, best_count = default, 0
+        for language, _ in _LANGUAGES:
+            if self.counts[language] > best_count:
+                best, best_count = language, self.counts[language]
+
+        if not best_count or best_count / self.total < min_ratio:
+            return default
+        return best
+
+    def token_tags(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        (token, language) per whitespace token; language is None for
+        tokens with no script letters (numbers, punctuation)
+        """
+        if self._token_tags is None:
+            tags = []
+            for token, classes in zip(self.text.split(), self._classes.split()):
+                best, best_count = None, 0
+                for language, code in _LANGUAGES:
+                    count = classes.count(code)
+                    if count > best_count:
+                        best, best_count = language, count
+                tags.append((token, best))
+            self._token_tags = tags
+        return self._token_tags
+
+    @property
+    def languages(self) -> List[str]:
+        """Languages with at least one character, in tie-break order"""
+        return [language for language, _ in _LANGUAGES if self.counts[language]]
+
+    @property
+    def is_code_mixed(self) -> bool:
+        return len(self.languages) > 1
+
+    def __repr__(self):
+        counts = ', '.join(f"{key}={value}" for key, value in self.counts.items() if value)
+        return f"ScriptProfile({counts or 'empty'})"
+
+
+def profile_text(text: str) -> ScriptProfile:
+    """Profile an utterance (cheap enough to call per utterance; share the result)"""
+    return ScriptProfile(text)
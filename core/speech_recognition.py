@@ -4,6 +4,9 @@ import whisper
 import numpy as np
 import librosa
 
+from config import ASR_N_BEST_TEMPERATURE, ASR_N_BEST_MAX_SECONDS
+from core.asr_rescorer import Hypothesis
+
 
 class SpeechRecognizer:
     """
@@ -12,6 +15,7 @@ class SpeechRecognizer:
       - Language detection (tiny)
       - Model routing (base/medium)
       - Language stability across conversations
+      - N-best alternatives for intent rescoring
     """
 
     def __init__(self):
@@ -63,6 +67,21 @@ class SpeechRecognizer:
         else:
             print(f"[WHISPER] ⚠️ Invalid language: {language}")
 
+    def _prepare_audio(self, audio_data):
+        """Mono float32 numpy audio, peak-normalised"""
+        if isinstance(audio_data, torch.Tensor):
+            audio_data = audio_data.detach().cpu().numpy()
+        
+        audio_data = np.asarray(audio_data, dtype=np.float32).flatten()
+
+        if audio_data.ndim > 1:
+            audio_data = np.mean(audio_data, axis=-1)
+
+        max_val = np.max(np.abs(audio_data))
+        if max_val > 0:
+            audio_data = audio_data / max_val
+        return audio_data
+
     def transcribe(self, audio_data, language=None):
         """
         Transcribe audio with language stability for natural conversation flow.
@@ -79,17 +98,7 @@ class SpeechRecognizer:
             # STEP 1: Clean and prepare audio
             # ═══════════════════════════════════════════════════════════
             
-            if isinstance(audio_data, torch.Tensor):
-                audio_data = audio_data.detach().cpu().numpy()
-            
-            audio_data = np.asarray(audio_data, dtype=np.float32).flatten()
-
-            if audio_data.ndim > 1:
-                audio_data = np.mean(audio_data, axis=-1)
-
-            max_val = np.max(np.abs(audio_data))
-            if max_val > 0:
-                audio_data = audio_data / max_val
+            audio_data = self._prepare_audio(audio_data)
 
             duration = len(audio_data) / self.sample_rate
             if duration < 0.8:
@@ -209,11 +218,17 @@ class SpeechRecognizer:
             if text:
                 print(f"[WHISPER] ✅ '{text}' [{model_name}]")
             
+            # Mean token log-probability over the segments: the acoustic score n-best rescoring uses
+            segments = result.get("segments") or []
+            avg_logprob = (sum(segment["avg_logprob"] for segment in segments) / len(segments)
+                           if segments else -1.0)
+            
             return {
                 "text": text,
                 "language": lang,
                 "confidence": confidence,
-                "model": model_name
+                "model": model_name,
+                "avg_logprob": avg_logprob
             }
 
         except Exception as e:
@@ -226,4 +241,57 @@ class SpeechRecognizer:
                 "language": self.recent_language or "en",
                 "confidence": 0.0,
                 "model": "error"
-            }
\ No newline at end of file
+            }
+
+    def n_best(self, audio_data, result, n):
+        """
+        Alternative transcripts for the same audio, for rescoring.
+
+        transcribe() decodes greedily and keeps one text; here the same
+        model samples n-1 more candidates in a single batched decode (one
+        30 s window, so only short utterances - ASR_N_BEST_MAX_SECONDS).
+
+        Args:
+            audio_data: The audio passed to transcribe()
+            result: What transcribe() returned for it
+            n: Hypotheses wanted, including the top one
+
+        Returns:
+            List of Hypothesis, transcribe()'s text first, duplicates removed
+        """
+        top = Hypothesis(result.get("text", ""), result.get("avg_logprob", -1.0), source="greedy")
+        model = self.models.get(result.get("model"))
+        if n <= 1 or model is None or not top.text:
+            return [top]
+
+        try:
+            audio_data = self._prepare_audio(audio_data)
+            if len(audio_data) / self.sample_rate > ASR_N_BEST_MAX_SECONDS:
+                return [top]
+
+            mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio_data)).to(self.device)
+            options = whisper.DecodingOptions(
+                task="transcribe",
+                language=result.get("language"),
+                temperature=ASR_N_BEST_TEMPERATURE,
+                without_timestamps=True,
+                fp16=True,
+            )
+            with torch.no_grad():
+                decoded = model.decode(mel.unsqueeze(0).repeat(n - 1, 1, 1), options)
+        except Exception as e:
+            print(f"[WHISPER] ⚠️ n-best decode failed: {e}")
+            return [top]
+
+        hypotheses = {top.text.lower(): top}
+        for candidate in decoded:
+            text = candidate.text.strip()
+            if not text or candidate.no_speech_prob > 0.6:
+                continue
+            key = text.lower()
+            if hypotheses.get(key) is top:
+                continue
+            # Same text sampled twice: keep its best score
+            if key not in hypotheses or candidate.avg_logprob > hypotheses[key].avg_logprob:
+                hypotheses[key] = Hypothesis(text, candidate.avg_logprob, source="sample")
+        return list(hypotheses.values())
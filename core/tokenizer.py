@@ -0,0 +1,97 @@
+"""
+Tokenizer for LYRA's NLU
+A regex word tokenizer by default. NLTK (word_tokenize and its stop-word
+corpus) is imported only the first time a caller needs tokens with the
+'nltk' backend - intent detection itself matches on the raw text and never
+tokenises, so most sessions never load NLTK at all.
+"""
+
+import re
+import logging
+import threading
+from typing import Iterable, List, Set
+
+from config import NLU_TOKENIZER
+
+logger = logging.getLogger(__name__)
+
+# A word is a run of anything but whitespace and punctuation (ASCII, danda),
+# with inner apostrophes/hyphens kept ("don't", "wi-fi"). \w can't be used:
+# Kannada/Devanagari vowel signs aren't \w, so it would split words apart.
+_WORD = r"[^\s!-/:-@\[-`{-~।॥]+"
+TOKEN_PATTERN = re.compile(rf"{_WORD}(?:['’-]{_WORD})*")
+
+# English function words dropped by content_tokens() with the regex backend
+STOP_WORDS = frozenset("""
+a an the to in on at for of by with from about into and or but so if then
+is am are was were be been being do does did have has had it its this that
+these those i me my we our you your he she they them their what which who
+please can could would will just
+""".split())
+
+
+def regex_tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens (punctuation dropped)"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class Tokenizer:
+    """
+    Tokens and stop words for one backend
+
+    'regex' - TOKEN_PATTERN and STOP_WORDS (no imports, a few µs per utterance)
+    'nltk'  - nltk.word_tokenize and NLTK's English stop words, loaded on
+              first use; falls back to 'regex' if NLTK or its data is missing
+    """
+
+    def __init__(self, backend: str = NLU_TOKENIZER):
+        """
+        Args:
+            backend: 'regex' or 'nltk'
+        """
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._nltk_loaded = False
+        self._word_tokenize = None
+        self._stop_words: Set[str] = set(STOP_WORDS)
+
+    def _ensure_backend(self):
+        if self.backend != 'nltk' or self._nltk_loaded:
+            return
+        with self._lock:
+            if self._nltk_loaded:
+                return
+            try:
+                from nltk.tokenize import word_tokenize
+                from nltk.corpus import stopwords
+                self._stop_words = set(stopwords.words('english'))
+                word_tokenize("warm up")  # Fails here, not per utterance, if punkt data is missing
+                self._word_tokenize = word_tokenize
+                logger.info("NLTK tokenizer loaded")
+            except (ImportError, LookupError) as e:
+                print(f"⚠️ NLTK not fully available, using the regex tokenizer: {e}")
+                self.backend = 'regex'
+            self._nltk_loaded = True
+
+    @property
+    def nltk_available(self) -> bool:
+        """True once NLTK has loaded (loads it if the backend is 'nltk')"""
+        self._ensure_backend()
+        return self._word_tokenize is not None
+
+    @property
+    def stop_words(self) -> Set[str]:
+        self._ensure_backend()
+        return self._stop_words
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lower-cased tokens of the text"""
+        self._ensure_backend()
+        if self._word_tokenize is not None:
+            return self._word_tokenize(text.lower())
+        return regex_tokenize(text)
+
+    def content_tokens(self, text: str, keep: Iterable[str] = ()) -> List[str]:
+        """Tokens minus stop words (words in keep are never dropped)"""
+        stop_words = self.stop_words.difference(keep)
+        return [token for token in self.tokenize(text) if token not in stop_words]
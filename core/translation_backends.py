@@ -0,0 +1,119 @@
+"""
+Translation backends for LYRA Voice Assistant
+- GoogleTranslateBackend: googletrans client (default)
+- HTTPTranslationBackend: LibreTranslate-style HTTP API, e.g. a self-hosted
+  server or the local stand-in in benchmarks/translation_server.py
+"""
+
+import json
+import logging
+import urllib.error
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+# Try to import googletrans
+try:
+    from googletrans import Translator
+    GOOGLETRANS_AVAILABLE = True
+except ImportError:
+    GOOGLETRANS_AVAILABLE = False
+    logger.warning("googletrans not available. Install with: pip install googletrans==4.0.0rc1")
+
+
+class TranslationBackend:
+    """
+    Base class for translation services
+    translate() raises on failure; retries and caching live in TranslationEngine
+    """
+
+    name = 'base'
+
+    def is_available(self) -> bool:
+        """Check if the backend can be used at all"""
+        return True
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Translate one string (may contain newlines)
+
+        Raises:
+            Exception: On any network or service error
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Recover after an error (e.g. recreate a client)"""
+        pass
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    """googletrans (unofficial Google Translate web API)"""
+
+    name = 'googletrans'
+
+    def __init__(self):
+        self.translator = None
+        if GOOGLETRANS_AVAILABLE:
+            try:
+                self.translator = Translator()
+            except Exception as e:
+                logger.error(f"Failed to initialize translator: {e}")
+
+    def is_available(self) -> bool:
+        return self.translator is not None
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        result = self.translator.translate(text, src=source_lang, dest=target_lang)
+        return result.text
+
+    def reset(self):
+        # googletrans sessions go stale after errors
+        try:
+            self.translator = Translator()
+        except Exception:
+            pass
+
+
+class HTTPTranslationBackend(TranslationBackend):
+    """
+    LibreTranslate-compatible HTTP API
+
+    POST {url} with JSON {"q", "source", "target", "format"}
+    and expects {"translatedText": "..."} back.
+    """
+
+    name = 'http'
+
+    def __init__(self, url: str, timeout: float = 5.0, api_key: str = None):
+        """
+        Args:
+            url: Endpoint, e.g. http://127.0.0.1:5005/translate
+            timeout: Socket timeout per request (seconds)
+            api_key: Optional API key (LibreTranslate "api_key" field)
+        """
+        self.url = url
+        self.timeout = timeout
+        self.api_key = api_key
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        payload = {'q': text, 'source': source_lang, 'target': target_lang, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Translation server returned HTTP {e.code}") from e
+
+        if 'translatedText' not in data:
+            raise RuntimeError(f"Unexpected translation server response: {data}")
+        return data['translatedText']
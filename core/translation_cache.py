@@ -0,0 +1,258 @@
+"""
+Two-tier translation cache for LYRA Voice Assistant
+- In-process LRU for the hot set
+- SQLite store that survives restarts
+Keys are (source, target, normalised text); successful translations and
+failures are cached separately with their own TTLs
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+import unicodedata
+import re
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import TRANSLATION_CACHE_PATH, TRANSLATION_CACHE_TTL, TRANSLATION_NEGATIVE_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# Marker stored in the in-process LRU for negative entries
+_FAILURE = object()
+
+
+class TranslationCache:
+    """
+    Persistent translation cache
+
+    Positive entries live for `ttl` seconds, negative (failed) entries for
+    `negative_ttl` seconds so a flaky network is retried soon, but not on
+    every utterance.
+    """
+
+    def __init__(self, db_path: str = TRANSLATION_CACHE_PATH, max_memory_entries: int = 1000,
+                 ttl: float = TRANSLATION_CACHE_TTL, negative_ttl: float = TRANSLATION_NEGATIVE_CACHE_TTL):
+        """
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            max_memory_entries: Size of the in-process LRU
+            ttl: Lifetime of successful translations (seconds)
+            negative_ttl: Lifetime of cached failures (seconds)
+        """
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        self._memory: "OrderedDict[Tuple[str, str, str], Tuple[object, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+
+        if self.db_path:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation cache DB unavailable, using memory only: {e}")
+                self.db_path = None
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _init_db(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translations (
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                text_key TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (source_lang, target_lang, text_key)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS translation_failures (
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                text_key TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (source_lang, target_lang, text_key)
+            )
+        ''')
+        # Drop anything that expired while LYRA was not running
+        now = time.time()
+        cursor.execute('DELETE FROM translations WHERE expires_at < ?', (now,))
+        cursor.execute('DELETE FROM translation_failures WHERE expires_at < ?', (now,))
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalise text for use as a cache key
+        NFC, case-folded, single spaces, no trailing punctuation
+        """
+        text = unicodedata.normalize('NFC', text)
+        text = re.sub(r'\s+', ' ', text.strip()).casefold()
+        return text.rstrip('.!?।')
+
+    # ------------------------------------------------------------------
+    # In-process LRU
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return value
+
+    def _memory_put(self, key, value, ttl: float):
+        with self._lock:
+            self._memory[key] = (value, time.time() + ttl)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> Tuple[Optional[str], bool]:
+        """
+        Look up a translation in both tiers
+
+        Args:
+            text: Source text
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Tuple of (translation or None, is_known_failure)
+        """
+        key = (source_lang, target_lang, self.normalize(text))
+
+        value = self._memory_get(key)
+        if value is _FAILURE:
+            self.negative_hits += 1
+            return None, True
+        if value is not None:
+            self.hits += 1
+            return value, False
+
+        if self.db_path:
+            now = time.time()
+            try:
+                conn = self._connect()
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT translation, expires_at FROM translations '
+                    'WHERE source_lang = ? AND target_lang = ? AND text_key = ? AND expires_at >= ?',
+                    (*key, now)
+                )
+                row = cursor.fetchone()
+                failure = None
+                if not row:
+                    cursor.execute(
+                        'SELECT expires_at FROM translation_failures '
+                        'WHERE source_lang = ? AND target_lang = ? AND text_key = ? AND expires_at >= ?',
+                        (*key, now)
+                    )
+                    failure = cursor.fetchone()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation cache read failed: {e}")
+                row, failure = None, None
+
+            if row:
+                self._memory_put(key, row[0], row[1] - now)
+                self.hits += 1
+                return row[0], False
+            if failure:
+                self._memory_put(key, _FAILURE, failure[0] - now)
+                self.negative_hits += 1
+                return None, True
+
+        self.misses += 1
+        return None, False
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Cached translation, or None"""
+        return self.lookup(text, source_lang, target_lang)[0]
+
+    def put(self, text: str, source_lang: str, target_lang: str, translation: str):
+        """Store a successful translation (clears any cached failure)"""
+        key = (source_lang, target_lang, self.normalize(text))
+        self._memory_put(key, translation, self.ttl)
+
+        if self.db_path:
+            try:
+                conn = self._connect()
+                cursor = conn.cursor()
+                cursor.execute(
+                    'INSERT OR REPLACE INTO translations '
+                    '(source_lang, target_lang, text_key, translation, expires_at) VALUES (?, ?, ?, ?, ?)',
+                    (*key, translation, time.time() + self.ttl)
+                )
+                cursor.execute(
+                    'DELETE FROM translation_failures WHERE source_lang = ? AND target_lang = ? AND text_key = ?',
+                    key
+                )
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation cache write failed: {e}")
+
+    def put_failure(self, text: str, source_lang: str, target_lang: str):
+        """Remember that translating this text failed (short TTL)"""
+        key = (source_lang, target_lang, self.normalize(text))
+        self._memory_put(key, _FAILURE, self.negative_ttl)
+
+        if self.db_path:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO translation_failures '
+                    '(source_lang, target_lang, text_key, expires_at) VALUES (?, ?, ?, ?)',
+                    (*key, time.time() + self.negative_ttl)
+                )
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation cache write failed: {e}")
+
+    def clear(self):
+        """Clear both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            try:
+                conn = self._connect()
+                conn.execute('DELETE FROM translations')
+                conn.execute('DELETE FROM translation_failures')
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Translation cache clear failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters for monitoring"""
+        lookups = self.hits + self.misses + self.negative_hits
+        return {
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+        }
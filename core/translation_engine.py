@@ -4,19 +4,19 @@ Handles robust translation between English, Kannada, and Hindi
 """
 
 import logging
-from typing import Optional, Dict
-from functools import lru_cache
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import Optional, Dict, List
 import time
 
-logger = logging.getLogger(__name__)
+from config import TRANSLATION_TIMEOUT, TRANSLATION_BACKEND_URL
+from core.backend_health import BackendHealth
+from core.translation_backends import (
+    TranslationBackend, GoogleTranslateBackend, HTTPTranslationBackend, GOOGLETRANS_AVAILABLE
+)
+from core.translation_cache import TranslationCache
 
-# Try to import googletrans
-try:
-    from googletrans import Translator
-    GOOGLETRANS_AVAILABLE = True
-except ImportError:
-    GOOGLETRANS_AVAILABLE = False
-    logger.warning("googletrans not available. Install with: pip install googletrans==4.0.0rc1")
+logger = logging.getLogger(__name__)
 
 
 class TranslationEngine:
@@ -25,47 +25,113 @@ class TranslationEngine:
     - Robust error handling
     - Retry logic
     - Translation validation
-    - Caching for performance
+    - Persistent two-tier cache (memory LRU + SQLite) with negative caching
+    - Per-call deadlines: slow requests finish in the background and warm the cache
+    - Pluggable backend (googletrans or an HTTP server) behind a circuit breaker
     """
     
-    def __init__(self):
-        self.translator = None
+    def __init__(self, cache: Optional[TranslationCache] = None,
+                 backend: Optional[TranslationBackend] = None):
+        """
+        Args:
+            cache: Translation cache (default: persistent cache in data/)
+            backend: Translation service (default: TRANSLATION_BACKEND_URL if set, else googletrans)
+        """
+        self.cache = cache if cache is not None else TranslationCache()
         self.supported_languages = ['en', 'hi', 'kn']
         self.max_retries = 3
         self.retry_delay = 0.5  # seconds
+        self.batch_max_chars = 4500  # googletrans rejects requests much above 5000 chars
+        self.timeout = TRANSLATION_TIMEOUT  # default latency budget per call (seconds)
         
-        if GOOGLETRANS_AVAILABLE:
-            try:
-                self.translator = Translator()
-                logger.info("✅ Translation engine initialized successfully")
-                print("✅ Translation engine initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize translator: {e}")
-                self.translator = None
-        else:
+        # Network calls run here so callers can stop waiting without cancelling them
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='translation')
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.RLock()
+        
+        if backend is None:
+            if TRANSLATION_BACKEND_URL:
+                backend = HTTPTranslationBackend(TRANSLATION_BACKEND_URL)
+            else:
+                backend = GoogleTranslateBackend()
+        self.backend = backend
+        self.health = BackendHealth(f"translation ({backend.name})")
+        
+        if self.backend.is_available():
+            logger.info(f"✅ Translation engine initialized ({self.backend.name})")
+            print("✅ Translation engine initialized")
+        elif not GOOGLETRANS_AVAILABLE:
             logger.warning("⚠️ Translation unavailable - googletrans not installed")
             print("⚠️ Translation unavailable - install googletrans")
+        else:
+            logger.warning(f"⚠️ Translation unavailable - {self.backend.name} backend failed to start")
     
-    @lru_cache(maxsize=1000)
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+    def translate(self, text: str, source_lang: str, target_lang: str,
+                  timeout: Optional[float] = None) -> str:
         """
-        Translate text with retry logic and validation
+        Translate text with caching, retry logic and a latency budget
+        
+        If the deadline passes, the original text is returned immediately;
+        the request keeps running in the background and its result is cached
+        for the next call.
         
         Args:
             text: Text to translate
             source_lang: Source language code (en, hi, kn)
             target_lang: Target language code (en, hi, kn)
+            timeout: Latency budget in seconds (None = engine default)
             
         Returns:
-            Translated text, or original text if translation fails
+            Translated text, or original text if translation fails or is too slow
         """
-        # No translation needed if same language
-        if source_lang == target_lang:
+        budget = self.timeout if timeout is None else timeout
+        future = self.translate_async(text, source_lang, target_lang)
+        
+        try:
+            return future.result(timeout=budget)
+        except FuturesTimeout:
+            logger.warning(f"Translation missed its {budget:g}s deadline, using original text: '{text}'")
             return text
+    
+    def translate_async(self, text: str, source_lang: str, target_lang: str) -> Future:
+        """
+        Start a translation without waiting for it
         
-        # Return original if translator not available
-        if not self.translator:
-            logger.warning(f"Translation unavailable: {source_lang} -> {target_lang}")
+        Cache hits and texts that need no translation resolve immediately;
+        concurrent requests for the same text share one network call.
+        
+        Returns:
+            Future resolving to the translated (or original) text
+        """
+        resolved = self._resolve_locally(text, source_lang, target_lang)
+        if resolved is not None:
+            future = Future()
+            future.set_result(resolved)
+            return future
+        
+        key = (source_lang, target_lang, TranslationCache.normalize(text))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self.executor.submit(self._translate_sync, text, source_lang, target_lang)
+                self._inflight[key] = future
+                future.add_done_callback(lambda _, key=key: self._forget_inflight(key))
+        return future
+    
+    def _forget_inflight(self, key: tuple):
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+    
+    def _resolve_locally(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Answer without the network if possible
+        
+        Returns:
+            Translation (or the original text when no translation is possible),
+            or None if a network call is needed
+        """
+        # No translation needed if same language
+        if source_lang == target_lang:
             return text
         
         # Validate languages
@@ -77,16 +143,59 @@ class TranslationEngine:
         if not text or not text.strip():
             return text
         
-        # Try translation with retries
+        # Cache first - works even when the translator is unavailable
+        cached, known_failure = self.cache.lookup(text, source_lang, target_lang)
+        if cached is not None:
+            logger.debug(f"Translation cache hit ({source_lang} -> {target_lang}): '{text}'")
+            return cached
+        if known_failure:
+            logger.debug(f"Translation recently failed, skipping network: '{text}'")
+            return text
+        
+        # Return original if translator not available
+        if not self.backend.is_available():
+            logger.warning(f"Translation unavailable: {source_lang} -> {target_lang}")
+            return text
+        
+        return None
+    
+    def _translate_sync(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate and cache the result, blocking for as long as the service takes"""
+        resolved = self._resolve_locally(text, source_lang, target_lang)
+        if resolved is not None:
+            return resolved
+        
+        # Backend known to be down - don't wait for it, and don't cache this as a failure
+        if not self.health.allow_request():
+            logger.debug(f"Translation backend circuit open, skipping: '{text}'")
+            return text
+        
+        translated_text = self._translate_remote(text, source_lang, target_lang)
+        if translated_text is None:
+            self.cache.put_failure(text, source_lang, target_lang)
+            return text
+        
+        self.cache.put(text, source_lang, target_lang, translated_text)
+        return translated_text
+    
+    def _translate_remote(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Call the translation backend with retries
+        Callers must have checked self.health.allow_request() first
+        
+        Returns:
+            Translated text, or None if all retries failed
+        """
+        start = time.monotonic()
         for attempt in range(self.max_retries):
             try:
                 # Perform translation
-                result = self.translator.translate(text, src=source_lang, dest=target_lang)
-                translated_text = result.text
+                translated_text = self.backend.translate(text, source_lang, target_lang)
                 
                 # Validate translation
                 if translated_text and translated_text.strip():
                     logger.info(f"Translated ({source_lang} -> {target_lang}): '{text}' -> '{translated_text}'")
+                    self.health.record_success(time.monotonic() - start)
                     return translated_text
                 else:
                     logger.warning(f"Empty translation result, attempt {attempt + 1}/{self.max_retries}")
@@ -96,17 +205,134 @@ class TranslationEngine:
                 
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay)
-                    # Reinitialize translator on error
-                    try:
-                        self.translator = Translator()
-                    except:
-                        pass
+                    # Let the backend recover (googletrans needs a fresh session)
+                    self.backend.reset()
         
-        # If all retries failed, return original text
         logger.error(f"Translation failed after {self.max_retries} attempts, returning original text")
-        return text
+        self.health.record_failure()
+        return None
+    
+    def translate_many(self, texts: List[str], source_lang: str, target_lang: str,
+                       timeout: Optional[float] = None) -> List[str]:
+        """
+        Translate several independent strings with as few network calls as possible
+        
+        Strings already in the cache (or recently failed) are resolved locally,
+        duplicates are translated once, and the remaining misses are joined with
+        newlines into batches of at most `batch_max_chars` characters.
+        
+        Args:
+            texts: Strings to translate
+            source_lang: Source language code (en, hi, kn)
+            target_lang: Target language code (en, hi, kn)
+            timeout: Latency budget in seconds (None = engine default)
+            
+        Returns:
+            Translations in the same order as `texts` (originals where translation
+            failed or missed the deadline)
+        """
+        budget = self.timeout if timeout is None else timeout
+        future = self.executor.submit(self._translate_many_sync, list(texts), source_lang, target_lang)
+        
+        try:
+            return future.result(timeout=budget)
+        except FuturesTimeout:
+            logger.warning(f"Batch translation missed its {budget:g}s deadline, using original text")
+            # Whatever is already cached is still better than the original
+            results = []
+            for text in texts:
+                cached = self.cache.get(text, source_lang, target_lang) if text and text.strip() else None
+                results.append(cached if cached is not None else text)
+            return results
+    
+    def _translate_many_sync(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Blocking body of translate_many (runs on the executor)"""
+        results = list(texts)
+        
+        if source_lang == target_lang:
+            return results
+        
+        if source_lang not in self.supported_languages or target_lang not in self.supported_languages:
+            logger.warning(f"Unsupported language pair: {source_lang} -> {target_lang}")
+            return results
+        
+        # Resolve cache hits and group the misses by cache key
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cached, known_failure = self.cache.lookup(text, source_lang, target_lang)
+            if cached is not None:
+                results[index] = cached
+            elif not known_failure:
+                pending.setdefault(TranslationCache.normalize(text), []).append(index)
+        
+        if not pending:
+            return results
+        
+        if not self.backend.is_available():
+            logger.warning(f"Translation unavailable: {source_lang} -> {target_lang}")
+            return results
+        
+        # One representative text per key; newlines are the batch separator
+        unique = [(indices, ' '.join(texts[indices[0]].split())) for indices in pending.values()]
+        
+        batch: List = []
+        batch_chars = 0
+        for item in unique:
+            item_chars = len(item[1]) + 1
+            if batch and batch_chars + item_chars > self.batch_max_chars:
+                self._translate_batch(batch, source_lang, target_lang, results)
+                batch, batch_chars = [], 0
+            batch.append(item)
+            batch_chars += item_chars
+        if batch:
+            self._translate_batch(batch, source_lang, target_lang, results)
+        
+        return results
     
-    def translate_to_english(self, text: str, source_lang: str) -> str:
+    def _translate_batch(self, batch: List, source_lang: str, target_lang: str, results: List[str]):
+        """
+        Translate one newline-joined batch and scatter the lines back into `results`
+        Falls back to per-item translation if the service merges or splits lines
+        """
+        texts = [text for _, text in batch]
+        
+        if not self.health.allow_request():
+            logger.debug("Translation backend circuit open, skipping batch")
+            return
+        
+        if len(texts) == 1:
+            translated = self._translate_remote(texts[0], source_lang, target_lang)
+            lines = [translated] if translated is not None else None
+        else:
+            logger.info(f"Batch translating {len(texts)} strings ({source_lang} -> {target_lang})")
+            translated = self._translate_remote('\n'.join(texts), source_lang, target_lang)
+            lines = translated.split('\n') if translated is not None else None
+        
+        if lines is None:
+            for text in texts:
+                self.cache.put_failure(text, source_lang, target_lang)
+            return
+        
+        if len(lines) != len(texts):
+            logger.warning(f"Batch translation returned {len(lines)} lines for {len(texts)} strings, "
+                           f"translating individually")
+            for indices, text in batch:
+                translated_text = self._translate_sync(text, source_lang, target_lang)
+                for index in indices:
+                    results[index] = translated_text
+            return
+        
+        for (indices, text), line in zip(batch, lines):
+            line = line.strip()
+            if not line:
+                continue
+            self.cache.put(text, source_lang, target_lang, line)
+            for index in indices:
+                results[index] = line
+    
+    def translate_to_english(self, text: str, source_lang: str, timeout: Optional[float] = None) -> str:
         """
         Translate text to English for command processing
         CRITICAL: Command processor MUST receive English text only
@@ -114,6 +340,7 @@ class TranslationEngine:
         Args:
             text: Text to translate
             source_lang: Source language code (en, hi, kn)
+            timeout: Latency budget in seconds (None = engine default)
             
         Returns:
             English translation
@@ -122,12 +349,12 @@ class TranslationEngine:
             return text
         
         logger.info(f"Translating to English from {source_lang}: '{text}'")
-        english_text = self.translate(text, source_lang, 'en')
+        english_text = self.translate(text, source_lang, 'en', timeout=timeout)
         logger.info(f"English result: '{english_text}'")
         
         return english_text
     
-    def translate_from_english(self, text: str, target_lang: str) -> str:
+    def translate_from_english(self, text: str, target_lang: str, timeout: Optional[float] = None) -> str:
         """
         Translate English response back to user's language
         CRITICAL: User MUST hear response in their spoken language
@@ -135,6 +362,7 @@ class TranslationEngine:
         Args:
             text: English text to translate
             target_lang: Target language code (en, hi, kn)
+            timeout: Latency budget in seconds (None = engine default)
             
         Returns:
             Translated text
@@ -143,20 +371,28 @@ class TranslationEngine:
             return text
         
         logger.info(f"Translating from English to {target_lang}: '{text}'")
-        translated_text = self.translate(text, 'en', target_lang)
+        translated_text = self.translate(text, 'en', target_lang, timeout=timeout)
         logger.info(f"{target_lang} result: '{translated_text}'")
         
         return translated_text
     
     def is_available(self) -> bool:
         """Check if translation is available"""
-        return self.translator is not None
+        return self.backend.is_available()
     
     def clear_cache(self):
-        """Clear translation cache"""
-        self.translate.cache_clear()
+        """Clear translation cache (memory and disk)"""
+        self.cache.clear()
         logger.info("Translation cache cleared")
     
+    def get_backend_health(self) -> Dict:
+        """Circuit breaker state and latency of the translation backend"""
+        return self.health.snapshot()
+    
+    def get_cache_stats(self) -> Dict:
+        """Translation cache hit/miss statistics"""
+        return self.cache.get_stats()
+    
     def validate_translation(self, original: str, translated: str, source_lang: str, target_lang: str) -> bool:
         """
         Validate translation quality
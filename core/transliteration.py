@@ -0,0 +1,175 @@
+"""
+Romanised Hindi/Kannada normalisation for LYRA Voice Assistant
+One rule table for romanised (and ASR-misspelt) words and phrases, compiled
+into a word trie per target once at import. Conversion is longest-match, so
+"samay kya hai" becomes "what time is it" rather than "time what is".
+
+Targets:
+    'kn' / 'hi' - native script (e.g. "samaya enu" -> "ಸಮಯ ಏನು")
+    'en'        - plain English (e.g. "calculator therey" -> "calculator open")
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TARGETS = ('kn', 'hi', 'en')
+
+# (spellings, {target: output}); a spelling may be several words.
+# Romanised spellings come before English words mapping to the same native
+# word, so reverse lookups (native -> romanised) find the romanised form.
+RULES: List[Tuple[Tuple[str, ...], Dict[str, str]]] = [
+    # Time queries
+    (("samaya", "samay"), {"kn": "ಸಮಯ", "hi": "समय", "en": "time"}),
+    (("time",), {"kn": "ಸಮಯ", "hi": "समय"}),
+    (("enu", "yenu", "eenu"), {"kn": "ಏನು", "en": "what"}),
+    (("kya",), {"hi": "क्या", "en": "what"}),
+    (("hai",), {"hi": "है", "en": "is"}),
+    (("samaya enu", "samaya yenu", "samay enu", "time enu"), {"en": "what time is it"}),
+    (("samay kya hai", "samay kya", "time kya hai", "time kya"), {"en": "what time is it"}),
+
+    # App commands
+    (("tere", "therey"), {"kn": "ತೆರೆ", "en": "open"}),
+    (("there",), {"kn": "ತೆರೆ"}),  # only in Kannada context; "hello there" is English
+    (("kholo", "kolo"), {"hi": "खोलो", "en": "open"}),
+    (("open",), {"kn": "ತೆರೆ", "hi": "खोलो"}),
+    (("muchu",), {"kn": "ಮುಚ್ಚು", "en": "close"}),
+    (("band", "bund"), {"hi": "बंद", "en": "close"}),
+    (("band karo", "bund karo"), {"hi": "बंद करो", "en": "close"}),
+    (("close",), {"kn": "ಮುಚ್ಚು", "hi": "बंद"}),
+    (("shuru karo",), {"hi": "शुरू करो", "en": "start"}),
+
+    # App names
+    (("calculator", "calc", "kalkulater", "kalkulator"),
+     {"kn": "ಕ್ಯಾಲ್ಕುಲೇಟರ್", "hi": "कैलकुलेटर", "en": "calculator"}),
+    (("notepad", "notpad", "nota", "pad"), {"en": "notepad"}),
+    (("browser", "brove"), {"en": "browser"}),
+    (("brave", "brav"), {"en": "brave"}),
+    (("chrome", "krom"), {"en": "chrome"}),
+
+    # Reminders
+    (("nenapisu",), {"kn": "ನೆನಪಿಸು", "en": "remind"}),
+    (("yaad",), {"hi": "याद"}),
+    (("yaad dilao", "yaad dila do"), {"hi": "याद दिलाओ", "en": "remind me to"}),
+    (("remind",), {"kn": "ನೆನಪಿಸು", "hi": "याद"}),
+    (("reminder",), {"kn": "ರಿಮೈಂಡರ್"}),
+
+    # Common words
+    (("please", "dayavittu", "kripya"), {"en": "please"}),
+]
+
+
+class Transliterator:
+    """
+    Longest-match word trie, one per target
+
+    A node is [output or None, {next word: node}]. Words not covered by a
+    rule pass through unchanged (lower-cased).
+    """
+
+    def __init__(self, rules: Iterable[Tuple[Iterable[str], Dict[str, str]]]):
+        """
+        Args:
+            rules: (spellings, {target: output}) pairs; later rules don't
+                override an output an earlier rule already set
+        """
+        self._roots: Dict[str, Dict[str, list]] = {target: {} for target in TARGETS}
+        self._word_maps: Dict[str, Dict[str, str]] = {target: {} for target in TARGETS}
+
+        for spellings, outputs in rules:
+            for spelling in spellings:
+                words = spelling.lower().split()
+                for target, output in outputs.items():
+                    self._insert(target, words, output)
+
+        sizes = ', '.join(f"{target}: {len(self._word_maps[target])}" for target in TARGETS)
+        logger.info(f"Transliteration rules compiled ({sizes} single-word entries)")
+
+    def _insert(self, target: str, words: List[str], output: str):
+        children = self._roots[target]
+        node = None
+        for word in words:
+            node = children.get(word)
+            if node is None:
+                node = children[word] = [None, {}]
+            children = node[1]
+        if node[0] is None:
+            node[0] = output
+            if len(words) == 1:
+                self._word_maps[target][words[0]] = output
+
+    def convert(self, text: str, target: str) -> str:
+        """
+        Rewrite romanised text for a target
+
+        Args:
+            text: Romanised or mixed text
+            target: 'kn', 'hi' (native script) or 'en'
+
+        Returns:
+            Lower-cased text with every covered word or phrase replaced
+        """
+        root = self._roots.get(target)
+        if root is None or not text:
+            return text
+
+        words = text.lower().split()
+        out = []
+        i, n = 0, len(words)
+        while i < n:
+            node = root.get(words[i])
+            if node is None:
+                out.append(words[i])
+                i += 1
+                continue
+
+            best, best_end = node[0], i + 1
+            children, j = node[1], i + 1
+            while children and j < n:
+                node = children.get(words[j])
+                if node is None:
+                    break
+                j += 1
+                if node[0] is not None:
+                    best, best_end = node[0], j
+                children = node[1]
+
+            if best is None:
+                out.append(words[i])
+                i += 1
+            else:
+                out.append(best)
+                i = best_end
+
+        return ' '.join(out)
+
+    def word_map(self, target: str) -> Dict[str, str]:
+        """Single-word rules for a target (romanised -> output), in rule order"""
+        return dict(self._word_maps.get(target, {}))
+
+    def lookup(self, phrase: str, target: str) -> Optional[str]:
+        """Output for an exact word or phrase, or None"""
+        children, node = self._roots.get(target, {}), None
+        for word in phrase.lower().split():
+            node = children.get(word)
+            if node is None:
+                return None
+            children = node[1]
+        return node[0] if node else None
+
+
+# Compiled once; shared by CommandProcessor and MultilingualTextProcessor
+TRANSLITERATOR = Transliterator(RULES)
+
+
+def to_native(text: str, language: str) -> str:
+    """Romanised Kannada/Hindi -> native script (other languages unchanged)"""
+    if language not in ('kn', 'hi'):
+        return text
+    return TRANSLITERATOR.convert(text, language)
+
+
+def to_english(text: str) -> str:
+    """Romanised Kannada/Hindi command words -> English"""
+    return TRANSLITERATOR.convert(text, 'en')
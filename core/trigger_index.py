@@ -0,0 +1,53 @@
+"""
+Trigger index for LYRA custom commands
+One Aho-Corasick automaton over a user's active trigger phrases, so matching
+an utterance is a single pass over the text however many commands the user
+has. When several triggers occur in the text the longest one wins.
+"""
+
+import logging
+from typing import Dict, Optional
+
+from core.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+
+class TriggerIndex:
+    """
+    Same triggers as:
+
+        for trigger, command in commands.items():
+            if trigger in text_lower: return command
+
+    but the longest trigger found wins instead of the first in dict order
+    ("turn on the lights" beats "lights"); ties go to the earliest in the text.
+    """
+
+    def __init__(self, commands: Dict[str, Dict]):
+        """
+        Args:
+            commands: Lower-cased trigger phrase -> command
+        """
+        self.automaton = AhoCorasick(
+            (trigger, command) for trigger, command in commands.items() if trigger.strip()
+        )
+        logger.debug(f"Trigger index built: {self.automaton.size} triggers")
+
+    def __len__(self):
+        return self.automaton.size
+
+    def match(self, text: str) -> Optional[Dict]:
+        """
+        Args:
+            text: Utterance (lower-cased by the caller)
+
+        Returns:
+            Command of the longest trigger contained in the text, or None
+        """
+        best, best_key = None, None
+        for start, end, command in self.automaton.find_all(text):
+            key = (end - start, -start)
+            if best_key is None or key > best_key:
+                best, best_key = command, key
+        return best
@@ -6,11 +6,18 @@ Uses language-specific neural voices, not English phonetics for all languages
 
 import os
 import tempfile
+import hashlib
 import logging
 import asyncio
 import platform
+import threading
 import subprocess
-from typing import Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import TTS_CACHE_DIR, TTS_OFFLINE_MODE
+from core.backend_health import BackendHealth
+from core.offline_tts import EspeakBackend
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +45,14 @@ except ImportError:
     PYTTSX3_AVAILABLE = False
     logger.warning("pyttsx3 not available. Install with: pip install pyttsx3")
 
+try:
+    import numpy as np
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+    logger.warning("sounddevice not available - offline PCM playback disabled")
+
 
 class TTSEngine:
     """
@@ -48,19 +63,29 @@ class TTSEngine:
     - English text → English voice
     """
     
-    def __init__(self, rate: int = 150, volume: float = 0.9):
+    def __init__(self, rate: int = 150, volume: float = 0.9, cache_dir: str = TTS_CACHE_DIR,
+                 offline_mode: bool = TTS_OFFLINE_MODE):
         """
         Initialize TTS engine
         
         Args:
-            rate: Speech rate (words per minute) for pyttsx3
+            rate: Speech rate (words per minute) for pyttsx3 / espeak-ng
             volume: Volume level (0.0 to 1.0)
+            cache_dir: Directory holding pre-synthesised audio for static replies
+            offline_mode: Only use local backends (air-gapped deployments)
         """
         self.rate = rate
         self.volume = volume
         self.current_language = 'en'
         self.platform = platform.system()
         
+        # Audio cache for pre-synthesised replies (see ResponsePreSynthesizer)
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Set while audio is playing so background synthesis can back off
+        self.speaking = threading.Event()
+        
         # Edge-TTS voice mapping (LANGUAGE-NATIVE NEURAL VOICES)
         # CRITICAL: Each language uses its native voice model
         self.edge_voices = {
@@ -88,17 +113,41 @@ class TTSEngine:
                 logger.warning(f"pyttsx3 initialization failed: {e}")
                 self.pyttsx3_engine = None
         
+        # Offline espeak-ng backend (local, returns raw PCM)
+        self.offline_mode = offline_mode
+        self.espeak = EspeakBackend(rate=self.rate, volume=self.volume)
+        
         # Log available backends
         backends = []
         if EDGE_TTS_AVAILABLE:
             backends.append("edge-tts (neural, language-native)")
         if GTTS_AVAILABLE:
             backends.append("gTTS (language-native)")
+        if self.espeak.is_available():
+            backends.append("espeak-ng (offline)")
         if self.pyttsx3_engine:
             backends.append("pyttsx3 (limited)")
+        if self.offline_mode:
+            backends.append("[offline mode]")
         
         logger.info(f"TTS backends available: {', '.join(backends) if backends else 'None'}")
         print(f"TTS backends: {', '.join(backends) if backends else 'None'}")
+        
+        # Per-backend health: circuit breaker + latency EWMA
+        # Known-bad backends are skipped instead of paying their timeout on every utterance
+        self.synthesis_timeout = 8.0  # seconds per network synthesis attempt
+        self.probe_interval = 15.0    # seconds between background health probes
+        self.backend_health = {
+            'edge-tts': BackendHealth('edge-tts'),
+            'gTTS': BackendHealth('gTTS'),
+            'espeak-ng': BackendHealth('espeak-ng'),
+            'pyttsx3': BackendHealth('pyttsx3'),
+        }
+        
+        # Background prober re-tests open circuits so recovery is noticed without user traffic
+        self._probe_stop = threading.Event()
+        self._probe_thread = threading.Thread(target=self._probe_loop, name="tts-health-probe", daemon=True)
+        self._probe_thread.start()
     
     def speak(self, text: str, language: Optional[str] = None):
         """
@@ -124,43 +173,113 @@ class TTSEngine:
         logger.info(f"Speaking ({lang}): {text[:50]}...")
         print(f"🔊 Speaking ({lang}): {text[:50]}...")
         
-        # Try backends in priority order
-        # Priority: edge-tts (best) > gTTS (good) > pyttsx3 (fallback)
-        
-        # 1. Try edge-tts (BEST - neural, language-native voices)
-        if EDGE_TTS_AVAILABLE and lang in self.edge_voices:
+        # 0. Pre-synthesised audio (instant, no network)
+        cached_file = self.get_cached_audio(text, lang)
+        if cached_file and GTTS_AVAILABLE:
             try:
-                success = self._speak_edge_tts(text, lang)
-                if success:
-                    logger.info(f"✅ Spoke using edge-tts ({lang} native voice)")
-                    return
+                self._play_audio_file(cached_file)
+                logger.info(f"✅ Spoke using cached audio ({lang})")
+                return
             except Exception as e:
-                logger.warning(f"edge-tts failed: {e}")
+                logger.warning(f"Cached audio playback failed: {e}")
         
-        # 2. Try gTTS (GOOD - language-native pronunciation)
-        if GTTS_AVAILABLE and lang in self.gtts_langs:
-            try:
-                success = self._speak_gtts(text, lang)
-                if success:
-                    logger.info(f"✅ Spoke using gTTS ({lang} native voice)")
-                    return
-            except Exception as e:
-                logger.warning(f"gTTS failed: {e}")
-        
-        # 3. Fallback to pyttsx3 (LIMITED - mainly English)
-        if self.pyttsx3_engine:
+        # Try backends in priority order, skipping backends whose circuit is open
+        # Priority: edge-tts (best) > gTTS (good) > espeak-ng (offline) > pyttsx3 (fallback)
+        for name, speak_backend in self._backend_chain(lang):
+            health = self.backend_health[name]
+            if not health.allow_request():
+                logger.info(f"Skipping {name} (circuit {health.state})")
+                continue
+            
             try:
-                success = self._speak_pyttsx3(text, lang)
+                success = speak_backend(text, lang)
                 if success:
-                    logger.info(f"✅ Spoke using pyttsx3 (limited {lang} support)")
+                    logger.info(f"✅ Spoke using {name} ({lang})")
                     return
             except Exception as e:
-                logger.warning(f"pyttsx3 failed: {e}")
+                logger.warning(f"{name} failed: {e}")
+                health.record_failure()
         
         # If all backends failed
         logger.error(f"❌ All TTS backends failed for language: {lang}")
         print(f"❌ TTS Error: Could not speak text in {lang}")
     
+    def _backend_chain(self, language: str) -> List[Tuple[str, Callable[[str, str], bool]]]:
+        """
+        Available speak backends for a language, in priority order
+        
+        Args:
+            language: Language code
+            
+        Returns:
+            List of (backend name, speak function)
+        """
+        chain = []
+        if not self.offline_mode:
+            if EDGE_TTS_AVAILABLE and language in self.edge_voices:
+                chain.append(('edge-tts', self._speak_edge_tts))
+            if GTTS_AVAILABLE and language in self.gtts_langs:
+                chain.append(('gTTS', self._speak_gtts))
+        if self.espeak.is_available() and SOUNDDEVICE_AVAILABLE:
+            chain.append(('espeak-ng', self._speak_espeak))
+        if self.pyttsx3_engine:
+            chain.append(('pyttsx3', self._speak_pyttsx3))
+        return chain
+    
+    def _synthesis_chain(self) -> List[Tuple[str, Callable[[str, str, str], bool]]]:
+        """File-producing (network) backends in priority order: (name, synthesize function)"""
+        chain = []
+        if self.offline_mode:
+            return chain
+        if EDGE_TTS_AVAILABLE:
+            chain.append(('edge-tts', self._synthesize_edge_tts))
+        if GTTS_AVAILABLE:
+            chain.append(('gTTS', self._synthesize_gtts))
+        return chain
+    
+    def _run_synthesis(self, name: str, synthesize: Callable[[str, str, str], bool],
+                       text: str, language: str, filename: str) -> bool:
+        """
+        Run one synthesis call and record its outcome in the backend's health
+        
+        Returns:
+            True if the backend produced audio
+        """
+        health = self.backend_health[name]
+        start = time.monotonic()
+        try:
+            success = synthesize(text, language, filename) and os.path.getsize(filename) > 0
+        except Exception as e:
+            logger.warning(f"{name} synthesis failed: {e}")
+            success = False
+        
+        if success:
+            health.record_success(time.monotonic() - start)
+        else:
+            health.record_failure()
+        return success
+    
+    def _probe_loop(self):
+        """Periodically probe backends with open circuits"""
+        while not self._probe_stop.wait(self.probe_interval):
+            for name, synthesize in self._synthesis_chain():
+                health = self.backend_health[name]
+                if not health.needs_probe() or not health.allow_request():
+                    continue
+                
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
+                    probe_filename = temp_file.name
+                ok = self._run_synthesis(name, synthesize, "ok", 'en', probe_filename)
+                logger.info(f"Health probe {name}: {'recovered' if ok else 'still failing'}")
+                try:
+                    os.unlink(probe_filename)
+                except OSError:
+                    pass
+    
+    def get_backend_health(self) -> Dict[str, Dict]:
+        """Health snapshot of every TTS backend"""
+        return {name: health.snapshot() for name, health in self.backend_health.items()}
+    
     def _speak_edge_tts(self, text: str, language: str) -> bool:
         """
         Speak using edge-tts (LANGUAGE-NATIVE neural voices)
@@ -173,32 +292,20 @@ class TTSEngine:
             True if successful, False otherwise
         """
         try:
-            voice = self.edge_voices.get(language)
-            if not voice:
-                return False
-            
-            logger.info(f"Using edge-tts voice: {voice} for language: {language}")
-            
             # Create temporary file for audio
             with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
                 temp_filename = temp_file.name
             
-            # Generate speech asynchronously
-            async def generate_speech():
-                communicate = edge_tts.Communicate(text, voice)
-                await communicate.save(temp_filename)
-            
-            # Run async function
-            asyncio.run(generate_speech())
+            if not self._run_synthesis('edge-tts', self._synthesize_edge_tts, text, language, temp_filename):
+                try:
+                    os.unlink(temp_filename)
+                except OSError:
+                    pass
+                return False
             
             # Play the audio using pygame
             if GTTS_AVAILABLE:  # Use pygame from gTTS
-                pygame.mixer.music.load(temp_filename)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    pygame.time.wait(100)
+                self._play_audio_file(temp_filename)
             
             # Clean up
             try:
@@ -212,6 +319,33 @@ class TTSEngine:
             logger.error(f"edge-tts error: {e}")
             return False
     
+    def _synthesize_edge_tts(self, text: str, language: str, filename: str) -> bool:
+        """
+        Render speech to an mp3 file using edge-tts (no playback)
+        
+        Args:
+            text: Text to synthesise
+            language: Language code
+            filename: Destination mp3 path
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        voice = self.edge_voices.get(language)
+        if not voice:
+            return False
+        
+        logger.info(f"Using edge-tts voice: {voice} for language: {language}")
+        
+        # Generate speech asynchronously
+        async def generate_speech():
+            communicate = edge_tts.Communicate(text, voice)
+            await communicate.save(filename)
+        
+        # Run async function (bounded so a dead host cannot stall the voice loop)
+        asyncio.run(asyncio.wait_for(generate_speech(), timeout=self.synthesis_timeout))
+        return True
+    
     def _speak_gtts(self, text: str, language: str) -> bool:
         """
         Speak using gTTS (LANGUAGE-NATIVE pronunciation)
@@ -224,25 +358,19 @@ class TTSEngine:
             True if successful, False otherwise
         """
         try:
-            tts_lang = self.gtts_langs.get(language, 'en')
-            
-            logger.info(f"Using gTTS language: {tts_lang} for language: {language}")
-            
-            # Generate speech with language-native pronunciation
-            tts = gTTS(text=text, lang=tts_lang, slow=False)
-            
             # Save to temporary file
             with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as temp_file:
                 temp_filename = temp_file.name
-                tts.save(temp_filename)
             
-            # Play the audio
-            pygame.mixer.music.load(temp_filename)
-            pygame.mixer.music.play()
+            if not self._run_synthesis('gTTS', self._synthesize_gtts, text, language, temp_filename):
+                try:
+                    os.unlink(temp_filename)
+                except OSError:
+                    pass
+                return False
             
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                pygame.time.wait(100)
+            # Play the audio
+            self._play_audio_file(temp_filename)
             
             # Clean up
             try:
@@ -256,6 +384,177 @@ class TTSEngine:
             logger.error(f"gTTS error: {e}")
             return False
     
+    def _synthesize_gtts(self, text: str, language: str, filename: str) -> bool:
+        """
+        Render speech to an mp3 file using gTTS (no playback)
+        
+        Args:
+            text: Text to synthesise
+            language: Language code
+            filename: Destination mp3 path
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        tts_lang = self.gtts_langs.get(language, 'en')
+        
+        logger.info(f"Using gTTS language: {tts_lang} for language: {language}")
+        
+        # Generate speech with language-native pronunciation
+        tts = gTTS(text=text, lang=tts_lang, slow=False, timeout=self.synthesis_timeout)
+        tts.save(filename)
+        return True
+    
+    def _play_audio_file(self, filename: str):
+        """
+        Play an audio file with pygame and block until playback finishes
+        
+        Args:
+            filename: Path to an mp3/wav file
+        """
+        self.speaking.set()
+        try:
+            pygame.mixer.music.load(filename)
+            pygame.mixer.music.play()
+            
+            # Wait for playback to finish
+            while pygame.mixer.music.get_busy():
+                pygame.time.wait(100)
+            
+            # Release the file so cached audio is not kept locked (Windows)
+            if hasattr(pygame.mixer.music, 'unload'):
+                pygame.mixer.music.unload()
+        finally:
+            self.speaking.clear()
+    
+    # ------------------------------------------------------------------
+    # Audio cache
+    # ------------------------------------------------------------------
+    
+    def _cache_path(self, text: str, language: str) -> str:
+        """Path of the cached audio file for (language, text)"""
+        key = hashlib.sha1(f"{language}\n{text.strip()}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{language}_{key}.mp3")
+    
+    def get_cached_audio(self, text: str, language: str) -> Optional[str]:
+        """
+        Get pre-synthesised audio for a reply, if present
+        
+        Args:
+            text: Reply text
+            language: Language code
+            
+        Returns:
+            Path to the cached mp3, or None
+        """
+        path = self._cache_path(text, language)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            return path
+        return None
+    
+    def synthesize_to_cache(self, text: str, language: str) -> Optional[str]:
+        """
+        Render a reply into the audio cache without playing it
+        
+        Args:
+            text: Reply text
+            language: Language code (en, hi, kn)
+            
+        Returns:
+            Path to the cached mp3, or None if no backend could synthesise it
+        """
+        if not text or not text.strip() or language not in ['en', 'hi', 'kn']:
+            return None
+        
+        path = self.get_cached_audio(text, language)
+        if path:
+            return path
+        
+        path = self._cache_path(text, language)
+        temp_path = path + '.part'
+        
+        for name, synthesize in self._synthesis_chain():
+            if not self.backend_health[name].allow_request():
+                continue
+            if self._run_synthesis(name, synthesize, text, language, temp_path):
+                os.replace(temp_path, path)
+                return path
+        
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        return None
+    
+    def get_cache_size(self) -> int:
+        """Total size of the audio cache in bytes"""
+        total = 0
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith('.mp3'):
+                    total += entry.stat().st_size
+        except OSError:
+            pass
+        return total
+    
+    def _speak_espeak(self, text: str, language: str) -> bool:
+        """
+        Speak using the offline espeak-ng backend (PCM, no temp files)
+        
+        Args:
+            text: Text to speak
+            language: Language code
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            pcm, sample_rate = self.synthesize_pcm(text, language)
+        except Exception as e:
+            logger.error(f"espeak-ng error: {e}")
+            return False
+        
+        self._play_pcm(pcm, sample_rate)
+        return True
+    
+    def synthesize_pcm(self, text: str, language: str = 'en') -> Tuple[bytes, int]:
+        """
+        Synthesise text offline to raw PCM (no network, no playback)
+        Also usable for benchmarking the TTS pipeline without network access
+        
+        Args:
+            text: Text to synthesise
+            language: Language code (en, hi, kn)
+            
+        Returns:
+            Tuple of (int16 mono PCM bytes, sample rate)
+        """
+        health = self.backend_health['espeak-ng']
+        start = time.monotonic()
+        try:
+            pcm, sample_rate = self.espeak.synthesize_pcm(text, language)
+        except Exception:
+            health.record_failure()
+            raise
+        health.record_success(time.monotonic() - start)
+        return pcm, sample_rate
+    
+    def _play_pcm(self, pcm: bytes, sample_rate: int):
+        """
+        Play int16 mono PCM and block until playback finishes
+        
+        Args:
+            pcm: Raw PCM bytes
+            sample_rate: Sample rate in Hz
+        """
+        self.speaking.set()
+        try:
+            samples = np.frombuffer(pcm, dtype=np.int16)
+            sd.play(samples, sample_rate)
+            sd.wait()
+        finally:
+            self.speaking.clear()
+    
     def _speak_pyttsx3(self, text: str, language: str) -> bool:
         """
         Speak using pyttsx3 (LIMITED language support, mainly English)
@@ -276,13 +575,20 @@ class TTSEngine:
             # It will try to speak but pronunciation may be poor for non-English
             logger.warning(f"Using pyttsx3 for {language} - pronunciation may be poor")
             
-            self.pyttsx3_engine.say(text)
-            self.pyttsx3_engine.runAndWait()
+            start = time.monotonic()
+            self.speaking.set()
+            try:
+                self.pyttsx3_engine.say(text)
+                self.pyttsx3_engine.runAndWait()
+            finally:
+                self.speaking.clear()
             
+            self.backend_health['pyttsx3'].record_success(time.monotonic() - start)
             return True
             
         except Exception as e:
             logger.error(f"pyttsx3 error: {e}")
+            self.backend_health['pyttsx3'].record_failure()
             return False
     
     def set_language(self, language_code: str):
@@ -303,11 +609,17 @@ class TTSEngine:
         try:
             if GTTS_AVAILABLE:
                 pygame.mixer.music.stop()
+            if SOUNDDEVICE_AVAILABLE:
+                sd.stop()
             if self.pyttsx3_engine:
                 self.pyttsx3_engine.stop()
         except Exception as e:
             logger.warning(f"Error stopping TTS: {e}")
     
+    def shutdown(self):
+        """Stop the background health prober"""
+        self._probe_stop.set()
+    
     def get_available_backends(self) -> list:
         """Get list of available TTS backends"""
         backends = []
@@ -315,6 +627,8 @@ class TTSEngine:
             backends.append('edge-tts')
         if GTTS_AVAILABLE:
             backends.append('gTTS')
+        if self.espeak.is_available():
+            backends.append('espeak-ng')
         if self.pyttsx3_engine:
             backends.append('pyttsx3')
         return backends
@@ -91,6 +91,28 @@ class DatabaseManager:
             )
         ''')
         
+        # --- Custom command versions ---
+        # Bumped by the triggers below on every write to a user's custom
+        # commands, so any process can tell whether its cached copy is stale
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS custom_commands_version (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        for event, users in (('INSERT', ('NEW',)), ('DELETE', ('OLD',)), ('UPDATE', ('OLD', 'NEW'))):
+            bumps = ''.join(f'''
+                INSERT OR IGNORE INTO custom_commands_version (user_id, version)
+                    SELECT {row}.user_id, 0 WHERE {row}.user_id IS NOT NULL;
+                UPDATE custom_commands_version SET version = version + 1
+                    WHERE user_id = {row}.user_id;''' for row in users)
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS custom_commands_{event.lower()}_version
+                AFTER {event} ON custom_commands
+                BEGIN{bumps}
+                END
+            ''')
+        
         # --- Command history ---
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS command_history (
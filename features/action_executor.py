@@ -0,0 +1,287 @@
+# features/action_executor.py
+"""
+Background execution of custom command actions
+
+Actions run on a small worker pool instead of the voice-processing thread.
+Each action gets a timeout, its process output is captured, it can be
+cancelled while queued or running, and an optional completion callback
+receives the result (VoiceAssistant uses it to speak late results).
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from config import CUSTOM_ACTION_WORKERS, CUSTOM_ACTION_TIMEOUT, CUSTOM_ACTION_MAX_OUTPUT
+
+
+class ActionCancelled(Exception):
+    """Raised inside an action when it was cancelled"""
+
+
+class ActionTimedOut(Exception):
+    """Raised inside an action when it ran past its timeout"""
+
+
+class ActionResult:
+    """Outcome of one action"""
+
+    def __init__(self, action_id, name, success, message, output='', returncode=None,
+                 timed_out=False, cancelled=False, duration=0.0):
+        self.action_id = action_id
+        self.name = name
+        self.success = success
+        self.message = message  # Short, speakable summary
+        self.output = output  # Captured stdout/stderr (truncated)
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.cancelled = cancelled
+        self.duration = duration
+
+    def __repr__(self):
+        state = 'cancelled' if self.cancelled else 'timed out' if self.timed_out else \
+            'ok' if self.success else 'failed'
+        return f"ActionResult({self.name!r}, {state}, {self.duration:.2f}s)"
+
+
+class ActionJob:
+    """
+    Handle passed to a running action: gives it a deadline, a cancel flag
+    and run_process(), which captures output and kills the process on
+    timeout or cancellation
+    """
+
+    def __init__(self, action_id, name, timeout):
+        self.action_id = action_id
+        self.name = name
+        self.timeout = timeout
+        self.started_at = None
+        self.output = ''
+        self.returncode = None
+        self._cancel = threading.Event()
+        self._process = None
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def remaining(self):
+        """Seconds left before the timeout (None = no timeout)"""
+        if self.timeout is None or self.started_at is None:
+            return self.timeout
+        return max(0.0, self.timeout - (time.monotonic() - self.started_at))
+
+    def check(self):
+        """Raise if the action should stop (call between steps of long in-process work)"""
+        if self.cancelled:
+            raise ActionCancelled(self.name)
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise ActionTimedOut(self.name)
+
+    def run_process(self, args, shell=False):
+        """
+        Run a process within the remaining time
+
+        Args:
+            args: Command (list, or string with shell=True)
+            shell: Run through the shell
+
+        Returns:
+            (returncode, stdout, stderr) - output is truncated to CUSTOM_ACTION_MAX_OUTPUT
+        """
+        self.check()
+
+        # Own process group, so a timeout kills the shell and everything it started
+        if os.name == 'nt':
+            group = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {'start_new_session': True}
+
+        with self._lock:
+            # cancel() sets the flag before taking the lock, so it either sees this process or we see the flag
+            if self.cancelled:
+                raise ActionCancelled(self.name)
+            self._process = subprocess.Popen(
+                args, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL, text=True, errors='replace', **group
+            )
+        process = self._process
+
+        try:
+            stdout, stderr = process.communicate(timeout=self.remaining())
+        except subprocess.TimeoutExpired:
+            self._kill(process)
+            stdout, stderr = process.communicate()
+            self._record(process.returncode, stdout, stderr)
+            raise ActionTimedOut(self.name)
+        finally:
+            with self._lock:
+                self._process = None
+
+        self._record(process.returncode, stdout, stderr)
+        if self.cancelled:
+            raise ActionCancelled(self.name)
+        return process.returncode, self.output_of(stdout), self.output_of(stderr)
+
+    def cancel(self):
+        """Stop the action: a queued one never starts, a running process is killed"""
+        self._cancel.set()
+        with self._lock:
+            if self._process is not None:
+                self._kill(self._process)
+
+    @staticmethod
+    def output_of(text):
+        text = (text or '').strip()
+        if len(text) > CUSTOM_ACTION_MAX_OUTPUT:
+            return text[:CUSTOM_ACTION_MAX_OUTPUT] + ' …'
+        return text
+
+    def _record(self, returncode, stdout, stderr):
+        self.returncode = returncode
+        self.output = self.output_of('\n'.join(part for part in (stdout, stderr) if part))
+
+    @staticmethod
+    def _kill(process):
+        if process.poll() is not None:
+            return
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (OSError, subprocess.SubprocessError):
+            process.kill()
+
+
+class ActionExecutor:
+    """
+    Worker pool for custom command actions
+
+    An action is a callable taking an ActionJob and returning
+    (success, message), the same pair execute_custom_command returns.
+    """
+
+    def __init__(self, max_workers=CUSTOM_ACTION_WORKERS, default_timeout=CUSTOM_ACTION_TIMEOUT):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='custom-action')
+        self.default_timeout = default_timeout
+        self.jobs = {}  # action_id -> ActionJob (queued or running)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.stats = {'submitted': 0, 'succeeded': 0, 'failed': 0, 'timed_out': 0, 'cancelled': 0}
+
+    def submit(self, name, action, timeout=None, on_complete=None):
+        """
+        Queue an action
+
+        Args:
+            name: Label for logs and results (e.g. the trigger phrase)
+            action: callable(job) -> (success, message)
+            timeout: Seconds (None = default_timeout)
+            on_complete: callable(ActionResult), called from the worker thread
+
+        Returns:
+            Future resolving to an ActionResult; future.action_id identifies it for cancel()
+        """
+        job = ActionJob(next(self._ids), name, timeout if timeout is not None else self.default_timeout)
+        with self._lock:
+            self.jobs[job.action_id] = job
+            self.stats['submitted'] += 1
+
+        future = self.pool.submit(self._run, job, action)
+        future.action_id = job.action_id
+        future.add_done_callback(lambda done: self._finished(job, done, on_complete))
+        return future
+
+    def run_all(self, actions, timeout=None):
+        """
+        Run independent actions concurrently and wait for all of them
+
+        Args:
+            actions: (name, callable(job)) pairs
+            timeout: Per-action timeout
+
+        Returns:
+            ActionResults in the order given
+        """
+        futures = [self.submit(name, action, timeout=timeout) for name, action in actions]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def cancel(self, action_id):
+        """Cancel a queued or running action; False if it already finished"""
+        with self._lock:
+            job = self.jobs.get(action_id)
+        if job is None:
+            return False
+        print(f"🛑 Cancelling action '{job.name}'")
+        job.cancel()
+        return True
+
+    def cancel_all(self):
+        with self._lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def active(self):
+        """(action_id, name, seconds running or None if queued) for unfinished actions"""
+        now = time.monotonic()
+        with self._lock:
+            return [(job.action_id, job.name, now - job.started_at if job.started_at else None)
+                    for job in self.jobs.values()]
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats, active=len(self.jobs))
+
+    def shutdown(self):
+        """Cancel everything and stop the workers"""
+        self.cancel_all()
+        self.pool.shutdown(wait=False)
+
+    def _run(self, job, action):
+        job.started_at = time.monotonic()
+        try:
+            job.check()
+            success, message = action(job)
+            return self._result(job, success, message)
+        except ActionCancelled:
+            return self._result(job, False, f"Cancelled '{job.name}'", cancelled=True)
+        except ActionTimedOut:
+            return self._result(job, False, f"'{job.name}' timed out after {job.timeout:g} seconds", timed_out=True)
+        except Exception as e:
+            return self._result(job, False, f"Error running '{job.name}': {e}")
+
+    @staticmethod
+    def _result(job, success, message, timed_out=False, cancelled=False):
+        return ActionResult(job.action_id, job.name, success, message, output=job.output,
+                            returncode=job.returncode, timed_out=timed_out, cancelled=cancelled,
+                            duration=time.monotonic() - job.started_at)
+
+    def _finished(self, job, future, on_complete):
+        with self._lock:
+            self.jobs.pop(job.action_id, None)
+
+        if future.cancelled():
+            return
+        result = future.result()
+
+        with self._lock:
+            key = ('cancelled' if result.cancelled else 'timed_out' if result.timed_out
+                   else 'succeeded' if result.success else 'failed')
+            self.stats[key] += 1
+        print(f"⚙️ Action finished: {result}")
+
+        if on_complete:
+            try:
+                on_complete(result)
+            except Exception as e:
+                print(f"⚠️ Action completion callback failed: {e}")
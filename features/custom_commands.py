@@ -1,8 +1,12 @@
 # features/custom_commands.py
 from database.db_manager import DatabaseManager
+from core.trigger_index import TriggerIndex
+from features.action_executor import ActionExecutor, ActionJob, ActionCancelled, ActionTimedOut
+from features.macro_scheduler import MacroScheduler, validate_macro, summarize
+from config import CUSTOM_COMMANDS_SYNC_INTERVAL, CUSTOM_ACTION_TIMEOUT, CUSTOM_MACRO_WORKERS
 import json
-import subprocess
 import os
+import time
 import webbrowser
 
 from PyQt5.QtWidgets import *
@@ -12,12 +16,62 @@ class CustomCommandsManager:
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
         self.commands_cache = {}
+        # user_id -> (custom_commands_version the cached commands were loaded at, monotonic time last checked)
+        self.cache_versions = {}
+        # user_id -> TriggerIndex over that user's active triggers, built on first match
+        self.trigger_indexes = {}
+        # Called with no arguments after any command is added, edited or removed
+        self.change_listeners = []
+        # Scripts and system commands run here, off the voice-processing thread
+        self.executor = ActionExecutor()
+        # Macro steps get their own pool: a macro holds an executor worker while it waits for them
+        self.macro_scheduler = MacroScheduler(ActionExecutor(max_workers=CUSTOM_MACRO_WORKERS))
+        # Runs built-in intents for macro steps: callable(intent, entities) -> reply (set by VoiceAssistant)
+        self.intent_runner = None
+        self.macro_intents = None
+
+    def set_intent_runner(self, runner, intents=None):
+        """
+        Let macro steps call built-in intents
+
+        Args:
+            runner: callable(intent, entities) -> reply text
+            intents: Intent names steps may use (checked when a macro is saved)
+        """
+        self.intent_runner = runner
+        self.macro_intents = set(intents) if intents is not None else None
+
+    def add_change_listener(self, callback):
+        """Register a callback for custom command changes (e.g. to clear NLU caches)"""
+        self.change_listeners.append(callback)
+
+    def _commands_changed(self, user_id=None):
+        """Refresh the trigger cache (one user's, or everyone's if unknown) and tell listeners"""
+        if user_id is None:
+            self.commands_cache.clear()
+            self.cache_versions.clear()
+            self.trigger_indexes.clear()
+        else:
+            self.load_user_commands(user_id)
+        self._notify_listeners()
+
+    def _notify_listeners(self):
+        for callback in self.change_listeners:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ Custom command listener failed: {e}")
 
     # --------------------
     # Persistence helpers
     # --------------------
     def create_custom_command(self, user_id, trigger_phrase, action_type, action_params):
         """Create a new custom command"""
+        if action_type == 'macro':
+            valid, error = validate_macro(action_params.get('steps'), self.macro_intents)
+            if not valid:
+                return False, f"Invalid macro: {error}"
+
         query = '''
             INSERT INTO custom_commands (user_id, trigger_phrase, action_type, action_params)
             VALUES (?, ?, ?, ?)
@@ -26,7 +80,7 @@ class CustomCommandsManager:
         self.db.execute_query(query, (user_id, trigger_phrase.lower(), action_type, action_params_json))
 
         # Update cache
-        self.load_user_commands(user_id)
+        self._commands_changed(user_id)
 
         return True, f"Custom command '{trigger_phrase}' created successfully"
 
@@ -51,37 +105,81 @@ class CustomCommandsManager:
         return commands
 
     def load_user_commands(self, user_id):
-        """Load user commands into cache"""
+        """Load user commands into cache (the trigger index is rebuilt on the next match)"""
+        # Version first: a write landing in between makes the next check reload again
+        version = self._stored_version(user_id)
         commands = self.get_user_commands(user_id)
         self.commands_cache[user_id] = {cmd['trigger_phrase']: cmd for cmd in commands if cmd['is_active']}
+        self.cache_versions[user_id] = (version, time.monotonic())
+        self.trigger_indexes.pop(user_id, None)
+
+    def _stored_version(self, user_id):
+        """Current custom_commands_version of a user (bumped by SQLite triggers on every write)"""
+        rows = self.db.execute_query('SELECT version FROM custom_commands_version WHERE user_id = ?', (user_id,))
+        return rows[0][0] if rows else 0
+
+    def _command_owner(self, command_id):
+        """user_id of a command, so a change only refreshes that user's triggers"""
+        rows = self.db.execute_query('SELECT user_id FROM custom_commands WHERE command_id = ?', (command_id,))
+        return rows[0][0] if rows else None
+
+    def _sync_user_commands(self, user_id):
+        """
+        Reload a user's commands if another process (or a direct DB edit)
+        changed them. Our own edits reload immediately; the version check
+        runs at most every CUSTOM_COMMANDS_SYNC_INTERVAL seconds.
+        """
+        version, checked_at = self.cache_versions.get(user_id, (None, 0.0))
+        now = time.monotonic()
+        if now - checked_at < CUSTOM_COMMANDS_SYNC_INTERVAL:
+            return
+
+        if self._stored_version(user_id) == version:
+            self.cache_versions[user_id] = (version, now)
+            return
+
+        print(f"🔄 Custom commands changed elsewhere, reloading for user {user_id}")
+        self.load_user_commands(user_id)
+        self._notify_listeners()
 
     def match_custom_command(self, user_id, text):
-        """Check if text matches any custom command (simple substring match)"""
+        """Check if text contains a trigger phrase (longest trigger wins)"""
         if user_id not in self.commands_cache:
             self.load_user_commands(user_id)
+        else:
+            self._sync_user_commands(user_id)
 
-        text_lower = text.lower()
-        user_map = self.commands_cache.get(user_id, {})
+        index = self.trigger_indexes.get(user_id)
+        if index is None:
+            index = self.trigger_indexes[user_id] = TriggerIndex(self.commands_cache.get(user_id, {}))
 
-        # exact trigger or substring
-        for trigger, command in user_map.items():
-            if trigger.strip() and (trigger == text_lower or trigger in text_lower):
-                return command
-        return None
+        return index.match(text.lower())
 
     # --------------------
     # Execution
     # --------------------
-    def execute_custom_command(self, command):
-        """Execute a custom command"""
+    def execute_custom_command(self, command, job=None):
+        """
+        Execute a custom command (blocks until it finishes or times out)
+
+        Args:
+            command: Command dict from match_custom_command
+            job: ActionJob when running on the executor; None = run here with the command's timeout
+        """
         action_type = command['action_type']
         action_params = command['action_params'] or {}
+        inline = job is None
+        if inline:
+            job = ActionJob(0, command.get('trigger_phrase', action_type), self.action_timeout(command))
+            job.started_at = time.monotonic()
 
         try:
             if action_type == 'run_script':
                 script_path = action_params.get('script_path')
                 if script_path and os.path.exists(script_path):
-                    subprocess.run([script_path], shell=True)
+                    returncode, stdout, stderr = job.run_process([script_path], shell=True)
+                    if returncode:
+                        return False, self._failure_message("Script", returncode, stderr or stdout)
                     return True, f"Executed script: {script_path}"
                 return False, "Script not found"
 
@@ -116,19 +214,92 @@ class CustomCommandsManager:
                 cmd = action_params.get('command')
                 if not cmd:
                     return False, "No command provided"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                return True, result.stdout.strip() if result.stdout else "Command executed"
+                returncode, stdout, stderr = job.run_process(cmd, shell=True)
+                if returncode:
+                    return False, self._failure_message("Command", returncode, stderr or stdout)
+                return True, stdout if stdout else "Command executed"
 
             elif action_type == 'speak_text':
                 text = action_params.get('text', '')
                 return True, text
 
+            elif action_type == 'macro':
+                steps = action_params.get('steps')
+                valid, error = validate_macro(steps)
+                if not valid:
+                    return False, f"Invalid macro: {error}"
+                results = self.macro_scheduler.run(job.name, steps, self._run_macro_step, job)
+                return summarize(results)
+
             else:
                 return False, f"Unknown action type: {action_type}"
 
+        except ActionTimedOut:
+            if inline:
+                return False, f"Timed out after {job.timeout:g} seconds"
+            raise  # The executor reports it
+        except ActionCancelled:
+            if inline:
+                return False, "Cancelled"
+            raise
         except Exception as e:
             return False, f"Error executing command: {str(e)}"
 
+    def _run_macro_step(self, step, job):
+        """One macro step: a built-in intent or a single custom action"""
+        if 'intent' in step:
+            if self.intent_runner is None:
+                return False, "Built-in commands are not available here"
+            reply = self.intent_runner(step['intent'], dict(step.get('entities') or {}))
+            return True, reply
+
+        command = {
+            'trigger_phrase': step['id'],
+            'action_type': step['action_type'],
+            'action_params': step.get('action_params') or {},
+        }
+        return self.execute_custom_command(command, job)
+
+    @staticmethod
+    def _failure_message(kind, returncode, output):
+        message = f"{kind} failed (exit code {returncode})"
+        return f"{message}: {output.splitlines()[-1]}" if output else message
+
+    def action_timeout(self, command):
+        """Per-command 'timeout' param (seconds), else CUSTOM_ACTION_TIMEOUT"""
+        try:
+            return float((command.get('action_params') or {}).get('timeout', CUSTOM_ACTION_TIMEOUT))
+        except (TypeError, ValueError):
+            return CUSTOM_ACTION_TIMEOUT
+
+    def execute_custom_command_async(self, command, on_complete=None):
+        """
+        Run a custom command on the action executor
+
+        Args:
+            command: Command dict from match_custom_command
+            on_complete: callable(ActionResult), called when it finishes
+
+        Returns:
+            Future resolving to an ActionResult (future.action_id for cancel_action)
+        """
+        name = command.get('trigger_phrase', command['action_type'])
+        return self.executor.submit(
+            name, lambda job: self.execute_custom_command(command, job),
+            timeout=self.action_timeout(command), on_complete=on_complete
+        )
+
+    def cancel_action(self, action_id=None):
+        """Cancel one running action, or all of them"""
+        if action_id is None:
+            return self.executor.cancel_all() > 0
+        return self.executor.cancel(action_id)
+
+    def shutdown(self):
+        """Cancel running actions and macro steps and stop both worker pools (app exit)"""
+        self.executor.shutdown()
+        self.macro_scheduler.executor.shutdown()
+
     # --------------------
     # CRUD helpers
     # --------------------
@@ -143,16 +314,21 @@ class CustomCommandsManager:
         params.append(command_id)
         query = f"UPDATE custom_commands SET {', '.join(updates)} WHERE command_id = ?"
         self.db.execute_query(query, tuple(params))
+        # user_id may itself have been updated: refresh everyone then
+        self._commands_changed(None if 'user_id' in kwargs else self._command_owner(command_id))
         return True, "Command updated successfully"
 
     def delete_custom_command(self, command_id):
+        user_id = self._command_owner(command_id)
         query = 'DELETE FROM custom_commands WHERE command_id = ?'
         self.db.execute_query(query, (command_id,))
+        self._commands_changed(user_id)
         return True, "Command deleted successfully"
 
     def toggle_command(self, command_id, is_active):
         query = 'UPDATE custom_commands SET is_active = ? WHERE command_id = ?'
         self.db.execute_query(query, (1 if is_active else 0, command_id))
+        self._commands_changed(self._command_owner(command_id))
         return True, f"Command {'enabled' if is_active else 'disabled'}"
 
 
@@ -274,6 +450,16 @@ class CustomCommandsGUI(QDialog):
             self.load_commands()
 
 
+# Pre-filled in the macro editor
+MACRO_EXAMPLE = json.dumps([
+    {"id": "chrome", "intent": "open_app", "entities": {"app_name": "chrome"}},
+    {"id": "vscode", "intent": "open_app", "entities": {"app_name": "vscode"}},
+    {"id": "weather", "intent": "get_weather", "entities": {"city": "Bengaluru"}},
+    {"id": "standup", "action_type": "open_url", "action_params": {"url": "https://meet.google.com"},
+     "depends_on": ["chrome"]}
+], indent=2)
+
+
 class AddCommandDialog(QDialog):
     """Dialog for adding new custom command"""
     def __init__(self, user_id, commands_manager, parent=None):
@@ -307,7 +493,8 @@ class AddCommandDialog(QDialog):
             'type_text',
             'press_keys',
             'run_command',
-            'speak_text'
+            'speak_text',
+            'macro'
         ])
         self.type_combo.currentTextChanged.connect(self.on_type_changed)
         layout.addWidget(self.type_combo)
@@ -387,6 +574,15 @@ class AddCommandDialog(QDialog):
             self.param_input.setMaximumHeight(100)
             self.params_layout.addWidget(self.param_input)
 
+        elif action_type == 'macro':
+            label = QLabel('Steps (JSON list; steps without depends_on run in parallel):')
+            self.params_layout.addWidget(label)
+
+            self.param_input = QTextEdit()
+            self.param_input.setAcceptRichText(False)
+            self.param_input.setPlainText(MACRO_EXAMPLE)
+            self.params_layout.addWidget(self.param_input)
+
     def save_command(self):
         """Save the custom command"""
         trigger_phrase = self.phrase_input.text().strip()
@@ -411,6 +607,12 @@ class AddCommandDialog(QDialog):
             action_params['keys'] = [k.strip() for k in keys_text.split(',') if k.strip()]
         elif action_type == 'run_command':
             action_params['command'] = self.param_input.text().strip()
+        elif action_type == 'macro':
+            try:
+                action_params['steps'] = json.loads(self.param_input.toPlainText())
+            except ValueError as e:
+                QMessageBox.warning(self, 'Error', f'Steps are not valid JSON: {e}')
+                return
 
         # Save to database
         success, message = self.commands_manager.create_custom_command(
@@ -0,0 +1,213 @@
+# features/macro_scheduler.py
+"""
+Macro commands: one trigger, several steps
+
+A macro is a DAG of steps stored in action_params['steps'] of a custom
+command with action_type 'macro'. A step either reuses a custom action
+type or calls a built-in intent:
+
+    {"id": "chrome",  "intent": "open_app", "entities": {"app_name": "chrome"}}
+    {"id": "weather", "intent": "get_weather", "entities": {"city": "Bengaluru"}}
+    {"id": "standup", "action_type": "open_url", "action_params": {"url": "https://meet.example.com"},
+     "depends_on": ["chrome"]}
+
+Steps whose dependencies are done run concurrently on a worker pool; a
+step only starts after everything in its depends_on succeeded, and is
+skipped if one of them failed.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+
+# Action types a step may use (macros don't nest)
+STEP_ACTION_TYPES = ('run_script', 'open_url', 'type_text', 'press_keys', 'run_command', 'speak_text')
+
+# How often a running macro checks for cancellation (seconds)
+POLL_INTERVAL = 0.1
+
+
+def validate_macro(steps, known_intents=None):
+    """
+    Check a macro definition
+
+    Args:
+        steps: List of step dicts
+        known_intents: Intent names a step may call (None = don't check)
+
+    Returns:
+        (ok, error message or None)
+    """
+    if not isinstance(steps, list) or not steps:
+        return False, "A macro needs a non-empty list of steps"
+
+    ids = set()
+    for number, step in enumerate(steps, 1):
+        if not isinstance(step, dict):
+            return False, f"Step {number} is not an object"
+        step_id = step.get('id')
+        if not step_id or not isinstance(step_id, str):
+            return False, f"Step {number} has no id"
+        if step_id in ids:
+            return False, f"Duplicate step id '{step_id}'"
+        ids.add(step_id)
+
+        if ('intent' in step) == ('action_type' in step):
+            return False, f"Step '{step_id}' needs exactly one of 'intent' or 'action_type'"
+        if 'intent' in step and known_intents is not None and step['intent'] not in known_intents:
+            return False, f"Step '{step_id}' uses unknown intent '{step['intent']}'"
+        if 'action_type' in step and step['action_type'] not in STEP_ACTION_TYPES:
+            return False, f"Step '{step_id}' uses unsupported action type '{step['action_type']}'"
+        if not isinstance(step.get('depends_on', []), list):
+            return False, f"Step '{step_id}': depends_on must be a list"
+        if 'timeout' in step:
+            try:
+                timeout = float(step['timeout'])
+            except (TypeError, ValueError):
+                timeout = 0
+            if not timeout > 0:
+                return False, f"Step '{step_id}': timeout must be a positive number of seconds"
+
+    for step in steps:
+        for dependency in step.get('depends_on', []):
+            if dependency not in ids:
+                return False, f"Step '{step['id']}' depends on unknown step '{dependency}'"
+
+    if len(topological_order(steps)) != len(steps):
+        return False, "Steps depend on each other in a cycle"
+    return True, None
+
+
+def topological_order(steps):
+    """Step ids in an order that respects depends_on (Kahn); shorter than steps if there's a cycle"""
+    waiting = {step['id']: len(set(step.get('depends_on', []))) for step in steps}
+    dependents = {step['id']: [] for step in steps}
+    for step in steps:
+        for dependency in set(step.get('depends_on', [])):
+            dependents.setdefault(dependency, []).append(step['id'])
+
+    ready = [step_id for step_id, count in waiting.items() if count == 0]
+    order = []
+    while ready:
+        step_id = ready.pop(0)
+        order.append(step_id)
+        for dependent in dependents.get(step_id, []):
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+    return order
+
+
+class MacroScheduler:
+    """Runs macro steps on an ActionExecutor, as many at once as the DAG allows"""
+
+    def __init__(self, executor):
+        """
+        Args:
+            executor: ActionExecutor for the steps (not the one running the macro
+                itself, so a macro waiting on its steps can't starve them of workers)
+        """
+        self.executor = executor
+
+    def run(self, name, steps, run_step, job=None):
+        """
+        Run a macro to completion
+
+        Args:
+            name: Macro name (trigger phrase), for step labels
+            steps: Validated step list
+            run_step: callable(step, step_job) -> (success, message)
+            job: ActionJob of the macro; its cancel flag and deadline apply to every step
+
+        Returns:
+            {step_id: ActionResult or None if skipped}, in step order
+
+        Raises:
+            ActionCancelled / ActionTimedOut from job.check() if the macro was stopped
+        """
+        by_id = {step['id']: step for step in steps}
+        remaining_deps = {step['id']: set(step.get('depends_on', [])) for step in steps}
+        results = {step['id']: None for step in steps}
+        running = {}  # future -> step id
+        finished = set()
+
+        def launch_ready():
+            if job is not None and (job.cancelled or job.remaining() == 0):
+                return
+            for step_id, deps in remaining_deps.items():
+                if not deps and step_id not in finished and step_id not in running.values():
+                    step = by_id[step_id]
+                    timeout = float(step['timeout']) if 'timeout' in step else None
+                    if job is not None and job.remaining() is not None:
+                        timeout = min(timeout, job.remaining()) if timeout else job.remaining()
+                    future = self.executor.submit(f"{name} › {step_id}",
+                                                  lambda step_job, step=step: run_step(step, step_job),
+                                                  timeout=timeout)
+                    running[future] = step_id
+
+        try:
+            launch_ready()
+            while running:
+                done, _ = wait(list(running), timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                if job is not None and (job.cancelled or job.remaining() == 0):
+                    for future in running:
+                        self.executor.cancel(future.action_id)
+                    done, _ = wait(list(running))
+
+                for future in done:
+                    step_id = running.pop(future)
+                    result = future.result()
+                    results[step_id] = result
+                    finished.add(step_id)
+                    if result.success:
+                        for deps in remaining_deps.values():
+                            deps.discard(step_id)
+                    else:
+                        self._skip_dependents(step_id, remaining_deps, finished)
+
+                launch_ready()
+        finally:
+            # Nothing outlives the macro, even if scheduling itself failed
+            for future in running:
+                self.executor.cancel(future.action_id)
+
+        if job is not None:
+            job.check()  # Cancelled or out of time: report that rather than a partial summary
+        return results
+
+    @staticmethod
+    def _skip_dependents(failed_id, remaining_deps, finished):
+        """Everything that (transitively) needs a failed step will never run"""
+        blocked = [failed_id]
+        while blocked:
+            current = blocked.pop()
+            for step_id, deps in remaining_deps.items():
+                if current in deps and step_id not in finished:
+                    finished.add(step_id)
+                    blocked.append(step_id)
+
+
+def summarize(results):
+    """
+    Speakable summary: what the steps said (e.g. the weather), then any failures
+
+    Returns:
+        (all steps succeeded, message)
+    """
+    said, failed, skipped = [], [], []
+    for step_id, result in results.items():
+        if result is None:
+            skipped.append(step_id)
+        elif not result.success:
+            failed.append(f"{step_id}: {result.message}")
+        elif result.message:
+            said.append(str(result.message))
+
+    parts = said[:]
+    if failed:
+        parts.append("Failed - " + "; ".join(failed))
+    if skipped:
+        parts.append("Skipped - " + ", ".join(skipped))
+    ok = not failed and not skipped
+    done = sum(1 for result in results.values() if result is not None and result.success)
+    parts.append(f"{done} of {len(results)} steps done")
+    return ok, ". ".join(part.rstrip('.') for part in parts) + "."
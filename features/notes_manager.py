@@ -4,7 +4,33 @@ from datetime import datetime
 import json
 import platform
 
+from core.response import localize
+
 class NotesManager:
+    # Static replies (pre-synthesised into the TTS cache at startup)
+    STATIC_RESPONSES = {
+        'no_notes': {
+            'en': "You don't have any notes yet",
+            'hi': "आपके पास अभी तक कोई नोट नहीं है",
+            'kn': "ನಿಮ್ಮ ಬಳಿ ಇನ್ನೂ ಯಾವುದೇ ನೋಟ್‌ಗಳಿಲ್ಲ"
+        },
+        'no_changes': {
+            'en': "No changes to update",
+            'hi': "अपडेट करने के लिए कोई परिवर्तन नहीं",
+            'kn': "ನವೀಕರಿಸಲು ಯಾವುದೇ ಬದಲಾವಣೆಗಳಿಲ್ಲ"
+        },
+        'note_updated': {
+            'en': "Note updated successfully",
+            'hi': "नोट सफलतापूर्वक अपडेट किया गया",
+            'kn': "ನೋಟ್ ಯಶಸ್ವಿಯಾಗಿ ನವೀಕರಿಸಲಾಗಿದೆ"
+        },
+        'note_deleted': {
+            'en': "Note deleted successfully",
+            'hi': "नोट सफलतापूर्वक हटाया गया",
+            'kn': "ನೋಟ್ ಯಶಸ್ವಿಯಾಗಿ ಅಳಿಸಲಾಗಿದೆ"
+        }
+    }
+
     def __init__(self, db_manager):
         self.db = db_manager
         self.platform = platform.system()
@@ -35,7 +61,7 @@ class NotesManager:
                 'hi': f"नोट सफलतापूर्वक बनाया गया: {title}",
                 'kn': f"ನೋಟ್ ಯಶಸ್ವಿಯಾಗಿ ರಚಿಸಲಾಗಿದೆ: {title}"
             }
-            success_msg = success_messages.get(language, success_messages['en'])
+            success_msg = localize(success_messages, language)
             print(f"✅ {success_msg}")
             print(f"{'='*60}\n")
             
@@ -46,7 +72,7 @@ class NotesManager:
                 'hi': f"नोट बनाने में विफल: {str(e)}",
                 'kn': f"ನೋಟ್ ರಚಿಸಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -93,7 +119,7 @@ class NotesManager:
                     'hi': f"'{search_term}' से मेल खाते {len(results)} नोट मिले",
                     'kn': f"'{search_term}' ಗೆ ಹೊಂದಿಕೆಯಾಗುವ {len(results)} ನೋಟ್‌ಗಳು ಕಂಡುಬಂದಿವೆ"
                 }
-                return True, result_messages.get(language, result_messages['en']), notes_list
+                return True, localize(result_messages, language), notes_list
             else:
                 print(f"⚠️ No notes found")
                 print(f"{'='*60}\n")
@@ -103,14 +129,14 @@ class NotesManager:
                     'hi': f"'{search_term}' से मेल खाने वाले कोई नोट नहीं मिले",
                     'kn': f"'{search_term}' ಗೆ ಹೊಂದಿಕೆಯಾಗುವ ನೋಟ್‌ಗಳು ಕಂಡುಬಂದಿಲ್ಲ"
                 }
-                return False, no_result_messages.get(language, no_result_messages['en']), []
+                return False, localize(no_result_messages, language), []
         except Exception as e:
             error_messages = {
                 'en': f"Failed to search notes: {str(e)}",
                 'hi': f"नोट खोजने में विफल: {str(e)}",
                 'kn': f"ನೋಟ್‌ಗಳನ್ನು ಹುಡುಕಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg, []
@@ -142,21 +168,17 @@ class NotesManager:
                     'hi': f"आपके पास {len(results)} नोट हैं",
                     'kn': f"ನಿಮ್ಮ ಬಳಿ {len(results)} ನೋಟ್‌ಗಳಿವೆ"
                 }
-                return True, result_messages.get(language, result_messages['en']), notes_list
+                return True, localize(result_messages, language), notes_list
             else:
-                no_notes_messages = {
-                    'en': "You don't have any notes yet",
-                    'hi': "आपके पास अभी तक कोई नोट नहीं है",
-                    'kn': "ನಿಮ್ಮ ಬಳಿ ಇನ್ನೂ ಯಾವುದೇ ನೋಟ್‌ಗಳಿಲ್ಲ"
-                }
-                return False, no_notes_messages.get(language, no_notes_messages['en']), []
+                no_notes_messages = self.STATIC_RESPONSES['no_notes']
+                return False, localize(no_notes_messages, language), []
         except Exception as e:
             error_messages = {
                 'en': f"Failed to fetch notes: {str(e)}",
                 'hi': f"नोट प्राप्त करने में विफल: {str(e)}",
                 'kn': f"ನೋಟ್‌ಗಳನ್ನು ಪಡೆಯಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            return False, error_messages.get(language, error_messages['en']), []
+            return False, localize(error_messages, language), []
 
     def update_note(self, note_id, title=None, content=None, tags=None, language='en'):
         """Update an existing note"""
@@ -182,12 +204,8 @@ class NotesManager:
                 params.append(json.dumps(tags))
             
             if not updates:
-                no_update_messages = {
-                    'en': "No changes to update",
-                    'hi': "अपडेट करने के लिए कोई परिवर्तन नहीं",
-                    'kn': "ನವೀಕರಿಸಲು ಯಾವುದೇ ಬದಲಾವಣೆಗಳಿಲ್ಲ"
-                }
-                return False, no_update_messages.get(language, no_update_messages['en'])
+                no_update_messages = self.STATIC_RESPONSES['no_changes']
+                return False, localize(no_update_messages, language)
             
             updates.append("updated_at = ?")
             params.append(datetime.now())
@@ -196,12 +214,8 @@ class NotesManager:
             query = f"UPDATE notes SET {', '.join(updates)} WHERE note_id = ?"
             self.db.execute_query(query, tuple(params))
             
-            success_messages = {
-                'en': "Note updated successfully",
-                'hi': "नोट सफलतापूर्वक अपडेट किया गया",
-                'kn': "ನೋಟ್ ಯಶಸ್ವಿಯಾಗಿ ನವೀಕರಿಸಲಾಗಿದೆ"
-            }
-            success_msg = success_messages.get(language, success_messages['en'])
+            success_messages = self.STATIC_RESPONSES['note_updated']
+            success_msg = localize(success_messages, language)
             print(f"✅ {success_msg}")
             print(f"{'='*60}\n")
             
@@ -212,7 +226,7 @@ class NotesManager:
                 'hi': f"नोट अपडेट करने में विफल: {str(e)}",
                 'kn': f"ನೋಟ್ ನವೀಕರಿಸಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -230,12 +244,8 @@ class NotesManager:
             query = 'DELETE FROM notes WHERE note_id = ?'
             self.db.execute_query(query, (note_id,))
             
-            success_messages = {
-                'en': "Note deleted successfully",
-                'hi': "नोट सफलतापूर्वक हटाया गया",
-                'kn': "ನೋಟ್ ಯಶಸ್ವಿಯಾಗಿ ಅಳಿಸಲಾಗಿದೆ"
-            }
-            success_msg = success_messages.get(language, success_messages['en'])
+            success_messages = self.STATIC_RESPONSES['note_deleted']
+            success_msg = localize(success_messages, language)
             print(f"✅ {success_msg}")
             print(f"{'='*60}\n")
             
@@ -246,7 +256,7 @@ class NotesManager:
                 'hi': f"नोट हटाने में विफल: {str(e)}",
                 'kn': f"ನೋಟ್ ಅಳಿಸಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
\ No newline at end of file
@@ -2,6 +2,8 @@
 import os
 import platform
 
+from core.response import localize
+
 class PDFReader:
     def __init__(self):
         self.platform = platform.system()
@@ -40,7 +42,7 @@ class PDFReader:
                 'hi': f"पीडीएफ फाइल नहीं मिली: {file_path}",
                 'kn': f"ಪಿಡಿಎಫ್ ಫೈಲ್ ಸಿಗಲಿಲ್ಲ: {file_path}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -52,7 +54,7 @@ class PDFReader:
                 'hi': f"यह पीडीएफ फाइल नहीं है: {file_path}",
                 'kn': f"ಇದು ಪಿಡಿಎಫ್ ಫೈಲ್ ಅಲ್ಲ: {file_path}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -63,7 +65,7 @@ class PDFReader:
                 'hi': "पीडीएफ लाइब्रेरी उपलब्ध नहीं है। इंस्टॉल करें: pip install pdfplumber PyPDF2",
                 'kn': "ಪಿಡಿಎಫ್ ಲೈಬ್ರರಿ ಲಭ್ಯವಿಲ್ಲ. ಇನ್‌ಸ್ಟಾಲ್ ಮಾಡಿ: pip install pdfplumber PyPDF2"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -126,7 +128,7 @@ class PDFReader:
                     'hi': "पीडीएफ से टेक्स्ट निकाला नहीं जा सका। यह स्कैन की गई फाइल हो सकती है।",
                     'kn': "ಪಿಡಿಎಫ್‌ನಿಂದ ಪಠ್ಯವನ್ನು ಹೊರತೆಗೆಯಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ಇದು ಸ್ಕ್ಯಾನ್ ಮಾಡಿದ ಫೈಲ್ ಆಗಿರಬಹುದು."
                 }
-                error_msg = error_messages.get(language, error_messages['en'])
+                error_msg = localize(error_messages, language)
                 print(f"❌ {error_msg}")
                 print(f"{'='*60}\n")
                 return False, error_msg
@@ -137,7 +139,7 @@ class PDFReader:
                 'hi': f"फाइल नहीं मिली: {file_path}",
                 'kn': f"ಫೈಲ್ ಸಿಗಲಿಲ್ಲ: {file_path}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -147,7 +149,7 @@ class PDFReader:
                 'hi': f"फाइल खोलने की अनुमति नहीं है: {file_path}",
                 'kn': f"ಫೈಲ್ ತೆರೆಯಲು ಅನುಮತಿ ಇಲ್ಲ: {file_path}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -157,7 +159,7 @@ class PDFReader:
                 'hi': f"पीडीएफ पढ़ने में विफल: {str(e)}",
                 'kn': f"ಪಿಡಿಎಫ್ ಓದಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            error_msg = error_messages.get(language, error_messages['en'])
+            error_msg = localize(error_messages, language)
             print(f"❌ {error_msg}")
             print(f"{'='*60}\n")
             return False, error_msg
@@ -177,7 +179,7 @@ class PDFReader:
                     'hi': f"पीडीएफ सारांश (पहले {max_chars} अक्षर):\n\n{summary}",
                     'kn': f"ಪಿಡಿಎಫ್ ಸಾರಾಂಶ (ಮೊದಲ {max_chars} ಅಕ್ಷರಗಳು):\n\n{summary}"
                 }
-                return True, summary_messages.get(language, summary_messages['en'])
+                return True, localize(summary_messages, language)
             
             return True, summary
         return success, content
@@ -190,7 +192,7 @@ class PDFReader:
                 'hi': "पीडीएफ फाइल नहीं मिली",
                 'kn': "ಪಿಡಿಎಫ್ ಫೈಲ್ ಸಿಗಲಿಲ್ಲ"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
         
         try:
             if self.pypdf2_available:
@@ -208,13 +210,13 @@ class PDFReader:
                         'hi': f"पीडीएफ जानकारी: {info['pages']} पृष्ठ, शीर्षक: {info['title']}, लेखक: {info['author']}",
                         'kn': f"ಪಿಡಿಎಫ್ ಮಾಹಿತಿ: {info['pages']} ಪುಟಗಳು, ಶೀರ್ಷಿಕೆ: {info['title']}, ಲೇಖಕ: {info['author']}"
                     }
-                    return True, info_messages.get(language, info_messages['en'])
+                    return True, localize(info_messages, language)
             else:
                 error_messages = {
                     'en': "PyPDF2 not available for metadata extraction",
                     'hi': "मेटाडेटा निकालने के लिए PyPDF2 उपलब्ध नहीं है",
                     'kn': "ಮೆಟಾಡೇಟಾ ಹೊರತೆಗೆಯಲು PyPDF2 ಲಭ್ಯವಿಲ್ಲ"
                 }
-                return False, error_messages.get(language, error_messages['en'])
+                return False, localize(error_messages, language)
         except Exception as e:
             return False, f"Error: {str(e)}"
\ No newline at end of file
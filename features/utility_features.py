@@ -7,7 +7,23 @@ import subprocess
 import webbrowser
 import os
 
+from core.response import Response, localize
+
 class UtilityFeatures:
+    # Static replies (pre-synthesised into the TTS cache at startup)
+    STATIC_RESPONSES = {
+        'weather_unavailable': {
+            'en': "Unable to fetch weather data. Please check your internet connection.",
+            'hi': "मौसम की जानकारी प्राप्त नहीं की जा सकी। कृपया इंटरनेट कनेक्शन जांचें।",
+            'kn': "ಹವಾಮಾನ ಮಾಹಿತಿ ಪಡೆಯಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಇಂಟರ್ನೆಟ್ ಸಂಪರ್ಕ ಪರಿಶೀಲಿಸಿ।"
+        },
+        'news_unavailable': {
+            'en': "Unable to fetch news. Please check your internet connection.",
+            'hi': "समाचार प्राप्त नहीं किया जा सका। कृपया इंटरनेट कनेक्शन जांचें।",
+            'kn': "ಸುದ್ದಿ ಪಡೆಯಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಇಂಟರ್ನೆಟ್ ಸಂಪರ್ಕ ಪರಿಶೀಲಿಸಿ।"
+        }
+    }
+
     def __init__(self):
         self.jokes_cache = []
         self.weather_api_key = None
@@ -81,27 +97,27 @@ class UtilityFeatures:
                     'hi': "सिस्टम 5 सेकंड में बंद हो जाएगा",
                     'kn': "ಸಿಸ್ಟಮ್ 5 ಸೆಕೆಂಡ್‌ಗಳಲ್ಲಿ ಮುಚ್ಚುತ್ತದೆ"
                 }
-                print(f"✅ {success_messages.get(language, success_messages['en'])}")
+                print(f"✅ {localize(success_messages, language)}")
                 print(f"{'='*60}\n")
-                return True, success_messages.get(language, success_messages['en'])
+                return True, localize(success_messages, language)
             except Exception as e:
                 error_messages = {
                     'en': f"Failed to shutdown: {str(e)}",
                     'hi': f"शटडाउन विफल: {str(e)}",
                     'kn': f"ಷಟ್‌ಡೌನ್ ವಿಫಲವಾಯಿತು: {str(e)}"
                 }
-                print(f"❌ {error_messages.get(language, error_messages['en'])}")
+                print(f"❌ {localize(error_messages, language)}")
                 print(f"{'='*60}\n")
-                return False, error_messages.get(language, error_messages['en'])
+                return False, localize(error_messages, language)
         else:
             error_messages = {
                 'en': "Shutdown only supported on Windows",
                 'hi': "शटडाउन केवल Windows पर समर्थित है",
                 'kn': "ಷಟ್‌ಡೌನ್ Windows ನಲ್ಲಿ ಮಾತ್ರ ಬೆಂಬಲಿತವಾಗಿದೆ"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def restart_system(self, language='en'):
         """Restart the computer"""
@@ -117,27 +133,27 @@ class UtilityFeatures:
                     'hi': "सिस्टम 5 सेकंड में रीस्टार्ट होगा",
                     'kn': "ಸಿಸ್ಟಮ್ 5 ಸೆಕೆಂಡ್‌ಗಳಲ್ಲಿ ಮರುಪ್ರಾರಂಭವಾಗುತ್ತದೆ"
                 }
-                print(f"✅ {success_messages.get(language, success_messages['en'])}")
+                print(f"✅ {localize(success_messages, language)}")
                 print(f"{'='*60}\n")
-                return True, success_messages.get(language, success_messages['en'])
+                return True, localize(success_messages, language)
             except Exception as e:
                 error_messages = {
                     'en': f"Failed to restart: {str(e)}",
                     'hi': f"रीस्टार्ट विफल: {str(e)}",
                     'kn': f"ಮರುಪ್ರಾರಂಭ ವಿಫಲವಾಯಿತು: {str(e)}"
                 }
-                print(f"❌ {error_messages.get(language, error_messages['en'])}")
+                print(f"❌ {localize(error_messages, language)}")
                 print(f"{'='*60}\n")
-                return False, error_messages.get(language, error_messages['en'])
+                return False, localize(error_messages, language)
         else:
             error_messages = {
                 'en': "Restart only supported on Windows",
                 'hi': "रीस्टार्ट केवल Windows पर समर्थित है",
                 'kn': "ಮರುಪ್ರಾರಂಭ Windows ನಲ್ಲಿ ಮಾತ್ರ ಬೆಂಬಲಿತವಾಗಿದೆ"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def sleep_system(self, language='en'):
         """Put system to sleep"""
@@ -153,27 +169,27 @@ class UtilityFeatures:
                     'hi': "सिस्टम स्लीप मोड में जा रहा है",
                     'kn': "ಸಿಸ್ಟಮ್ ಸ್ಲೀಪ್ ಮೋಡ್‌ಗೆ ಹೋಗುತ್ತಿದೆ"
                 }
-                print(f"✅ {success_messages.get(language, success_messages['en'])}")
+                print(f"✅ {localize(success_messages, language)}")
                 print(f"{'='*60}\n")
-                return True, success_messages.get(language, success_messages['en'])
+                return True, localize(success_messages, language)
             except Exception as e:
                 error_messages = {
                     'en': f"Failed to sleep: {str(e)}",
                     'hi': f"स्लीप विफल: {str(e)}",
                     'kn': f"ಸ್ಲೀಪ್ ವಿಫಲವಾಯಿತು: {str(e)}"
                 }
-                print(f"❌ {error_messages.get(language, error_messages['en'])}")
+                print(f"❌ {localize(error_messages, language)}")
                 print(f"{'='*60}\n")
-                return False, error_messages.get(language, error_messages['en'])
+                return False, localize(error_messages, language)
         else:
             error_messages = {
                 'en': "Sleep only supported on Windows",
                 'hi': "स्लीप केवल Windows पर समर्थित है",
                 'kn': "ಸ್ಲೀಪ್ Windows ನಲ್ಲಿ ಮಾತ್ರ ಬೆಂಬಲಿತವಾಗಿದೆ"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def lock_system(self, language='en'):
         """Lock the computer"""
@@ -189,27 +205,27 @@ class UtilityFeatures:
                     'hi': "सिस्टम लॉक हो गया",
                     'kn': "ಸಿಸ್ಟಮ್ ಲಾಕ್ ಆಗಿದೆ"
                 }
-                print(f"✅ {success_messages.get(language, success_messages['en'])}")
+                print(f"✅ {localize(success_messages, language)}")
                 print(f"{'='*60}\n")
-                return True, success_messages.get(language, success_messages['en'])
+                return True, localize(success_messages, language)
             except Exception as e:
                 error_messages = {
                     'en': f"Failed to lock: {str(e)}",
                     'hi': f"लॉक विफल: {str(e)}",
                     'kn': f"ಲಾಕ್ ವಿಫಲವಾಯಿತು: {str(e)}"
                 }
-                print(f"❌ {error_messages.get(language, error_messages['en'])}")
+                print(f"❌ {localize(error_messages, language)}")
                 print(f"{'='*60}\n")
-                return False, error_messages.get(language, error_messages['en'])
+                return False, localize(error_messages, language)
         else:
             error_messages = {
                 'en': "Lock only supported on Windows",
                 'hi': "लॉक केवल Windows पर समर्थित है",
                 'kn': "ಲಾಕ್ Windows ನಲ್ಲಿ ಮಾತ್ರ ಬೆಂಬಲಿತವಾಗಿದೆ"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def open_website(self, url, language='en'):
         """Open a specific website"""
@@ -231,18 +247,18 @@ class UtilityFeatures:
                 'hi': f"खोल रहे हैं: {url}",
                 'kn': f"ತೆರೆಯುತ್ತಿದೆ: {url}"
             }
-            print(f"✅ {success_messages.get(language, success_messages['en'])}")
+            print(f"✅ {localize(success_messages, language)}")
             print(f"{'='*60}\n")
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to open website: {str(e)}",
                 'hi': f"वेबसाइट खोलने में विफल: {str(e)}",
                 'kn': f"ವೆಬ್‌ಸೈಟ್ ತೆರೆಯಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     # ============================================================================
     # KEYBOARD CONTROL COMMANDS
@@ -256,7 +272,7 @@ class UtilityFeatures:
                 'hi': "कीबोर्ड नियंत्रण उपलब्ध नहीं है। इंस्टॉल करें: pip install pyautogui",
                 'kn': "ಕೀಬೋರ್ಡ್ ನಿಯಂತ್ರಣ ಲಭ್ಯವಿಲ್ಲ. ಇನ್‌ಸ್ಟಾಲ್ ಮಾಡಿ: pip install pyautogui"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
         
         try:
             import pyautogui
@@ -266,14 +282,14 @@ class UtilityFeatures:
                 'hi': "टेक्स्ट कॉपी हो गया",
                 'kn': "ಪಠ್ಯ ಕಾಪಿ ಆಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to copy: {str(e)}",
                 'hi': f"कॉपी विफल: {str(e)}",
                 'kn': f"ಕಾಪಿ ವಿಫಲವಾಯಿತು: {str(e)}"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def paste_text(self, language='en'):
         """Simulate Ctrl+V"""
@@ -283,7 +299,7 @@ class UtilityFeatures:
                 'hi': "कीबोर्ड नियंत्रण उपलब्ध नहीं है। इंस्टॉल करें: pip install pyautogui",
                 'kn': "ಕೀಬೋರ್ಡ್ ನಿಯಂತ್ರಣ ಲಭ್ಯವಿಲ್ಲ. ಇನ್‌ಸ್ಟಾಲ್ ಮಾಡಿ: pip install pyautogui"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
         
         try:
             import pyautogui
@@ -293,14 +309,14 @@ class UtilityFeatures:
                 'hi': "टेक्स्ट पेस्ट हो गया",
                 'kn': "ಪಠ್ಯ ಪೇಸ್ಟ್ ಆಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to paste: {str(e)}",
                 'hi': f"पेस्ट विफल: {str(e)}",
                 'kn': f"ಪೇಸ್ಟ್ ವಿಫಲವಾಯಿತು: {str(e)}"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def select_all(self, language='en'):
         """Simulate Ctrl+A"""
@@ -310,7 +326,7 @@ class UtilityFeatures:
                 'hi': "कीबोर्ड नियंत्रण उपलब्ध नहीं है",
                 'kn': "ಕೀಬೋರ್ಡ್ ನಿಯಂತ್ರಣ ಲಭ್ಯವಿಲ್ಲ"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
         
         try:
             import pyautogui
@@ -320,7 +336,7 @@ class UtilityFeatures:
                 'hi': "सभी टेक्स्ट चुना गया",
                 'kn': "ಎಲ್ಲಾ ಪಠ್ಯ ಆಯ್ಕೆಯಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -337,7 +353,7 @@ class UtilityFeatures:
                 'hi': "क्रिया पूर्ववत हुई",
                 'kn': "ಕ್ರಿಯೆ ರದ್ದುಗೊಳಿಸಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -354,7 +370,7 @@ class UtilityFeatures:
                 'hi': "क्रिया फिर से की गई",
                 'kn': "ಕ್ರಿಯೆ ಪುನಃ ಮಾಡಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -366,7 +382,7 @@ class UtilityFeatures:
                 'hi': "स्क्रीनशॉट सुविधा उपलब्ध नहीं है",
                 'kn': "ಸ್ಕ್ರೀನ್‌ಶಾಟ್ ವೈಶಿಷ್ಟ್ಯ ಲಭ್ಯವಿಲ್ಲ"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
         
         try:
             import pyautogui
@@ -377,14 +393,14 @@ class UtilityFeatures:
                 'hi': f"स्क्रीनशॉट {filename} के रूप में सहेजा गया",
                 'kn': f"ಸ್ಕ್ರೀನ್‌ಶಾಟ್ {filename} ಆಗಿ ಉಳಿಸಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to take screenshot: {str(e)}",
                 'hi': f"स्क्रीनशॉट लेने में विफल: {str(e)}",
                 'kn': f"ಸ್ಕ್ರೀನ್‌ಶಾಟ್ ತೆಗೆಯಲು ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def increase_volume(self, language='en'):
         """Increase system volume"""
@@ -400,7 +416,7 @@ class UtilityFeatures:
                 'hi': "वॉल्यूम बढ़ाया गया",
                 'kn': "ವಾಲ್ಯೂಮ್ ಹೆಚ್ಚಿಸಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -418,7 +434,7 @@ class UtilityFeatures:
                 'hi': "वॉल्यूम कम किया गया",
                 'kn': "ವಾಲ್ಯೂಮ್ ಕಡಿಮೆ ಮಾಡಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -435,7 +451,7 @@ class UtilityFeatures:
                 'hi': "वॉल्यूम म्यूट किया गया",
                 'kn': "ವಾಲ್ಯೂಮ್ ಮ್ಯೂಟ್ ಮಾಡಲಾಗಿದೆ"
             }
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             return False, f"Failed: {str(e)}"
     
@@ -463,18 +479,18 @@ class UtilityFeatures:
                 'hi': f"खोज रहे हैं: {query}",
                 'kn': f"ಹುಡುಕುತ್ತಿದೆ: {query}"
             }
-            print(f"✅ {success_messages.get(language, success_messages['en'])}")
+            print(f"✅ {localize(success_messages, language)}")
             print(f"{'='*60}\n")
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to search: {str(e)}",
                 'hi': f"खोज विफल: {str(e)}",
                 'kn': f"ಹುಡುಕಾಟ ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     def search_youtube(self, query, language='en'):
         """Search on YouTube"""
@@ -496,18 +512,18 @@ class UtilityFeatures:
                 'hi': f"YouTube पर खोज रहे हैं: {query}",
                 'kn': f"YouTube ನಲ್ಲಿ ಹುಡುಕುತ್ತಿದೆ: {query}"
             }
-            print(f"✅ {success_messages.get(language, success_messages['en'])}")
+            print(f"✅ {localize(success_messages, language)}")
             print(f"{'='*60}\n")
-            return True, success_messages.get(language, success_messages['en'])
+            return True, localize(success_messages, language)
         except Exception as e:
             error_messages = {
                 'en': f"Failed to search YouTube: {str(e)}",
                 'hi': f"YouTube खोज विफल: {str(e)}",
                 'kn': f"YouTube ಹುಡುಕಾಟ ವಿಫಲವಾಗಿದೆ: {str(e)}"
             }
-            print(f"❌ {error_messages.get(language, error_messages['en'])}")
+            print(f"❌ {localize(error_messages, language)}")
             print(f"{'='*60}\n")
-            return False, error_messages.get(language, error_messages['en'])
+            return False, localize(error_messages, language)
     
     # ============================================================================
     # EXISTING METHODS (Time, Date, Weather, Jokes, News)
@@ -518,38 +534,38 @@ class UtilityFeatures:
         now = datetime.now()
         
         if language == "en":
-            return now.strftime("The current time is %I:%M %p")
+            return Response(now.strftime("The current time is %I:%M %p"), "en")
         elif language == "hi":
             time_str = now.strftime("%I:%M %p")
-            return f"अभी समय है {time_str}"
+            return Response(f"अभी समय है {time_str}", "hi")
         elif language == "kn":
             time_str = now.strftime("%I:%M %p")
-            return f"ಈಗ ಸಮಯ {time_str}"
+            return Response(f"ಈಗ ಸಮಯ {time_str}", "kn")
         else:
-            return now.strftime("The current time is %I:%M %p")
+            return Response(now.strftime("The current time is %I:%M %p"), "en")
     
     def get_current_date(self, language="en"):
         """Get current date in specified language"""
         now = datetime.now()
     
         if language == "en":
-            return now.strftime("Today is %A, %B %d, %Y")
+            return Response(now.strftime("Today is %A, %B %d, %Y"), "en")
         elif language == "hi":
             weekdays_hi = ['सोमवार', 'मंगलवार', 'बुधवार', 'गुरुवार', 'शुक्रवार', 'शनिवार', 'रविवार']
             months_hi = ['जनवरी', 'फरवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 
                      'जुलाई', 'अगस्त', 'सितंबर', 'अक्टूबर', 'नवंबर', 'दिसंबर']
             weekday = weekdays_hi[now.weekday()]
             month = months_hi[now.month - 1]
-            return f"आज {weekday}, {now.day} {month} {now.year} है"
+            return Response(f"आज {weekday}, {now.day} {month} {now.year} है", "hi")
         elif language == "kn":
             weekdays_kn = ['ಸೋಮವಾರ', 'ಮಂಗಳವಾರ', 'ಬುಧವಾರ', 'ಗುರುವಾರ', 'ಶುಕ್ರವಾರ', 'ಶನಿವಾರ', 'ಭಾನುವಾರ']
             months_kn = ['ಜನವರಿ', 'ಫೆಬ್ರವರಿ', 'ಮಾರ್ಚ್', 'ಏಪ್ರಿಲ್', 'ಮೇ', 'ಜೂನ್',
                      'ಜುಲೈ', 'ಆಗಸ್ಟ್', 'ಸೆಪ್ಟೆಂಬರ್', 'ಅಕ್ಟೋಬರ್', 'ನವೆಂಬರ್', 'ಡಿಸೆಂಬರ್']
             weekday = weekdays_kn[now.weekday()]
             month = months_kn[now.month - 1]
-            return f"ಇಂದು {weekday}, {now.day} {month} {now.year}"
+            return Response(f"ಇಂದು {weekday}, {now.day} {month} {now.year}", "kn")
         else:
-            return now.strftime("Today is %A, %B %d, %Y")
+            return Response(now.strftime("Today is %A, %B %d, %Y"), "en")
     
     def get_weather(self, city="Bengaluru", language="en"):
         """Get weather information"""
@@ -567,11 +583,13 @@ class UtilityFeatures:
                 humidity = data['main']['humidity']
                 
                 if language == "en":
-                    return f"The weather in {city} is {description}. Temperature is {temp}°C with {humidity}% humidity."
+                    return Response(f"The weather in {city} is {description}. Temperature is {temp}°C with {humidity}% humidity.", "en")
                 elif language == "hi":
-                    return f"{city} में मौसम {description} है। तापमान {temp}°C है और आर्द्रता {humidity}% है।"
+                    return Response(f"{city} में मौसम {description} है। तापमान {temp}°C है और आर्द्रता {humidity}% है।", "hi")
                 elif language == "kn":
-                    return f"{city} ನಲ್ಲಿ ಹವಾಮಾನ {description} ಇದೆ। ತಾಪಮಾನ {temp}°C ಮತ್ತು ಆರ್ದ್ರತೆ {humidity}% ಇದೆ।"
+                    return Response(f"{city} ನಲ್ಲಿ ಹವಾಮಾನ {description} ಇದೆ। ತಾಪಮಾನ {temp}°C ಮತ್ತು ಆರ್ದ್ರತೆ {humidity}% ಇದೆ।", "kn")
+                else:
+                    return Response(f"The weather in {city} is {description}. Temperature is {temp}°C with {humidity}% humidity.", "en")
             else:
                 return self._get_mock_weather(city, language)
         except:
@@ -579,12 +597,7 @@ class UtilityFeatures:
     
     def _get_mock_weather(self, city, language):
         """Return mock weather data when API is not available"""
-        if language == "en":
-            return f"Unable to fetch weather data. Please check your internet connection."
-        elif language == "hi":
-            return f"मौसम की जानकारी प्राप्त नहीं की जा सकी। कृपया इंटरनेट कनेक्शन जांचें।"
-        elif language == "kn":
-            return f"ಹವಾಮಾನ ಮಾಹಿತಿ ಪಡೆಯಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಇಂಟರ್ನೆಟ್ ಸಂಪರ್ಕ ಪರಿಶೀಲಿಸಿ।"
+        return localize(self.STATIC_RESPONSES['weather_unavailable'], language)
     
     def tell_joke(self, language="en"):
         """Tell a random joke"""
@@ -594,8 +607,8 @@ class UtilityFeatures:
         print(f"🌍 Language: {language}")
         print(f"{'='*60}")
         
-        joke_list = self.jokes_database.get(language, self.jokes_database["en"])
-        joke = random.choice(joke_list)
+        joke_language = language if language in self.jokes_database else "en"
+        joke = Response(random.choice(self.jokes_database[joke_language]), joke_language)
         
         print(f"🎭 Joke: {joke}")
         print(f"{'='*60}\n")
@@ -629,8 +642,8 @@ class UtilityFeatures:
                     "ಮಜೆದಾರ ಸತ್ಯ: ಆಕ್ಟೋಪಸ್‌ಗೆ ಮೂರು ಹೃದಯಗಳಿವೆ!",
                 ]
             }
-            facts = fun_facts.get(language, fun_facts['en'])
-            return random.choice(facts)
+            fact_language = language if language in fun_facts else 'en'
+            return Response(random.choice(fun_facts[fact_language]), fact_language)
         
         else:
             quotes = {
@@ -645,8 +658,8 @@ class UtilityFeatures:
                     "\"ಮಹಾನ್ ಕೆಲಸ ಮಾಡುವ ಏಕೈಕ ಮಾರ್ಗವೆಂದರೆ ನೀವು ಮಾಡುವುದನ್ನು ಪ್ರೀತಿಸುವುದು.\" - ಸ್ಟೀವ್ ಜಾಬ್ಸ್",
                 ]
             }
-            quote_list = quotes.get(language, quotes['en'])
-            return random.choice(quote_list)
+            quote_language = language if language in quotes else 'en'
+            return Response(random.choice(quotes[quote_language]), quote_language)
     
     def get_news(self, language="en", country="in"):
         """Get latest news headlines"""
@@ -661,16 +674,24 @@ class UtilityFeatures:
             data = response.json()
 
             if response.status_code == 200 and data.get('articles'):
-                headlines = []
-                for i, article in enumerate(data['articles'][:5], 1):
-                    headlines.append(f"{i}. {article.get('title','')}")
+                titles = [article.get('title', '') for article in data['articles'][:5]]
+                
+                # Localise all headlines in a single batched translation
+                if language != "en":
+                    try:
+                        from core.translation_engine import get_translation_engine
+                        titles = get_translation_engine().translate_many(titles, "en", language)
+                    except Exception as e:
+                        print(f"⚠️ Headline translation failed: {e}")
+                
+                headlines = [f"{i}. {title}" for i, title in enumerate(titles, 1)]
             
-                if language == "en":
-                    return "Here are the top news headlines: " + " ".join(headlines)
-                elif language == "hi":
-                    return "यहां शीर्ष समाचार हैं: " + " ".join(headlines)
+                if language == "hi":
+                    return Response("यहां शीर्ष समाचार हैं: " + " ".join(headlines), "hi")
                 elif language == "kn":
-                    return "ಇಲ್ಲಿ ಪ್ರಮುಖ ಸುದ್ದಿಗಳಿವೆ: " + " ".join(headlines)
+                    return Response("ಇಲ್ಲಿ ಪ್ರಮುಖ ಸುದ್ದಿಗಳಿವೆ: " + " ".join(headlines), "kn")
+                else:
+                    return Response("Here are the top news headlines: " + " ".join(headlines), "en")
             else:
                 return self._get_mock_news(language)
         except:
@@ -678,12 +699,7 @@ class UtilityFeatures:
 
     def _get_mock_news(self, language):
         """Return mock news when API is unavailable"""
-        if language == "en":
-            return "Unable to fetch news. Please check your internet connection."
-        elif language == "hi":
-            return "समाचार प्राप्त नहीं किया जा सका। कृपया इंटरनेट कनेक्शन जांचें।"
-        elif language == "kn":
-            return "ಸುದ್ದಿ ಪಡೆಯಲು ಸಾಧ್ಯವಾಗಲಿಲ್ಲ. ದಯವಿಟ್ಟು ಇಂಟರ್ನೆಟ್ ಸಂಪರ್ಕ ಪರಿಶೀಲಿಸಿ।"
+        return localize(self.STATIC_RESPONSES['news_unavailable'], language)
 
     def set_weather_api_key(self, api_key):
         """Set weather API key"""
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 import time
 import re
 import threading
+from concurrent.futures import TimeoutError as FuturesTimeout
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -17,6 +18,14 @@ from core.audio_handler import AudioHandler
 from core.speech_recognition import SpeechRecognizer
 from core.tts_engine import TTSEngine
 from core.command_processor import CommandProcessor
+from core.command_lexicon import CommandLexicon
+from core.multilingual_processor import MultilingualTextProcessor
+from core.emotion_analyzer import EmotionalAnalyzer
+from core.response_presynthesizer import ResponsePreSynthesizer, collect_static_responses
+from core.response import Response, localize, needs_translation, response_language
+from core.pipeline import Pipeline, UtteranceContext
+from core.script_profile import profile_text
+from core.asr_rescorer import HypothesisRescorer
 from features.app_controller import AppController
 from features.utility_features import UtilityFeatures
 from auth.profile_manager import ProfileManager
@@ -28,7 +37,7 @@ from features.email_handler import EmailHandler
 from features.whatsapp_handler import WhatsAppHandler
 from features.notes_manager import NotesManager
 from auth.face_recognition import FaceRecognition
-from config import DEFAULT_LANGUAGE
+from config import DEFAULT_LANGUAGE, CUSTOM_ACTION_REPLY_WAIT, APP_PATHS, ASR_N_BEST
 import torch
 
 # 🔒 Force GPU execution
@@ -43,108 +52,94 @@ print(f"[LYRA] 🚀 GPU Ready: {device_name}")
 # Whisper will use FP16 internally when fp16=True is passed
 
 
-# ═══════════════════════════════════════════════════════════════════════════
-# EMOTIONAL ANALYZER CLASS
-# ═══════════════════════════════════════════════════════════════════════════
-class EmotionalAnalyzer:
-    """Analyze emotional tone from text input in English, Hindi, and Kannada"""
-
-    def __init__(self):
-        self.emotion_keywords = {
-            'happy': {
-                'en': ['happy', 'great', 'awesome', 'wonderful', 'excited', 'fantastic',
-                       'excellent', 'good', 'joy', 'glad', 'amazing', 'perfect', 'love',
-                       'thrilled', 'delighted', 'cheerful', 'super', 'yay', 'woohoo'],
-                'hi': ['खुश', 'बढ़िया', 'शानदार', 'अच्छा', 'उत्साहित', 'प्रसन्न', 'मस्त',
-                       'धन्यवाद', 'अद्भुत', 'मजा', 'बहुत अच्छा', 'सुखी', 'खुशी'],
-                'kn': ['ಸಂತೋಷ', 'ಒಳ್ಳೆಯದು', 'ಅದ್ಭುತ', 'ಉತ್ತಮ', 'ಸಂತಸ', 'ಸುಖ', 'ಮೆಚ್ಚು',
-                       'ಅದ್ಬುತ', 'ಚೆನ್ನಾಗಿದೆ', 'ಖುಷಿ', 'ರೋಮಾಂಚಕ']
-            },
-            'sad': {
-                'en': ['sad', 'unhappy', 'depressed', 'down', 'upset', 'disappointed',
-                       'terrible', 'bad', 'awful', 'cry', 'miserable', 'gloomy', 'hurt',
-                       'lonely', 'pain', 'sorry', 'worried', 'stressed', 'anxious'],
-                'hi': ['दुखी', 'उदास', 'खराब', 'निराश', 'परेशान', 'बुरा', 'रोना', 'चिंता',
-                       'तकलीफ', 'दर्द', 'अकेला', 'घबराहट', 'तनाव', 'मुश्किल'],
-                'kn': ['ದುಃಖ', 'ನೊಂದ', 'ಕೆಟ್ಟದ್ದು', 'ನಿರಾಶೆ', 'ಚಿಂತೆ', 'ತೊಂದರೆ', 'ನೋವು',
-                       'ಏಕಾಂಗಿ', 'ಕಷ್ಟ', 'ಬೇಸರ']
-            },
-            'okay': {
-                'en': ['okay', 'ok', 'fine', 'alright', 'average', 'normal', 'so-so',
-                       'sure', 'yes', 'yeah', 'right', 'understood', 'got it'],
-                'hi': ['ठीक', 'ओके', 'सामान्य', 'चलेगा', 'हां', 'समझ गया', 'हो गया', 'अच्छा'],
-                'kn': ['ಸರಿ', 'ಓಕೆ', 'ಚೆನ್ನಾಗಿದೆ', 'ಸಾಮಾನ್ಯ', 'ಹೌದು', 'ಅರ್ಥವಾಯಿತು']
-            }
-        }
-
-        self.emotion_phrases = {
-            'happy': {
-                'en': ["i'm happy", "feeling great", "i feel good", "i'm excited", "this is great"],
-                'hi': ["मैं खुश हूं", "अच्छा लग रहा है", "बहुत अच्छा", "मजा आ रहा"],
-                'kn': ["ನಾನು ಸಂತೋಷವಾಗಿದ್ದೇನೆ", "ಚೆನ್ನಾಗಿ ಅನಿಸುತ್ತಿದೆ", "ತುಂಬಾ ಚೆನ್ನಾಗಿದೆ"]
-            },
-            'sad': {
-                'en': ["i'm sad", "feeling down", "not good", "i'm upset", "feeling bad"],
-                'hi': ["मैं दुखी हूं", "अच्छा नहीं लग रहा", "परेशान हूं", "उदास हूं"],
-                'kn': ["ನಾನು ದುಃಖವಾಗಿದ್ದೇನೆ", "ಒಳ್ಳೆಯದಿಲ್ಲ", "ಚಿಂತೆಯಾಗಿದೆ"]
-            },
-            'okay': {
-                'en': ["i'm okay", "it's fine", "alright", "all good"],
-                'hi': ["मैं ठीक हूं", "सब ठीक है", "चलेगा"],
-                'kn': ["ನಾನು ಸರಿಯಾಗಿದ್ದೇನೆ", "ಎಲ್ಲಾ ಚೆನ್ನಾಗಿದೆ"]
-            }
-        }
-
-    def detect_emotion(self, text):
-        """Detect emotion from text - returns: happy, sad, okay, or neutral"""
-        text_lower = text.lower().strip()
-
-        for emotion, lang_phrases in self.emotion_phrases.items():
-            for lang, phrases in lang_phrases.items():
-                for phrase in phrases:
-                    if phrase in text_lower:
-                        return emotion
-
-        emotion_scores = {'happy': 0, 'sad': 0, 'okay': 0}
-
-        for emotion, lang_keywords in self.emotion_keywords.items():
-            for lang, keywords in lang_keywords.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        emotion_scores[emotion] += 1
-
-        max_emotion = max(emotion_scores, key=emotion_scores.get)
-        if emotion_scores[max_emotion] > 0:
-            return max_emotion
-
-        return 'neutral'
-
-    def get_emotional_response(self, emotion, language='en'):
-        """Get appropriate empathetic response based on emotion"""
-        responses = {
-            'happy': {
-                'en': "That's wonderful! I'm so glad to hear that! 😊 How can I assist you today?",
-                'hi': "यह बहुत अच्छा है! मुझे यह सुनकर बहुत खुशी हुई! 😊 मैं आज आपकी कैसे मदद कर सकता हूं?",
-                'kn': "ಅದು ಅದ್ಭುತವಾಗಿದೆ! ಅದನ್ನು ಕೇಳಲು ನನಗೆ ತುಂಬಾ ಸಂತೋಷವಾಗಿದೆ! 😊 ಇಂದು ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
-            },
-            'sad': {
-                'en': "I'm sorry to hear that. 😔 I'm here for you. Is there anything I can do to help or cheer you up?",
-                'hi': "मुझे यह सुनकर दुख हुआ। 😔 मैं आपके लिए यहां हूं। क्या मैं कुछ मदद कर सकता हूं या आपको खुश कर सकता हूं?",
-                'kn': "ಅದನ್ನು ಕೇಳಲು ನನಗೆ ವಿಷಾದವಾಗಿದೆ। 😔 ನಾನು ನಿಮಗಾಗಿ ಇಲ್ಲಿದ್ದೇನೆ। ನಾನು ಏನಾದರೂ ಸಹಾಯ ಮಾಡಬಹುದೇ ಅಥವಾ ನಿಮ್ಮನ್ನು ಸಂತೋಷಪಡಿಸಬಹುದೇ?"
-            },
-            'okay': {
-                'en': "Okay, got it. 👍 What would you like me to do for you?",
-                'hi': "ठीक है, समझ गया। 👍 आप चाहते हैं कि मैं आपके लिए क्या करूं?",
-                'kn': "ಸರಿ, ಅರ್ಥವಾಯಿತು। 👍 ನಾನು ನಿಮಗಾಗಿ ಏನು ಮಾಡಬೇಕೆಂದು ಬಯಸುತ್ತೀರಿ?"
-            },
-            'neutral': {
-                'en': "I'm listening. How can I help you?",
-                'hi': "मैं सुन रहा हूं। मैं आपकी कैसे मदद कर सकता हूं?",
-                'kn': "ನಾನು ಕೇಳುತ್ತಿದ್ದೇನೆ। ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
-            }
-        }
-
-        return responses.get(emotion, responses['neutral']).get(language, responses[emotion]['en'])
+# Static replies (pre-synthesised into the TTS cache at startup)
+STATIC_RESPONSES = {
+    # Natural fallback when a command produced no reply
+    'no_response': {
+        'en': "I'm not sure how to help with that.",
+        'hi': "मुझे समझ नहीं आया।",
+        'kn': "ನನಗೆ ಅರ್ಥವಾಗಲಿಲ್ಲ।"
+    },
+    # Command processing raised an error
+    'processing_error': {
+        'en': "Sorry, I encountered an error.",
+        'hi': "क्षमा करें, कुछ गड़बड़ हो गई।",
+        'kn': "ಕ್ಷಮಿಸಿ, ದೋಷ ಸಂಭವಿಸಿದೆ।"
+    },
+    # Conversational fallbacks
+    'greeting': {
+        'en': "Hello! How can I help you today?",
+        'hi': "नमस्ते! मैं आपकी कैसे मदद कर सकता हूं?",
+        'kn': "ನಮಸ್ಕಾರ! ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
+    },
+    'capabilities': {
+        'en': "I can help with time, weather, opening apps, reminders, notes, calendar, WhatsApp, email, jokes, and more. Just ask!",
+        'hi': "मैं समय, मौसम, ऐप्स खोलने, रिमाइंडर, नोट्स, कैलेंडर, व्हाट्सएप, ईमेल, जोक्स और बहुत कुछ में मदद कर सकता हूं।",
+        'kn': "ನಾನು ಸಮಯ, ಹವಾಮಾನ, ಅಪ್ಲಿಕೇಶನ್‌ಗಳು, ಜ್ಞಾಪನೆಗಳು, ನೋಟ್‌ಗಳು, ಕ್ಯಾಲೆಂಡರ್, ವಾಟ್ಸಪ್, ಇಮೇಲ್, ಹಾಸ್ಯಗಳು ಮತ್ತು ಹೆಚ್ಚಿನದನ್ನು ಮಾಡಬಲ್ಲೆ."
+    },
+    'not_understood': {
+        'en': "I didn't quite catch that. Could you try rephrasing?",
+        'hi': "मुझे समझ नहीं आया। क्या आप दूसरे तरीके से कह सकते हैं?",
+        'kn': "ನನಗೆ ಅರ್ಥವಾಗಲಿಲ್ಲ। ದಯವಿಟ್ಟು ಮತ್ತೆ ಹೇಳಬಹುದೇ?"
+    },
+    # Follow-up prompts for commands missing an entity
+    'ask_app_open': {
+        'en': "Which app would you like me to open?",
+        'hi': "कौन सा ऐप खोलूं?",
+        'kn': "ಯಾವ ಆ್ಯಪ್ ತೆರೆಯಲಿ?"
+    },
+    'ask_app_close': {
+        'en': "Which app would you like me to close?",
+        'hi': "कौन सा ऐप बंद करूं?",
+        'kn': "ಯಾವ ಆ್ಯಪ್ ಮುಚ್ಚಲಿ?"
+    },
+    'ask_note_content': {
+        'en': "What would you like to note down?",
+        'hi': "आप क्या लिखना चाहते हैं?",
+        'kn': "ನೀವು ಏನು ಬರೆಯಲು ಬಯಸುತ್ತೀರಿ?"
+    },
+    'ask_note_search': {
+        'en': "What notes are you looking for?",
+        'hi': "आप कौन से नोट खोज रहे हैं?",
+        'kn': "ನೀವು ಯಾವ ನೋಟ್‌ಗಳನ್ನು ಹುಡುಕುತ್ತಿದ್ದೀರಿ?"
+    },
+    'ask_email_recipient': {
+        'en': "Who would you like to send an email to?",
+        'hi': "किसको ईमेल भेजना है?",
+        'kn': "ಯಾರಿಗೆ ಇಮೇಲ್ ಕಳುಹಿಸಬೇಕು?"
+    },
+    'ask_whatsapp_contact': {
+        'en': "Who would you like to send a WhatsApp message to?",
+        'hi': "किसको व्हाट्सएप भेजना है?",
+        'kn': "ಯಾರಿಗೆ ವಾಟ್ಸಪ್ ಕಳುಹಿಸಬೇಕು?"
+    },
+    'ask_pdf_file': {
+        'en': "Which PDF file would you like me to read?",
+        'hi': "कौन सी पीडीएफ फाइल पढ़ूं?",
+        'kn': "ಯಾವ ಪಿಡಿಎಫ್ ಫೈಲ್ ಓದಲಿ?"
+    },
+    # A custom command is still running in the background
+    'action_running': {
+        'en': "Working on it. I'll let you know when it's done.",
+        'hi': "काम चल रहा है। पूरा होने पर बताऊंगा।",
+        'kn': "ಕೆಲಸ ನಡೆಯುತ್ತಿದೆ। ಮುಗಿದಾಗ ತಿಳಿಸುತ್ತೇನೆ।"
+    },
+    # "Stop" / "cancel" while custom command actions were running
+    'action_cancelled': {
+        'en': "Okay, I stopped it.",
+        'hi': "ठीक है, रोक दिया।",
+        'kn': "ಸರಿ, ನಿಲ್ಲಿಸಿದೆ।"
+    }
+}
+
+# Utterances that cancel running custom command actions (otherwise "stop"
+# is an ordinary command, e.g. close_app asking which app)
+CANCEL_PHRASES = {
+    'stop', 'cancel', 'stop it', 'stop that', 'cancel it', 'cancel that',
+    'stop the action', 'cancel the action',
+    'रुको', 'रोको', 'बंद करो', 'रद्द करो',
+    'ನಿಲ್ಲಿಸು', 'ರದ್ದು ಮಾಡು', 'ರದ್ದುಮಾಡು',
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -160,15 +155,41 @@ class VoiceAssistant:
 
         # Core modules
         self.audio_handler = AudioHandler()
-        self.speech_recognizer = SpeechRecognizer()
         self.tts = TTSEngine()
+        # Replies and late custom command results may be spoken from different threads
+        self.tts_lock = threading.Lock()
+
+        # Fill the TTS cache with static replies while Whisper loads
+        self.presynthesizer = ResponsePreSynthesizer(self.tts, self._static_response_catalogue())
+        self.presynthesizer.start()
+
+        self.speech_recognizer = SpeechRecognizer()
         self.command_processor = CommandProcessor()
+        self.command_lexicon = CommandLexicon(self.command_processor, MultilingualTextProcessor())
         self.emotion_analyzer = EmotionalAnalyzer()
 
         # Feature modules
         self.app_controller = AppController()
         self.utils = UtilityFeatures()
         self.custom_commands = CustomCommandsManager(self.db)
+        # Memoised NLU results may be shadowed by new or edited custom commands
+        self.custom_commands.add_change_listener(
+            lambda: self.command_processor.invalidate_nlu_cache("custom commands changed"))
+        # Macro steps can run built-in intents (in English; the summary is localised with the reply)
+        self.custom_commands.set_intent_runner(
+            lambda intent, entities: self.route_to_feature_module(
+                {'intent': intent, 'entities': entities, 'confidence': 1.0, 'original_text': ''}, 'en'),
+            intents=self.command_processor.intents)
+
+        # Picks among Whisper's n-best transcripts by acoustic + intent-match score
+        self.asr_rescorer = HypothesisRescorer(
+            self.command_processor,
+            slot_vocabulary={'app_name': set(APP_PATHS) | set(self.app_controller.app_name_mappings)},
+            trigger_matcher=self._matches_custom_trigger)
+
+        # process_text stages (language -> emotion -> translation -> NLU -> replies)
+        self.pipeline = self._build_pipeline()
+        self.last_context = None
 
         # Features
         self.reminder_manager = ReminderManager(self.db)
@@ -191,6 +212,21 @@ class VoiceAssistant:
         if self.gui:
             self._start_gui_reminder_listener()
 
+    def _static_response_catalogue(self):
+        """Static replies from all modules, user's language first"""
+        languages = [self.current_language] + [l for l in ('en', 'hi', 'kn') if l != self.current_language]
+        return collect_static_responses(
+            STATIC_RESPONSES,
+            EmotionalAnalyzer.RESPONSES,
+            UtilityFeatures.STATIC_RESPONSES,
+            NotesManager.STATIC_RESPONSES,
+            languages=languages
+        )
+
+    def _static_response(self, key, language):
+        """Get a static reply in the given language (English fallback)"""
+        return localize(STATIC_RESPONSES[key], language)
+
     def _is_noise_or_unintended(self, text):
         """Check if text appears to be noise or unintended speech"""
         text = text.lower().strip()
@@ -328,6 +364,32 @@ class VoiceAssistant:
         
         print("[LYRA] 🛑 Audio processing loop stopped")
 
+    def _matches_custom_trigger(self, text):
+        user_id = getattr(self.profile_manager, "current_user_id", None)
+        return bool(user_id) and self.custom_commands.match_custom_command(user_id, text) is not None
+
+    def _rescore_transcript(self, audio_data, result):
+        """
+        Whisper's transcript, or a better-fitting n-best alternative
+
+        Only called for speech that passed the length/confidence/noise
+        filter, and alternatives are only decoded when the top text isn't
+        already a clean command, so noise and recognised commands pay
+        nothing extra.
+        """
+        text = result.get('text', '').strip()
+        if ASR_N_BEST <= 1 or not text or not self.asr_rescorer.needs_alternatives(text):
+            return text
+
+        hypotheses = self.speech_recognizer.n_best(audio_data, result, ASR_N_BEST)
+        best = self.asr_rescorer.pick(hypotheses)
+        if best is None:
+            return text
+        if best.text != text:
+            print(f"[LYRA] 🔁 Rescored: '{text}' → '{best.text}' "
+                  f"({best.intent}, score {best.score:.2f})")
+        return best.text.strip()
+
     def _process_audio_segment(self, audio_data):
         """Process audio with Alexa-like conversational fluency"""
         try:
@@ -363,6 +425,9 @@ class VoiceAssistant:
                 confidence > min_conf and
                 not self._is_noise_or_unintended(command_text)):
 
+                # Only speech that passed the filter is worth extra decodes
+                command_text = self._rescore_transcript(audio_data, result)
+
                 # ✅ Alexa-like flow: Quick acknowledgment
                 if self.gui:
                     self.gui.add_message_signal.emit("You", command_text)
@@ -378,30 +443,21 @@ class VoiceAssistant:
                     
                     if not response:
                         # Natural fallback responses
-                        fallbacks = {
-                            "en": "I'm not sure how to help with that.",
-                            "hi": "मुझे समझ नहीं आया।",
-                            "kn": "ನನಗೆ ಅರ್ಥವಾಗಲಿಲ್ಲ।"
-                        }
-                        response = fallbacks.get(detected_language, fallbacks["en"])
+                        response = self._static_response('no_response', detected_language)
                     
                     print(f"[LYRA] 💡 {response}")
                 except Exception as e:
                     print(f"[LYRA] ❌ {e}")
-                    errors = {
-                        "en": "Sorry, I encountered an error.",
-                        "hi": "क्षमा करें, कुछ गड़बड़ हो गई।",
-                        "kn": "ಕ್ಷಮಿಸಿ, ದೋಷ ಸಂಭವಿಸಿದೆ।"
-                    }
-                    response = errors.get(detected_language, errors["en"])
+                    response = self._static_response('processing_error', detected_language)
 
                 # Display and speak response
                 if self.gui:
                     self.gui.add_message_signal.emit("LYRA", response)
 
                 try:
-                    self.tts.set_language(detected_language)
-                    self.tts.speak(response)
+                    with self.tts_lock:
+                        self.tts.set_language(detected_language)
+                        self.tts.speak(response)
                 except Exception as tts_error:
                     print(f"[LYRA] 🔇 TTS error: {tts_error}")
 
@@ -458,115 +514,181 @@ class VoiceAssistant:
 
         print("[LYRA] 🛑 Continuous listening stopped")
 
-    def _detect_language_unicode(self, text):
-        """Detect language using Unicode ranges"""
-        text = text.strip()
-        if not text:
-            return 'en'
-
-        kannada_count = 0
-        hindi_count = 0
-        english_count = 0
-
-        for char in text:
-            code = ord(char)
-            if 0x0C80 <= code <= 0x0CFF:
-                kannada_count += 1
-            elif 0x0900 <= code <= 0x097F:
-                hindi_count += 1
-            elif ord('a') <= code <= ord('z') or ord('A') <= code <= ord('Z'):
-                english_count += 1
-
-        max_count = max(kannada_count, hindi_count, english_count)
-
-        if max_count == 0:
-            return 'en'
-        elif kannada_count == max_count:
-            return 'kn'
-        elif hindi_count == max_count:
-            return 'hi'
-        else:
-            return 'en'
+    def _build_pipeline(self):
+        """Stages of process_text, in order; each runs at most once per utterance"""
+        return Pipeline(
+            stages=[
+                ("language", self._stage_language),
+                ("emotion", self._stage_emotion),
+                ("translation", self._stage_translation),
+                ("nlu", self._stage_nlu),
+                ("emotional_reply", self._stage_emotional_reply),
+                ("custom_command", self._stage_custom_command),
+                ("route", self._stage_route),
+            ],
+            finalizers=[
+                ("localize", self._stage_localize),
+            ]
+        )
 
     def process_text(self, text, language=None):
         """Process text command"""
         user_id = getattr(self.profile_manager, "current_user_id", None)
-        lang = language or self.current_language
+        context = UtteranceContext(text, user_id=user_id, language=language or self.current_language)
 
-        original_text = text.strip()
-        detected_lang = self._detect_language_unicode(original_text)
+        self.pipeline.run(context)
+        self.last_context = context
+        print(f"⏱️ {context.timing_summary()}")
 
-        processing_text = original_text
+        return context.response
 
-        if detected_lang != 'en':
-            try:
-                from core.translation_engine import get_translation_engine
-                translator = get_translation_engine()
+    def _stage_language(self, context):
+        """Profile the script; translate short commands offline or start a network translation"""
+        context.script_profile = profile_text(context.original_text)
+        context.detected_language = context.script_profile.dominant()
+        if context.detected_language == 'en':
+            return
+
+        # Short commands are translated offline; free-form text goes to the network
+        offline_text = self.command_lexicon.translate(context.original_text, context.detected_language)
+        if offline_text:
+            context.processing_text = offline_text
+            print(f"📖 Offline lexicon: {context.detected_language} -> en")
+            return
 
-                if translator.is_available():
-                    processing_text = translator.translate_to_english(original_text, detected_lang)
-                    print(f"🔄 Translation: {detected_lang} -> en")
-                else:
-                    print(f"⚠️ Translation unavailable")
-                    processing_text = original_text
+        try:
+            from core.translation_engine import get_translation_engine
+            translator = get_translation_engine()
+            # Runs in the background while emotion detection works on the original text
+            context.translation = translator.translate_async(context.original_text, context.detected_language, 'en')
+        except Exception as e:
+            print(f"⚠️ Translation error: {e}")
 
-            except Exception as e:
-                print(f"⚠️ Translation error: {e}")
-                processing_text = original_text
-
-        emotion = self.emotion_analyzer.detect_emotion(processing_text)
-
-        if emotion != 'neutral' and len(processing_text.split()) < 15:
-            is_command = False
-
-            cmd_result = self.command_processor.process_command(processing_text)
-            if cmd_result.get('intent') and cmd_result.get('confidence', 0) > 0.6:
-                is_command = True
-
-            if not is_command:
-                response = self.emotion_analyzer.get_emotional_response(emotion, detected_lang)
-                if detected_lang != 'en':
-                    try:
-                        from core.translation_engine import get_translation_engine
-                        translator = get_translation_engine()
-                        if translator.is_available():
-                            response = translator.translate_from_english(response, detected_lang)
-                    except Exception:
-                        pass
-                return response
-
-        if self.custom_commands and user_id:
-            custom_cmd = self.custom_commands.match_custom_command(user_id, processing_text)
-            if custom_cmd:
-                success, result = self.custom_commands.execute_custom_command(custom_cmd)
-                if success and isinstance(result, str):
-                    if detected_lang != 'en':
-                        try:
-                            from core.translation_engine import get_translation_engine
-                            translator = get_translation_engine()
-                            if translator.is_available():
-                                result = translator.translate_from_english(result, detected_lang)
-                        except Exception:
-                            pass
-                    return result
-
-        cmd_result = self.command_processor.process_command(processing_text)
-        response = self.route_to_feature_module(cmd_result, detected_lang)
-
-        if detected_lang != 'en' and response:
+    def _stage_emotion(self, context):
+        """Emotion keywords exist for all three languages, so this doesn't need the translation"""
+        context.emotion = self.emotion_analyzer.detect_emotion(context.original_text)
+
+    def _stage_translation(self, context):
+        """Collect the network translation (if one was started)"""
+        if context.translation is not None:
+            from core.translation_engine import get_translation_engine
             try:
-                from core.translation_engine import get_translation_engine
-                translator = get_translation_engine()
-                if translator.is_available():
-                    response = translator.translate_from_english(response, detected_lang)
+                context.processing_text = context.translation.result(timeout=get_translation_engine().timeout)
+                print(f"🔄 Translation: {context.detected_language} -> en")
             except Exception as e:
-                print(f"⚠️ Response translation failed: {e}")
+                # Too slow or failed - carry on with the original text; a late result still warms the cache
+                print(f"⚠️ Translation unavailable: {str(e) or 'deadline exceeded'}")
+                context.processing_text = context.original_text
+
+        # Some feelings are only recognisable in the English text
+        if context.emotion == 'neutral' and context.processing_text != context.original_text:
+            context.emotion = self.emotion_analyzer.detect_emotion(context.processing_text)
 
-        if detected_lang != 'en':
-            self.tts.set_language(detected_lang)
+    def _stage_nlu(self, context):
+        context.nlu = self.command_processor.process_command(context.processing_text)
+
+    def _stage_emotional_reply(self, context):
+        """Short emotional statements that aren't commands get an empathetic reply"""
+        if context.emotion == 'neutral' or len(context.processing_text.split()) >= 15:
+            return
+        if not context.is_command:
+            context.response = self.emotion_analyzer.get_emotional_response(context.emotion, context.detected_language)
+
+    def _stage_custom_command(self, context):
+        if not (self.custom_commands and context.user_id):
+            return
+        if self._is_cancel_request(context) and self.custom_commands.cancel_action():
+            context.response = self._static_response('action_cancelled', context.detected_language)
+            return
+
+        custom_cmd = self.custom_commands.match_custom_command(context.user_id, context.processing_text)
+        if not custom_cmd:
+            return
+
+        # Runs on the action executor; quick actions still answer inline
+        future = self.custom_commands.execute_custom_command_async(custom_cmd)
+        try:
+            result = future.result(timeout=CUSTOM_ACTION_REPLY_WAIT)
+        except FuturesTimeout:
+            language = context.detected_language
+            future.add_done_callback(lambda done: self._announce_action_result(done.result(), language))
+            context.response = self._static_response('action_running', language)
+            return
+
+        # A macro reports partial failures too; other failed actions fall through to the built-in intents
+        if (result.success or custom_cmd['action_type'] == 'macro') and isinstance(result.message, str):
+            context.response = result.message
+
+    @staticmethod
+    def _is_cancel_request(context):
+        """The utterance is just "stop" / "cancel" (in any of the three languages)"""
+        return any(text.lower().strip(' .!?।') in CANCEL_PHRASES
+                   for text in (context.original_text, context.processing_text))
+
+    def _announce_action_result(self, result, language):
+        """Show and speak the result of a custom command that finished after its reply"""
+        message = self._localize_response(result.message or "Done", language)
+        print(f"[LYRA] ⚙️ {message}")
+        if self.gui:
+            self.gui.add_message_signal.emit("LYRA", message)
+        try:
+            with self.tts_lock:
+                self.tts.set_language(language)
+                self.tts.speak(message)
+        except Exception as e:
+            print(f"[LYRA] 🔇 TTS error: {e}")
+
+    def _stage_route(self, context):
+        context.response = self.route_to_feature_module(context.nlu, context.detected_language)
+
+    def _stage_localize(self, context):
+        """Reply in the language the user spoke"""
+        if context.response is not None:
+            context.response = self._localize_response(context.response, context.detected_language)
+
+        if context.detected_language != 'en':
+            self.tts.set_language(context.detected_language)
+
+    def _localize_response(self, response, language):
+        """
+        Translate a reply into the user's language
+        Replies that are already localised (Response in that language) are returned as-is
+        """
+        if not needs_translation(response, language):
+            return response
+
+        try:
+            from core.translation_engine import get_translation_engine
+            translator = get_translation_engine()
+            if translator.is_available():
+                source_lang = response_language(response)
+                translated = translator.translate(response, source_lang, language)
+                if translated != response:
+                    return Response(translated, language)
+        except Exception as e:
+            print(f"⚠️ Response translation failed: {e}")
 
         return response
 
+    def get_metrics(self):
+        """Cache hit rates across the text pipeline"""
+        metrics = dict(self.command_processor.get_metrics())
+        metrics["pipeline"] = self.pipeline.get_stats()
+        metrics["custom_actions"] = self.custom_commands.executor.get_stats()
+        metrics["asr_rescoring"] = self.asr_rescorer.get_stats()
+        lookups = self.command_lexicon.hits + self.command_lexicon.misses
+        metrics["command_lexicon"] = {
+            "hits": self.command_lexicon.hits,
+            "misses": self.command_lexicon.misses,
+            "hit_rate": self.command_lexicon.hits / lookups if lookups else 0.0,
+        }
+        try:
+            from core.translation_engine import get_translation_engine
+            metrics["translation_cache"] = get_translation_engine().get_cache_stats()
+        except Exception as e:
+            print(f"⚠️ Translation metrics unavailable: {e}")
+        return metrics
+
     def route_to_feature_module(self, cmd_result, language=None):
         """Route detected intent to appropriate feature module - COMPLETE VERSION"""
         intent = cmd_result.get('intent')
@@ -597,32 +719,24 @@ class VoiceAssistant:
             return self.utils.get_news(lang)
 
         elif intent == 'open_app':
-            app_name = entities.get('app_name', entities.get('entity_0', ''))
+            app_name = entities.get('app_name', '')
             print(f"📱 Opening app: '{app_name}'")
             if app_name:
                 success, msg = self.app_controller.open_app(app_name)
                 return msg
-            return {
-                'en': "Which app would you like me to open?",
-                'hi': "कौन सा ऐप खोलूं?",
-                'kn': "ಯಾವ ಆ್ಯಪ್ ತೆರೆಯಲಿ?"
-            }.get(lang, "Which app would you like me to open?")
+            return self._static_response('ask_app_open', lang)
 
         elif intent == 'close_app':
-            app_name = entities.get('app_name', entities.get('entity_0', ''))
+            app_name = entities.get('app_name', '')
             print(f"📱 Closing app: '{app_name}'")
             if app_name:
                 success, msg = self.app_controller.close_app(app_name)
                 return msg
-            return {
-                'en': "Which app would you like me to close?",
-                'hi': "कौन सा ऐप बंद करूं?",
-                'kn': "ಯಾವ ಆ್ಯಪ್ ಮುಚ್ಚಲಿ?"
-            }.get(lang, "Which app would you like me to close?")
+            return self._static_response('ask_app_close', lang)
 
         elif intent == 'create_reminder' and user_id:
-            task = entities.get('task') or entities.get('entity_0') or "Reminder"
-            time_text = entities.get('time') or entities.get('entity_1') or "later"
+            task = entities.get('task') or "Reminder"
+            time_text = entities.get('time') or "later"
             due_time = self.reminder_manager.parse_reminder_time(f"{task} at {time_text}")
             self.reminder_manager.create_reminder(user_id, task, due_datetime=due_time)
             
@@ -631,37 +745,29 @@ class VoiceAssistant:
                 'hi': f"रिमाइंडर सेट किया गया: {task} {due_time.strftime('%I:%M %p, %d-%b-%Y')} पर",
                 'kn': f"ಜ್ಞಾಪನೆ ಸೆಟ್ ಮಾಡಲಾಗಿದೆ: {task} {due_time.strftime('%I:%M %p, %d-%b-%Y')}"
             }
-            return responses.get(lang, responses['en'])
+            return localize(responses, lang)
 
         elif intent == 'create_note' and user_id:
-            content = entities.get('entity_0', '')
+            content = entities.get('content', '')
             if content:
                 success, msg = self.notes_manager.create_note(user_id, "Quick Note", content, language=lang)
                 return msg
-            return {
-                'en': "What would you like to note down?",
-                'hi': "आप क्या लिखना चाहते हैं?",
-                'kn': "ನೀವು ಏನು ಬರೆಯಲು ಬಯಸುತ್ತೀರಿ?"
-            }.get(lang, "What would you like to note down?")
+            return self._static_response('ask_note_content', lang)
 
         elif intent == 'search_note' and user_id:
-            search_term = entities.get('entity_0', '')
+            search_term = entities.get('query', '')
             if search_term:
                 success, msg, notes = self.notes_manager.search_notes(user_id, search_term, language=lang)
                 if success and notes:
                     # Return first few notes
                     note_titles = [note['title'] for note in notes[:3]]
                     titles_str = ', '.join(note_titles)
-                    return f"{msg}. {titles_str}"
+                    return Response(f"{msg}. {titles_str}", response_language(msg))
                 return msg
-            return {
-                'en': "What notes are you looking for?",
-                'hi': "आप कौन से नोट खोज रहे हैं?",
-                'kn': "ನೀವು ಯಾವ ನೋಟ್‌ಗಳನ್ನು ಹುಡುಕುತ್ತಿದ್ದೀರಿ?"
-            }.get(lang, "What notes are you looking for?")
+            return self._static_response('ask_note_search', lang)
 
         elif intent == 'create_event' and user_id:
-            title = entities.get('entity_0', 'Event')
+            title = entities.get('title', 'Event')
             time_str = original_text
             
             print(f"📅 Creating event: '{title}' from text: '{time_str}'")
@@ -688,78 +794,51 @@ class VoiceAssistant:
                     'hi': f"कैलेंडर खोल रहे हैं: {title}",
                     'kn': f"ಕ್ಯಾಲೆಂಡರ್ ತೆರೆಯುತ್ತಿದೆ: {title}"
                 }
-                return responses.get(lang, responses['en'])
+                return localize(responses, lang)
 
         elif intent == 'send_email':
-            recipient = entities.get('recipient', entities.get('entity_0', ''))
-            content = entities.get('content', entities.get('entity_1', ''))
+            recipient = entities.get('recipient', '')
+            content = entities.get('content', '')
             if recipient:
                 success, msg = self.email_handler.send_email(recipient, "Message from LYRA", content)
                 return msg
-            return {
-                'en': "Who would you like to send an email to?",
-                'hi': "किसको ईमेल भेजना है?",
-                'kn': "ಯಾರಿಗೆ ಇಮೇಲ್ ಕಳುಹಿಸಬೇಕು?"
-            }.get(lang, "Who would you like to send an email to?")
+            return self._static_response('ask_email_recipient', lang)
 
         elif intent == 'send_whatsapp':
-            contact = entities.get('contact', entities.get('entity_1', ''))
-            message = entities.get('message', entities.get('entity_0', 'Hello from LYRA!'))
+            contact = entities.get('contact', '')
+            message = entities.get('message', 'Hello from LYRA!')
             
             print(f"📱 WhatsApp - Contact: '{contact}', Message: '{message}'")
             
             if contact:
                 success, msg = self.whatsapp_handler.send_message(contact, message)
                 return msg
-            return {
-                'en': "Who would you like to send a WhatsApp message to?",
-                'hi': "किसको व्हाट्सएप भेजना है?",
-                'kn': "ಯಾರಿಗೆ ವಾಟ್ಸಪ್ ಕಳುಹಿಸಬೇಕು?"
-            }.get(lang, "Who would you like to send a WhatsApp message to?")
+            return self._static_response('ask_whatsapp_contact', lang)
 
         elif intent == 'read_pdf':
-            file_path = entities.get('entity_0', '')
+            file_path = entities.get('file', '')
             if file_path:
                 # Initialize PDF reader
                 from features.pdf_reader import PDFReader
                 pdf_reader = PDFReader()
                 success, content = pdf_reader.read_pdf_summary(file_path, max_chars=500, language=lang)
                 return content
-            return {
-                'en': "Which PDF file would you like me to read?",
-                'hi': "कौन सी पीडीएफ फाइल पढ़ूं?",
-                'kn': "ಯಾವ ಪಿಡಿಎಫ್ ಫೈಲ್ ಓದಲಿ?"
-            }.get(lang, "Which PDF file would you like me to read?")
+            return self._static_response('ask_pdf_file', lang)
 
         # Conversational fallback
         else:
             # Check if it's a greeting
             greetings = ['hello', 'hi', 'hey', 'namaste', 'namaskar', 'namaskara', 'hola']
             if any(g in original_text.lower() for g in greetings):
-                responses = {
-                    'en': "Hello! How can I help you today?",
-                    'hi': "नमस्ते! मैं आपकी कैसे मदद कर सकता हूं?",
-                    'kn': "ನಮಸ್ಕಾರ! ನಾನು ನಿಮಗೆ ಹೇಗೆ ಸಹಾಯ ಮಾಡಬಹುದು?"
-                }
-                return responses.get(lang, responses['en'])
+                return self._static_response('greeting', lang)
             
             # Check if asking about capabilities
             capability_words = ['what can you do', 'help', 'capabilities', 'functions', 'features']
             if any(w in original_text.lower() for w in capability_words):
-                responses = {
-                    'en': "I can help with time, weather, opening apps, reminders, notes, calendar, WhatsApp, email, jokes, and more. Just ask!",
-                    'hi': "मैं समय, मौसम, ऐप्स खोलने, रिमाइंडर, नोट्स, कैलेंडर, व्हाट्सएप, ईमेल, जोक्स और बहुत कुछ में मदद कर सकता हूं।",
-                    'kn': "ನಾನು ಸಮಯ, ಹವಾಮಾನ, ಅಪ್ಲಿಕೇಶನ್‌ಗಳು, ಜ್ಞಾಪನೆಗಳು, ನೋಟ್‌ಗಳು, ಕ್ಯಾಲೆಂಡರ್, ವಾಟ್ಸಪ್, ಇಮೇಲ್, ಹಾಸ್ಯಗಳು ಮತ್ತು ಹೆಚ್ಚಿನದನ್ನು ಮಾಡಬಲ್ಲೆ."
-                }
-                return responses.get(lang, responses['en'])
+                return self._static_response('capabilities', lang)
             
             # Default: didn't understand
-            responses = {
-                'en': "I didn't quite catch that. Could you try rephrasing?",
-                'hi': "मुझे समझ नहीं आया। क्या आप दूसरे तरीके से कह सकते हैं?",
-                'kn': "ನನಗೆ ಅರ್ಥವಾಗಲಿಲ್ಲ। ದಯವಿಟ್ಟು ಮತ್ತೆ ಹೇಳಬಹುದೇ?"
-            }
-            return responses.get(lang, responses['en'])
+            return self._static_response('not_understood', lang)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # WHISPER LOADER THREAD
@@ -828,6 +907,9 @@ def main():
     main_window = VoiceAssistantGUI(None)
     assistant = VoiceAssistant(username, profile_mgr, db, gui=main_window)
     main_window.assistant = assistant
+    app.aboutToQuit.connect(assistant.presynthesizer.stop)
+    app.aboutToQuit.connect(assistant.tts.shutdown)
+    app.aboutToQuit.connect(assistant.custom_commands.shutdown)
 
     main_window.show()
 
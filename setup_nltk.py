@@ -2,6 +2,8 @@
 """
 Setup script to download required NLTK data
 Run this once: python3 setup_nltk.py
+Only needed with NLU_TOKENIZER = 'nltk' in config.py (the default regex
+tokenizer needs no data)
 """
 
 import nltk